@@ -0,0 +1,158 @@
+from .SimpleWindow import WINDOWS, Show, GetEvents
+from .Errors import ReportError
+
+
+MIN_INTERVAL = 0.001
+
+
+# MARK: ShowAsync()
+async def ShowAsync(Name="", Frame=None, Version=None, Draw=None):
+    """
+    Display the specified window and update its content with the given frame without blocking the asyncio event loop while waiting.
+    Windows paced with "Wait" wait for their next frame deadline with asyncio.sleep(), only the last 2 ms are waited by Show() for accuracy.
+    Threaded windows only hand the frame to the presenter thread, which waits for events without using the CPU while idle.
+    Other windows are presented on the event loop thread, use PumpEvents() to keep them responsive between frames.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    Frame : numpy.ndarray, optional
+        The frame to be displayed in the window, see Show().
+    Version : int, optional
+        A version counter of the frame content, see Show().
+    Draw : DrawList, optional
+        Annotations drawn onto the frame, see Show().
+
+    Returns
+    -------
+    bool
+        The result of Show().
+    """
+    import asyncio
+    try:
+        Pacer = WINDOWS[Name].Pacer
+        if Pacer is not None and Pacer.Drop == False and Frame is not None:
+            Remaining = Pacer.Remaining() - 0.002
+            if Remaining > 0:
+                await asyncio.sleep(Remaining)
+        return Show(Name=Name, Frame=Frame, Version=Version, Draw=Draw)
+    except:
+        ReportError("ShowAsync", Name)
+        return False
+
+
+# MARK: GetEventsAsync()
+async def GetEventsAsync(Name="", Timeout=None, AsList=False):
+    """
+    Wait until the specified window received input events and get them, see GetEvents().
+    The events of windows which are not threaded are only received while PumpEvents() or Show() polls them.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    Timeout : float, optional
+        The longest time in seconds to wait for an event. If None, the wait does not time out.
+    AsList : bool
+        If True, the events are returned as a list of dicts instead of a structured array.
+
+    Returns
+    -------
+    numpy.ndarray or list of dict
+        The events, empty if none arrived before the timeout. None if an error occurred.
+    """
+    import asyncio
+    try:
+        Events = WINDOWS[Name].Events
+        Loop = asyncio.get_running_loop()
+        Ready = asyncio.Event()
+        Waiter = lambda: Loop.call_soon_threadsafe(Ready.set)
+        Events.Waiters.add(Waiter)
+        try:
+            if Events.Count == 0:
+                await asyncio.wait_for(Ready.wait(), Timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            Events.Waiters.discard(Waiter)
+        return GetEvents(Name=Name, AsList=AsList)
+    except:
+        ReportError("GetEventsAsync", Name)
+        return None
+
+
+# MARK: PumpEvents()
+async def PumpEvents(Interval=0.01):
+    """
+    Poll the events of all open windows which are not threaded until the task is cancelled.
+    Between two polls the task sleeps with asyncio.sleep() for Interval seconds or until the upcoming frame deadline of a paced window, but at least 1 ms,
+    so the event loop stays free for other tasks and idle windows use almost no CPU. Threaded windows are handled by the presenter thread.
+
+    Parameters
+    ----------
+    Interval : float
+        The longest time in seconds between two polls.
+
+    Returns
+    -------
+    None
+    """
+    import asyncio
+    while True:
+        Backends = []
+        Timeout = Interval
+        for Window in list(WINDOWS.values()):
+            if Window.Presenter is None and Window.Open == True:
+                if Window.Backend not in Backends:
+                    Backends.append(Window.Backend)
+                if Window.Pacer is not None:
+                    Remaining = Window.Pacer.Remaining()
+                    # Only an upcoming deadline shortens the sleep, a passed one means no frame is due and the window is idle.
+                    if Remaining > 0:
+                        Timeout = min(Timeout, Remaining)
+        for Backend in Backends:
+            try:
+                Backend.Poll()
+            except:
+                ReportError("PumpEvents")
+        await asyncio.sleep(max(Timeout, MIN_INTERVAL))
+
+
+# MARK: ShowFromQueue()
+async def ShowFromQueue(Name="", Queue=None, Latest=True):
+    """
+    Display the frames of an asyncio.Queue in the specified window until None is taken from the queue, the frames queued before None are still shown.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    Queue : asyncio.Queue
+        The source of the frames.
+    Latest : bool
+        If True, frames which queued up while the previous frame was shown are skipped and only the newest one is shown.
+
+    Returns
+    -------
+    None
+    """
+    Stop = False
+    while Stop == False:
+        Frame = await Queue.get()
+        Taken = 1
+        try:
+            while Latest and Queue.empty() == False:
+                Next = Queue.get_nowait()
+                Taken += 1
+                if Next is None:
+                    Stop = True
+                    break
+                Frame = Next
+            if Frame is None:
+                return
+            await ShowAsync(Name=Name, Frame=Frame)
+        finally:
+            # The frames only count as done once they were shown, so Queue.join() waits for the show.
+            for _ in range(Taken):
+                Queue.task_done()
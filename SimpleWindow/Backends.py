@@ -0,0 +1,776 @@
+from ctypes import Structure, c_int32, c_int16, c_uint32, c_int, c_void_p, sizeof, byref
+import ctypes
+import numpy
+import weakref
+import time
+import os
+
+from .Events import KEY, CHAR, MOUSEBUTTON, CURSOR, SCROLL
+
+
+glfw = None
+GLFWInitialized = False
+win32gui = None
+win32con = None
+windll = None
+GL = None
+
+
+def InitializeGLFW():
+    """
+    Import and initialize GLFW, which is only needed by the backends with native windows.
+    This is deferred until the first of these backends is created, so importing the package neither loads GLFW nor initializes the windowing system.
+    """
+    global glfw, GLFWInitialized
+    if GLFWInitialized == False:
+        import glfw
+        glfw.init()
+        GLFWInitialized = True
+
+
+def TerminateGLFW():
+    """
+    Terminate GLFW if it was initialized, destroying all remaining GLFW windows. It is initialized again by the next backend or window which needs it.
+    """
+    global GLFWInitialized
+    if GLFWInitialized:
+        glfw.terminate()
+        GLFWInitialized = False
+
+
+def ImportWin32():
+    """
+    Import the Windows only modules used by Win32Backend.
+    They are not imported at import time so that the package can be used on other platforms with HeadlessBackend.
+    """
+    global win32gui, win32con, windll
+    if win32gui is None:
+        from ctypes import windll
+        import win32gui, win32con
+        windll.gdi32.CreateDIBSection.restype = c_void_p
+        windll.gdi32.CreateDIBSection.argtypes = [c_void_p, c_void_p, ctypes.c_uint, ctypes.POINTER(c_void_p), c_void_p, ctypes.c_uint32]
+
+
+def ImportOpenGL():
+    """
+    Import PyOpenGL, which is only needed by OpenGLBackend.
+    """
+    global GL
+    if GL is None:
+        try:
+            from OpenGL import GL
+        except ImportError:
+            raise ImportError("OpenGLBackend requires PyOpenGL, install it with 'pip install SimpleWindow[opengl]'.") from None
+
+
+# MARK: WindowCache
+class WindowCache:
+    """
+    The geometry and state of a GLFW window, kept up to date by its callbacks so reading them needs no native call.
+    Size is the size of the client area, Position the screen position of its top-left corner.
+    """
+    __slots__ = ("Size", "FramebufferSize", "Position", "Minimized", "Focused", "Closing")
+
+    def __init__(self, GLFWWindow):
+        self.Size = glfw.get_window_size(GLFWWindow)
+        self.FramebufferSize = glfw.get_framebuffer_size(GLFWWindow)
+        self.Position = glfw.get_window_pos(GLFWWindow)
+        self.Minimized = glfw.get_window_attrib(GLFWWindow, glfw.ICONIFIED) == glfw.TRUE
+        self.Focused = glfw.get_window_attrib(GLFWWindow, glfw.FOCUSED) == glfw.TRUE
+        self.Closing = False
+
+
+def CreateGLFWWindow(Window):
+    """
+    Create a GLFW window for a Window, make its OpenGL context current and register its callbacks.
+    The callbacks keep Window.Cache up to date and push the input events into Window.Events.
+
+    Parameters
+    ----------
+    Window : Window
+        The window whose Size and Position are already resolved.
+
+    Returns
+    -------
+    glfw._GLFWwindow
+        The GLFW window.
+    """
+    InitializeGLFW()
+    Size = Window.Size
+    Position = Window.Position
+
+    GLFWWindow = glfw.create_window(Size[0], Size[1], Window.Name, None, None)
+    glfw.make_context_current(GLFWWindow)
+
+    if Window.Resizable == False:
+        glfw.set_window_attrib(GLFWWindow, glfw.RESIZABLE, glfw.FALSE)
+
+    if Window.TopMost:
+        glfw.set_window_attrib(GLFWWindow, glfw.FLOATING, glfw.TRUE)
+
+    glfw.set_window_pos(GLFWWindow, Position[0], Position[1])
+    glfw.set_window_refresh_callback(GLFWWindow, lambda _: Window.Invalidate())
+
+    Cache = Window.Cache = WindowCache(GLFWWindow)
+    glfw.set_window_size_callback(GLFWWindow, lambda _, Width, Height: setattr(Cache, "Size", (Width, Height)))
+    glfw.set_framebuffer_size_callback(GLFWWindow, lambda _, Width, Height: setattr(Cache, "FramebufferSize", (Width, Height)))
+    glfw.set_window_pos_callback(GLFWWindow, lambda _, X, Y: setattr(Cache, "Position", (X, Y)))
+    glfw.set_window_iconify_callback(GLFWWindow, lambda _, Iconified: setattr(Cache, "Minimized", bool(Iconified)))
+    glfw.set_window_focus_callback(GLFWWindow, lambda _, Focused: setattr(Cache, "Focused", bool(Focused)))
+    glfw.set_window_close_callback(GLFWWindow, lambda _: setattr(Cache, "Closing", True))
+
+    # Input events go into the event queue of the window, cursor positions mapped into frame coordinates with the current scaling.
+    def Cursor(_, X, Y):
+        Events = Window.Events
+        Events.CursorX, Events.CursorY = Window.Scaler.ToFrame(X, Y)
+        Events.Push(CURSOR, X=Events.CursorX, Y=Events.CursorY)
+
+    glfw.set_key_callback(GLFWWindow, lambda _, Key, Scancode, Action, Mods: Window.Events.Push(KEY, Key, Action, Mods))
+    glfw.set_char_callback(GLFWWindow, lambda _, Codepoint: Window.Events.Push(CHAR, Codepoint))
+    glfw.set_mouse_button_callback(GLFWWindow, lambda _, Button, Action, Mods: Window.Events.Push(MOUSEBUTTON, Button, Action, Mods, Window.Events.CursorX, Window.Events.CursorY))
+    glfw.set_cursor_pos_callback(GLFWWindow, Cursor)
+    glfw.set_scroll_callback(GLFWWindow, lambda _, X, Y: Window.Events.Push(SCROLL, X=X, Y=Y))
+    return GLFWWindow
+
+
+class BITMAPINFO(Structure):
+    _fields_ = [
+        ("biSize", c_int32),
+        ("biWidth", c_int32),
+        ("biHeight", c_int32),
+        ("biPlanes", c_int16),
+        ("biBitCount", c_int16),
+        ("biCompression", c_int32),
+        ("biSizeImage", c_int32),
+        ("biXPelsPerMeter", c_int32),
+        ("biYPelsPerMeter", c_int32),
+        ("biClrUsed", c_int32),
+        ("biClrImportant", c_int32)
+    ]
+
+    def __init__(self, width, height, planes=1, bpp=24):
+        self.biSize = sizeof(BITMAPINFO)
+        self.biWidth = width
+        self.biHeight = height
+        self.biPlanes = planes
+        self.biBitCount = bpp
+        self.biCompression = 0
+        self.biSizeImage = width * abs(height) * (bpp // 8)
+        self.biXPelsPerMeter = 0
+        self.biYPelsPerMeter = 0
+        self.biClrUsed = 0
+        self.biClrImportant = 0
+
+
+class GRAYBITMAPINFO(BITMAPINFO):
+    _fields_ = [
+        ("bmiColors", c_uint32 * 256)
+    ]
+
+    def __init__(self, width, height):
+        super().__init__(width, height, bpp=8)
+        self.biClrUsed = 256
+        self.bmiColors[:] = range(0, 256 * 0x010101, 0x010101)
+
+
+def BufferEnd(Frame):
+    """Get the address right after the memory owned by the array a frame is a view of, None if it cannot be determined."""
+    Base = Frame
+    while isinstance(Base.base, numpy.ndarray):
+        Base = Base.base
+    if Base.flags.c_contiguous == False and Base.flags.f_contiguous == False:
+        return None
+    return Base.ctypes.data + Base.nbytes
+
+
+class DIBSection:
+    """
+    A DIB section selected into a memory DC, the owner of the memory of a Win32Backend back buffer.
+    Arrays viewing the memory keep it as their base, so the DIB is only deleted once the last of them is gone,
+    even if the window already replaced or released its back buffer.
+    """
+    __slots__ = ("MemoryDC", "__array_interface__", "__weakref__")
+
+    def __init__(self, MemoryDC, HBITMAP, OldBitmap, Bits, Length):
+        self.MemoryDC = MemoryDC
+        self.__array_interface__ = {"data": (Bits, False), "shape": (Length,), "typestr": "|u1", "version": 3}
+        weakref.finalize(self, DIBSection.Delete, MemoryDC, HBITMAP, OldBitmap)
+
+    @staticmethod
+    def Delete(MemoryDC, HBITMAP, OldBitmap):
+        win32gui.SelectObject(MemoryDC, OldBitmap)
+        win32gui.DeleteDC(MemoryDC)
+        win32gui.DeleteObject(HBITMAP)
+
+
+# MARK: Backend
+class Backend:
+    """
+    The interface between a Window and the native windowing system.
+
+    A backend creates and destroys the native window, reads and writes its geometry and state,
+    presents prepared frames and polls the event queue.
+    Frames passed to Present() were already cropped and scaled by the Scaler of the window to the size of their viewport in the client area,
+    unless Scales is True or the window uses BlitterScaling, then they are only cropped and the backend scales them to the viewport.
+    Prepared frames are uint8 with 1 (grayscale), 3 (BGR) or 4 (BGRA) channels,
+    if NativeRGB is True, frames of windows with RGB set are passed in RGB(A) order instead.
+    If Waits is True, the backend can block in WaitEvents() until an event arrives, which the presenter thread uses instead of sleeping.
+    All methods take the Window object they operate on.
+    """
+    Scales = False
+    NativeRGB = False
+    Waits = False
+
+    def Create(self, Window):
+        """Create the native window for a Window whose Size and Position are already resolved."""
+        raise NotImplementedError
+
+    def Destroy(self, Window):
+        """Destroy the native window of a Window."""
+        raise NotImplementedError
+
+    def ShouldClose(self, Window):
+        """Check if the user requested to close the window."""
+        raise NotImplementedError
+
+    def GetSize(self, Window):
+        """Get the size (width, height) of the client area."""
+        raise NotImplementedError
+
+    def SetSize(self, Window, Size):
+        """Set the size (width, height) of the window."""
+        raise NotImplementedError
+
+    def GetPosition(self, Window):
+        """Get the screen position (x, y) of the top-left corner of the client area."""
+        raise NotImplementedError
+
+    def SetPosition(self, Window, Position):
+        """Set the position (x, y) of the window."""
+        raise NotImplementedError
+
+    def SetTitleBarColor(self, Window, Color):
+        """Set the RGB color of the title bar."""
+        pass
+
+    def SetResizable(self, Window, State):
+        """Allow or forbid resizing the window."""
+        pass
+
+    def SetTopMost(self, Window, State):
+        """Keep the window on top of other windows."""
+        pass
+
+    def SetForeground(self, Window, State):
+        """Move the window to the foreground or background."""
+        pass
+
+    def GetForeground(self, Window):
+        """Check if the window is the foreground window."""
+        return Window.Foreground
+
+    def SetMinimized(self, Window, State):
+        """Minimize or restore the window."""
+        pass
+
+    def GetMinimized(self, Window):
+        """Check if the window is minimized."""
+        return Window.Minimized
+
+    def SetIcon(self, Window, Icon):
+        """Set the icon of the window from an existing .ico file."""
+        pass
+
+    def GetHandle(self, Window):
+        """Get the native handle of the window, 0 if there is none."""
+        return 0
+
+    def Present(self, Window, Frame, Rects=None, Viewport=None):
+        """
+        Present a prepared frame in the client area.
+        Rects is a list of changed rectangles (x, y, width, height) in frame coordinates, None if the whole frame changed.
+        Backends may ignore Rects and present the whole frame.
+        Viewport is the rectangle (x, y, width, height) of the client area the frame is scaled to, the rest of the client area is cleared to black.
+        If None, the frame is presented at its own size in the top left corner, or scaled to the whole client area if Scales is True.
+        """
+        raise NotImplementedError
+
+    def CreateBackBuffer(self, Window, Size, Channels):
+        """Allocate Window.BackBuffer as an uint8 array of the shape (height, width, Channels), replacing an old back buffer."""
+        self.ReleaseBackBuffer(Window)
+        Window.BackBuffer = numpy.zeros((Size[1], Size[0], Channels), numpy.uint8)
+
+    def ReleaseBackBuffer(self, Window):
+        """Free the back buffer of a window."""
+        Window.BackBuffer = None
+
+    def PresentBackBuffer(self, Window):
+        """Present Window.BackBuffer in the client area."""
+        self.Present(Window, Window.BackBuffer)
+
+    def Poll(self):
+        """Process pending events of all windows of this backend."""
+        pass
+
+    def WaitEvents(self, Timeout):
+        """Wait up to Timeout seconds for events of the windows of this backend and process them, only available if Waits is True."""
+        raise NotImplementedError
+
+    def WakeUp(self):
+        """Make a running WaitEvents() return early, may be called from any thread."""
+        pass
+
+
+# MARK: Win32Backend
+class Win32Backend(Backend):
+    """
+    Creates the windows with GLFW and presents frames with GDI StretchDIBits. Only available on Windows.
+    """
+    Waits = True
+
+    def __init__(self):
+        InitializeGLFW()
+        ImportWin32()
+
+    def Create(self, Window):
+        GLFWWindow = CreateGLFWWindow(Window)
+        Window.GLFWWindow = GLFWWindow
+        Window.HWND = glfw.get_win32_window(GLFWWindow)
+
+        self.SetTitleBarColor(Window, Window.TitleBarColor)
+        Icon = Window.Icon.replace("\\", "/")
+        if os.path.exists(Icon) and Icon.endswith(".ico"):
+            self.SetIcon(Window, Icon)
+
+    def Destroy(self, Window):
+        try:
+            self.ReleaseBackBuffer(Window)
+            glfw.destroy_window(Window.GLFWWindow)
+        finally:
+            Window.GLFWWindow = None
+            Window.HWND = None
+            Window.Cache = None
+            Window.BitmapInfo = None
+            Window.Staging = None
+
+    def ShouldClose(self, Window):
+        return Window.Cache.Closing
+
+    def GetSize(self, Window):
+        return Window.Cache.Size
+
+    def SetSize(self, Window, Size):
+        glfw.set_window_size(Window.GLFWWindow, Size[0], Size[1])
+        Window.Cache.Size = tuple(Size)
+
+    def GetPosition(self, Window):
+        return Window.Cache.Position
+
+    def SetPosition(self, Window, Position):
+        glfw.set_window_pos(Window.GLFWWindow, Position[0], Position[1])
+        Window.Cache.Position = tuple(Position)
+
+    def SetTitleBarColor(self, Window, Color):
+        windll.dwmapi.DwmSetWindowAttribute(Window.HWND, 35, byref(c_int((max(0, min(255, round(Color[0]))) << 16) | (max(0, min(255, round(Color[1]))) << 8) | max(0, min(255, round(Color[2]))))), sizeof(c_int))
+
+    def SetResizable(self, Window, State):
+        glfw.set_window_attrib(Window.GLFWWindow, glfw.RESIZABLE, glfw.TRUE if State else glfw.FALSE)
+
+    def SetTopMost(self, Window, State):
+        glfw.set_window_attrib(Window.GLFWWindow, glfw.FLOATING, glfw.TRUE if State else glfw.FALSE)
+
+    def SetForeground(self, Window, State):
+        if State == True:
+            win32gui.SetWindowPos(Window.HWND, win32con.HWND_TOPMOST if Window.TopMost == True else win32con.HWND_TOP, 0, 0, 0, 0, win32con.SWP_NOMOVE | win32con.SWP_NOSIZE)
+        elif State == False:
+            win32gui.SetWindowPos(Window.HWND, win32con.HWND_BOTTOM, 0, 0, 0, 0, win32con.SWP_NOMOVE | win32con.SWP_NOSIZE)
+
+    def GetForeground(self, Window):
+        return Window.Cache.Focused
+
+    def SetMinimized(self, Window, State):
+        win32gui.ShowWindow(Window.HWND, win32con.SW_MINIMIZE if State else win32con.SW_RESTORE)
+
+    def GetMinimized(self, Window):
+        return Window.Cache.Minimized
+
+    def SetIcon(self, Window, Icon):
+        IconHandle = win32gui.LoadImage(None, Icon, win32con.IMAGE_ICON, 0, 0, win32con.LR_LOADFROMFILE | win32con.LR_DEFAULTSIZE)
+        win32gui.SendMessage(Window.HWND, win32con.WM_SETICON, win32con.ICON_SMALL, IconHandle)
+        win32gui.SendMessage(Window.HWND, win32con.WM_SETICON, win32con.ICON_BIG, IconHandle)
+
+    def GetHandle(self, Window):
+        return Window.HWND if Window.HWND else 0
+
+    def Present(self, Window, Frame, Rects=None, Viewport=None):
+        Width, Height = Frame.shape[1], Frame.shape[0]
+        BitCount = 8 if Frame.ndim == 2 else 8 * Frame.shape[2]
+        PixelSize = BitCount // 8
+
+        # The rows of a DIB must start at multiples of 4 bytes. A frame whose row stride satisfies this is described as a DIB
+        # as wide as its stride and only its own width is blitted, so crops of larger frames are not copied.
+        # The last row of such a DIB extends by the padding of the stride, which must still lie inside the memory of the frame,
+        # this is not the case for crops which reach the last row of their parent but not its right edge.
+        Stride = Frame.strides[0]
+        End = BufferEnd(Frame)
+        if Stride % 4 != 0 or Stride % PixelSize != 0 or End is None or Frame.ctypes.data + Height * Stride > End:
+            Staging = Window.Staging
+            PaddedWidth = (Width + 3) // 4 * 4
+            if Staging is None or Staging.shape[0] != Height or Staging.shape[1] != PaddedWidth or Staging.shape[2:] != Frame.shape[2:]:
+                Staging = Window.Staging = numpy.empty((Height, PaddedWidth) + Frame.shape[2:], numpy.uint8)
+            numpy.copyto(Staging[:, :Width], Frame)
+            Frame = Staging
+            Stride = Frame.strides[0]
+        RowPixels = Stride // PixelSize
+
+        BitmapInfo = Window.BitmapInfo
+        if BitmapInfo is None or BitmapInfo.biWidth != RowPixels or BitmapInfo.biHeight != -Height or BitmapInfo.biBitCount != BitCount:
+            BitmapInfo = Window.BitmapInfo = GRAYBITMAPINFO(RowPixels, -Height) if BitCount == 8 else BITMAPINFO(RowPixels, -Height, bpp=BitCount)
+
+        HDC = win32gui.GetDC(Window.HWND)
+        ViewX, ViewY, ViewWidth, ViewHeight = Viewport if Viewport is not None else (0, 0, Width, Height)
+        if ViewWidth != Width or ViewHeight != Height:
+            # Scaled rectangles would bleed into their neighbours with filtering, so a scaled frame is always blitted completely.
+            Rects = None
+            windll.gdi32.SetStretchBltMode(HDC, win32con.COLORONCOLOR if Window.Scaler.Interpolation == "Nearest" else win32con.HALFTONE)
+            windll.gdi32.SetBrushOrgEx(HDC, 0, 0, None)
+        if Rects is None:
+            windll.gdi32.StretchDIBits(HDC, ViewX, ViewY, ViewWidth, ViewHeight, 0, 0, Width, Height, ctypes.c_void_p(Frame.ctypes.data), byref(BitmapInfo), win32con.DIB_RGB_COLORS, win32con.SRCCOPY)
+            if Viewport is not None:
+                ClientWidth, ClientHeight = Window.Cache.Size
+                for X, Y, BorderWidth, BorderHeight in ((0, 0, ClientWidth, ViewY), (0, ViewY + ViewHeight, ClientWidth, ClientHeight - ViewY - ViewHeight), (0, ViewY, ViewX, ViewHeight), (ViewX + ViewWidth, ViewY, ClientWidth - ViewX - ViewWidth, ViewHeight)):
+                    if BorderWidth > 0 and BorderHeight > 0:
+                        windll.gdi32.PatBlt(HDC, X, Y, BorderWidth, BorderHeight, win32con.BLACKNESS)
+        else:
+            # Each rectangle is described as a DIB starting at its first row, so the source rectangle always covers all rows of the DIB.
+            RectInfo = type(BitmapInfo).from_buffer_copy(BitmapInfo)
+            for X, Y, RectWidth, RectHeight in Rects:
+                RectInfo.biHeight = -RectHeight
+                windll.gdi32.StretchDIBits(HDC, ViewX + X, ViewY + Y, RectWidth, RectHeight, X, 0, RectWidth, RectHeight, ctypes.c_void_p(Frame.ctypes.data + Y * Stride), byref(RectInfo), win32con.DIB_RGB_COLORS, win32con.SRCCOPY)
+        win32gui.ReleaseDC(Window.HWND, HDC)
+
+    def CreateBackBuffer(self, Window, Size, Channels):
+        # The back buffer is a DIB section selected into a memory DC, so presenting it is a single BitBlt without copies in Python.
+        self.ReleaseBackBuffer(Window)
+        Width, Height = Size
+        Bits = c_void_p()
+        HDC = win32gui.GetDC(Window.HWND)
+        try:
+            HBITMAP = windll.gdi32.CreateDIBSection(HDC, byref(BITMAPINFO(Width, -Height, bpp=8 * Channels)), win32con.DIB_RGB_COLORS, byref(Bits), None, 0)
+            if not HBITMAP:
+                raise MemoryError(f"Failed to create a {Width}x{Height} back buffer.")
+            MemoryDC = win32gui.CreateCompatibleDC(HDC)
+        finally:
+            win32gui.ReleaseDC(Window.HWND, HDC)
+        OldBitmap = win32gui.SelectObject(MemoryDC, HBITMAP)
+        Stride = (Width * 8 * Channels + 31) // 32 * 4
+        # The DIBSection is the base of the array, so arrays the caller still holds keep the DIB alive after a resize or Close().
+        Owner = DIBSection(MemoryDC, HBITMAP, OldBitmap, Bits.value, Stride * Height)
+        Memory = numpy.asarray(Owner)
+        Window.BackBuffer = Memory.reshape(Height, Stride)[:, :Width * Channels].reshape(Height, Width, Channels)
+        Window.BackBufferHandles = Owner
+
+    def ReleaseBackBuffer(self, Window):
+        # The DIB is deleted by the DIBSection once no array views it anymore.
+        Window.BackBuffer = None
+        Window.BackBufferHandles = None
+
+    def PresentBackBuffer(self, Window):
+        Height, Width = Window.BackBuffer.shape[:2]
+        HDC = win32gui.GetDC(Window.HWND)
+        win32gui.BitBlt(HDC, 0, 0, Width, Height, Window.BackBufferHandles.MemoryDC, 0, 0, win32con.SRCCOPY)
+        win32gui.ReleaseDC(Window.HWND, HDC)
+
+    def Poll(self):
+        glfw.poll_events()
+
+    def WaitEvents(self, Timeout):
+        glfw.wait_events_timeout(Timeout)
+
+    def WakeUp(self):
+        glfw.post_empty_event()
+
+
+# MARK: OpenGLBackend
+class OpenGLState:
+    """
+    The OpenGL objects of a window presented by OpenGLBackend.
+    """
+    __slots__ = ("Texture", "PBOs", "Index", "Layout", "Filter")
+
+    def __init__(self):
+        self.Texture = GL.glGenTextures(1)
+        self.PBOs = list(GL.glGenBuffers(2))
+        self.Index = 0
+        self.Layout = None
+        self.Filter = None
+
+
+class OpenGLBackend(Backend):
+    """
+    Creates the windows with GLFW and presents frames through their OpenGL context. Requires PyOpenGL.
+
+    Frames are uploaded into a persistent texture through two alternating pixel buffer objects,
+    so the copy into one buffer never waits for the transfer of the previous frame from the other one.
+    The scaling to the client area and the channel swizzle are done by the GPU, so frames are not resized or swapped with cv2.
+    Only the changed rectangles of a frame are uploaded, the texture keeps the rest and the whole texture is drawn.
+    Title bar color and icon are not supported by this backend.
+
+    Parameters
+    ----------
+    SwapInterval : int
+        The number of screen updates to wait for before swapping the buffers, 0 disables vsync.
+    """
+    Scales = True
+    NativeRGB = True
+    Waits = True
+
+    def __init__(self, SwapInterval=0):
+        InitializeGLFW()
+        ImportOpenGL()
+        self.SwapInterval = SwapInterval
+        self.States = {}
+
+    def Create(self, Window):
+        GLFWWindow = CreateGLFWWindow(Window)
+        glfw.swap_interval(self.SwapInterval)
+        Window.GLFWWindow = GLFWWindow
+        if hasattr(glfw, "get_win32_window"):
+            Window.HWND = glfw.get_win32_window(GLFWWindow)
+
+        State = self.States[Window.Name] = OpenGLState()
+        GL.glBindTexture(GL.GL_TEXTURE_2D, State.Texture)
+        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_WRAP_S, GL.GL_CLAMP_TO_EDGE)
+        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_WRAP_T, GL.GL_CLAMP_TO_EDGE)
+
+    def Destroy(self, Window):
+        try:
+            self.ReleaseBackBuffer(Window)
+            State = self.States.pop(Window.Name, None)
+            if State is not None:
+                glfw.make_context_current(Window.GLFWWindow)
+                GL.glDeleteTextures([State.Texture])
+                GL.glDeleteBuffers(2, State.PBOs)
+            glfw.destroy_window(Window.GLFWWindow)
+        finally:
+            Window.GLFWWindow = None
+            Window.HWND = None
+            Window.Cache = None
+
+    def ShouldClose(self, Window):
+        return Window.Cache.Closing
+
+    def GetSize(self, Window):
+        return Window.Cache.Size
+
+    def SetSize(self, Window, Size):
+        glfw.set_window_size(Window.GLFWWindow, Size[0], Size[1])
+        Window.Cache.Size = tuple(Size)
+
+    def GetPosition(self, Window):
+        return Window.Cache.Position
+
+    def SetPosition(self, Window, Position):
+        glfw.set_window_pos(Window.GLFWWindow, Position[0], Position[1])
+        Window.Cache.Position = tuple(Position)
+
+    def SetResizable(self, Window, State):
+        glfw.set_window_attrib(Window.GLFWWindow, glfw.RESIZABLE, glfw.TRUE if State else glfw.FALSE)
+
+    def SetTopMost(self, Window, State):
+        glfw.set_window_attrib(Window.GLFWWindow, glfw.FLOATING, glfw.TRUE if State else glfw.FALSE)
+
+    def SetForeground(self, Window, State):
+        if State == True:
+            glfw.focus_window(Window.GLFWWindow)
+
+    def GetForeground(self, Window):
+        return Window.Cache.Focused
+
+    def SetMinimized(self, Window, State):
+        if State:
+            glfw.iconify_window(Window.GLFWWindow)
+        else:
+            glfw.restore_window(Window.GLFWWindow)
+
+    def GetMinimized(self, Window):
+        return Window.Cache.Minimized
+
+    def GetHandle(self, Window):
+        return Window.HWND if Window.HWND else 0
+
+    def Present(self, Window, Frame, Rects=None, Viewport=None):
+        State = self.States[Window.Name]
+        glfw.make_context_current(Window.GLFWWindow)
+
+        Height, Width = Frame.shape[0], Frame.shape[1]
+        if Frame.ndim == 2:
+            Format = GL.GL_LUMINANCE
+        elif Frame.shape[2] == 4:
+            Format = GL.GL_RGBA if Window.RGB else GL.GL_BGRA
+        else:
+            Format = GL.GL_RGB if Window.RGB else GL.GL_BGR
+        GL.glBindTexture(GL.GL_TEXTURE_2D, State.Texture)
+        if State.Layout != (Width, Height, Format):
+            GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, GL.GL_RGBA8, Width, Height, 0, Format, GL.GL_UNSIGNED_BYTE, None)
+            State.Layout = (Width, Height, Format)
+            Rects = None
+        Filter = GL.GL_NEAREST if Window.Scaler.Interpolation == "Nearest" else GL.GL_LINEAR
+        if State.Filter != Filter:
+            GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, Filter)
+            GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, Filter)
+            State.Filter = Filter
+
+        # Only the changed rectangles are packed one after another into the buffer and uploaded, the texture keeps the rest of the frame.
+        if Rects is None:
+            Rects = [(0, 0, Width, Height)]
+        PixelSize = Frame.itemsize * (Frame.shape[2] if Frame.ndim == 3 else 1)
+        Offsets = []
+        Size = 0
+        for X, Y, RectWidth, RectHeight in Rects:
+            Offsets.append(Size)
+            Size += RectWidth * RectHeight * PixelSize
+        # Orphaning the buffer before mapping it lets the driver hand out fresh memory instead of waiting for the GPU.
+        GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, State.PBOs[State.Index])
+        GL.glBufferData(GL.GL_PIXEL_UNPACK_BUFFER, Size, None, GL.GL_STREAM_DRAW)
+        Pointer = GL.glMapBuffer(GL.GL_PIXEL_UNPACK_BUFFER, GL.GL_WRITE_ONLY)
+        Mapped = numpy.frombuffer((ctypes.c_ubyte * Size).from_address(Pointer), numpy.uint8)
+        for (X, Y, RectWidth, RectHeight), Offset in zip(Rects, Offsets):
+            numpy.copyto(Mapped[Offset:Offset + RectWidth * RectHeight * PixelSize].reshape((RectHeight, RectWidth) + Frame.shape[2:]), Frame[Y:Y + RectHeight, X:X + RectWidth])
+        GL.glUnmapBuffer(GL.GL_PIXEL_UNPACK_BUFFER)
+        GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, 1)
+        for (X, Y, RectWidth, RectHeight), Offset in zip(Rects, Offsets):
+            GL.glTexSubImage2D(GL.GL_TEXTURE_2D, 0, X, Y, RectWidth, RectHeight, Format, GL.GL_UNSIGNED_BYTE, ctypes.c_void_p(Offset))
+        GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, 0)
+        State.Index ^= 1
+
+        FramebufferWidth, FramebufferHeight = Window.Cache.FramebufferSize
+        if Viewport is None:
+            GL.glViewport(0, 0, FramebufferWidth, FramebufferHeight)
+        else:
+            # The viewport is given in client coordinates from the top, the framebuffer may have a different pixel density and counts from the bottom.
+            ClientWidth, ClientHeight = Window.Cache.Size
+            ScaleX, ScaleY = FramebufferWidth / max(1, ClientWidth), FramebufferHeight / max(1, ClientHeight)
+            X, Y, ViewWidth, ViewHeight = Viewport
+            GL.glViewport(0, 0, FramebufferWidth, FramebufferHeight)
+            GL.glClear(GL.GL_COLOR_BUFFER_BIT)
+            GL.glViewport(round(X * ScaleX), round(FramebufferHeight - (Y + ViewHeight) * ScaleY), round(ViewWidth * ScaleX), round(ViewHeight * ScaleY))
+        GL.glEnable(GL.GL_TEXTURE_2D)
+        GL.glBegin(GL.GL_QUADS)
+        GL.glTexCoord2f(0, 1)
+        GL.glVertex2f(-1, -1)
+        GL.glTexCoord2f(1, 1)
+        GL.glVertex2f(1, -1)
+        GL.glTexCoord2f(1, 0)
+        GL.glVertex2f(1, 1)
+        GL.glTexCoord2f(0, 0)
+        GL.glVertex2f(-1, 1)
+        GL.glEnd()
+        glfw.swap_buffers(Window.GLFWWindow)
+
+    def Poll(self):
+        glfw.poll_events()
+
+    def WaitEvents(self, Timeout):
+        glfw.wait_events_timeout(Timeout)
+
+    def WakeUp(self):
+        glfw.post_empty_event()
+
+
+# MARK: HeadlessBackend
+class HeadlessBackend(Backend):
+    """
+    Keeps the windows and their presented frames in memory without any native window, works on every platform.
+
+    Parameters
+    ----------
+    NullPresent : bool
+        If True, presented frames are only counted and not copied. This measures the pure cost of the Show() pipeline.
+    """
+
+    def __init__(self, NullPresent=False):
+        self.NullPresent = NullPresent
+        self.Frames = {}
+        self.Presented = {}
+        self.Started = {}
+        self.CloseRequested = set()
+
+    def Create(self, Window):
+        self.Frames[Window.Name] = None
+        self.Presented[Window.Name] = 0
+        self.Started[Window.Name] = time.perf_counter()
+        self.CloseRequested.discard(Window.Name)
+
+    def Destroy(self, Window):
+        self.ReleaseBackBuffer(Window)
+        self.CloseRequested.discard(Window.Name)
+
+    def ShouldClose(self, Window):
+        return Window.Name in self.CloseRequested
+
+    def GetSize(self, Window):
+        return Window.Size
+
+    def SetSize(self, Window, Size):
+        pass
+
+    def GetPosition(self, Window):
+        return Window.Position
+
+    def SetPosition(self, Window, Position):
+        pass
+
+    def Present(self, Window, Frame, Rects=None, Viewport=None):
+        if self.NullPresent == False:
+            Surface = self.Frames.get(Window.Name)
+            if Surface is None or Surface.shape != Frame.shape or Surface.dtype != Frame.dtype:
+                Surface = self.Frames[Window.Name] = numpy.empty(Frame.shape, Frame.dtype)
+                Rects = None
+            if Rects is None:
+                numpy.copyto(Surface, Frame)
+            else:
+                for X, Y, Width, Height in Rects:
+                    Surface[Y:Y + Height, X:X + Width] = Frame[Y:Y + Height, X:X + Width]
+        self.Presented[Window.Name] = self.Presented.get(Window.Name, 0) + 1
+
+    def PresentBackBuffer(self, Window):
+        if self.NullPresent == False:
+            self.Frames[Window.Name] = Window.BackBuffer
+        self.Presented[Window.Name] = self.Presented.get(Window.Name, 0) + 1
+
+    def RequestClose(self, Name):
+        """Simulate the user closing the window with the given name."""
+        self.CloseRequested.add(Name)
+
+    def GetFrame(self, Name):
+        """Get the last frame presented in the window with the given name, None if nothing was presented or NullPresent is True."""
+        return self.Frames.get(Name)
+
+    def GetThroughput(self, Name):
+        """
+        Get the presentation throughput of the window with the given name.
+
+        Returns
+        -------
+        tuple of (int, float)
+            The number of presented frames and the average frames per second since the window was created.
+        """
+        Presented = self.Presented.get(Name, 0)
+        Elapsed = time.perf_counter() - self.Started.get(Name, time.perf_counter())
+        return Presented, Presented / Elapsed if Elapsed > 0 else 0.0
+
+
+# MARK: GetDefaultBackend()
+def GetDefaultBackend():
+    """
+    Get the backend used when no backend is given, Win32Backend on Windows and HeadlessBackend everywhere else.
+
+    Returns
+    -------
+    Backend
+        A new backend instance.
+    """
+    if os.name == "nt":
+        return Win32Backend()
+    return HeadlessBackend()
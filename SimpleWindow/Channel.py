@@ -0,0 +1,234 @@
+import time
+import sys
+import os
+import numpy
+
+
+MAGIC = 0x53574348414E4E4C
+HEADER_BYTES = 4096
+MAX_SLOTS = 255
+
+# Fields of the int64 header, followed by the sequence number of every slot.
+FIELD_MAGIC, FIELD_SLOTS, FIELD_NDIM, FIELD_SHAPE, FIELD_LATEST, FIELD_READING, FIELD_CLOSED, FIELD_DTYPE, FIELD_SEQUENCES = 0, 1, 2, 3, 7, 8, 9, 10, 12
+
+
+# MARK: AttachMemory()
+def AttachMemory(Name):
+    """Attach to an existing shared memory block without handing it to the resource tracker of this process, which would unlink it on exit."""
+    from multiprocessing import shared_memory
+    try:
+        return shared_memory.SharedMemory(name=Name, track=False)
+    except TypeError:
+        Memory = shared_memory.SharedMemory(name=Name)
+        if os.name == "posix":
+            # Before Python 3.13 every attach is registered on POSIX, so the registration is undone right after attaching.
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(Memory._name, "shared_memory")
+        return Memory
+
+
+# MARK: FrameChannel
+class FrameChannel:
+    """
+    A ring of preallocated frames in shared memory, written by one producer process and shown by one consumer process.
+
+    The producer fills a slot in place with Acquire() and Publish(), or copies a frame with Write(), no frame is ever pickled.
+    The consumer claims the newest published slot with Claim() and reads it in place until Release(), see ShowFromChannel().
+    There are no locks, every slot has a sequence number which is odd while the slot is written, and the newest slot and its
+    sequence number are published together in one int64. The producer never writes the newest slot or the slot claimed by the consumer,
+    so with three or more slots it never waits. Release() reports whether the claimed slot stayed intact.
+
+    The channel can be passed to a multiprocessing.Process, the other side attaches to the same shared memory.
+
+    Parameters
+    ----------
+    Shape : tuple of int, optional
+        The shape of every frame, for example (2160, 3840, 3). Required to create a channel.
+    DType : numpy.dtype
+        The dtype of every frame.
+    Slots : int
+        The number of frames in the ring, at least 3.
+    Name : str, optional
+        The name of the shared memory block of an existing channel to attach to. If None, a new channel is created.
+    """
+    __slots__ = ("Name", "Shape", "DType", "Slots", "Owner", "Memory", "Header", "Frames", "Writing", "Claimed", "ClaimedSequence", "Shown", "Torn")
+
+    def __init__(self, Shape=None, DType=numpy.uint8, Slots=3, Name=None):
+        if Name is None:
+            from multiprocessing import shared_memory
+            if Shape is None:
+                raise ValueError("Shape is required to create a channel.")
+            if Slots < 3 or Slots > MAX_SLOTS:
+                raise ValueError(f"Slots must be between 3 and {MAX_SLOTS}, not {Slots}.")
+            if len(Shape) > FIELD_LATEST - FIELD_SHAPE:
+                raise ValueError(f"Shape must have at most {FIELD_LATEST - FIELD_SHAPE} dimensions, not {len(Shape)}.")
+            DType = numpy.dtype(DType)
+            SlotBytes = -(-int(numpy.prod(Shape)) * DType.itemsize // 64) * 64
+            self.Memory = shared_memory.SharedMemory(create=True, size=HEADER_BYTES + SlotBytes * Slots)
+            self.Owner = True
+            Header = numpy.ndarray(HEADER_BYTES // 8, numpy.int64, self.Memory.buf)
+            Header[FIELD_SLOTS] = Slots
+            Header[FIELD_NDIM] = len(Shape)
+            Header[FIELD_SHAPE:FIELD_SHAPE + len(Shape)] = Shape
+            Header[FIELD_DTYPE:FIELD_SEQUENCES] = numpy.frombuffer(DType.str.encode().ljust(16, b"\0"), numpy.int64)
+            Header[FIELD_LATEST] = 0
+            Header[FIELD_READING] = -1
+            Header[FIELD_MAGIC] = MAGIC
+        else:
+            self.Memory = AttachMemory(Name)
+            self.Owner = False
+            Header = numpy.ndarray(HEADER_BYTES // 8, numpy.int64, self.Memory.buf)
+            if Header[FIELD_MAGIC] != MAGIC:
+                self.Memory.close()
+                raise ValueError(f"The shared memory block {Name!r} is not a frame channel.")
+            Slots = int(Header[FIELD_SLOTS])
+            Shape = tuple(int(Size) for Size in Header[FIELD_SHAPE:FIELD_SHAPE + Header[FIELD_NDIM]])
+            DType = numpy.dtype(Header[FIELD_DTYPE:FIELD_SEQUENCES].tobytes().rstrip(b"\0").decode())
+            SlotBytes = -(-int(numpy.prod(Shape)) * DType.itemsize // 64) * 64
+        self.Name = self.Memory.name
+        self.Shape = tuple(Shape)
+        self.DType = DType
+        self.Slots = Slots
+        self.Header = Header
+        self.Frames = [numpy.ndarray(self.Shape, DType, self.Memory.buf, HEADER_BYTES + Slot * SlotBytes) for Slot in range(Slots)]
+        self.Writing = -1
+        self.Claimed = -1
+        self.ClaimedSequence = 0
+        self.Shown = 0
+        self.Torn = 0
+
+    def __reduce__(self):
+        return (FrameChannel, (None, None, 3, self.Name))
+
+    def __repr__(self):
+        return f"FrameChannel(Name={self.Name!r}, Shape={self.Shape!r}, DType={self.DType.str!r}, Slots={self.Slots!r})"
+
+    def Acquire(self):
+        """
+        Get a free slot to fill in place, it is shown once Publish() is called.
+
+        Returns
+        -------
+        numpy.ndarray
+            The frame of the slot, a view of the shared memory.
+        """
+        Header = self.Header
+        Latest = int(Header[FIELD_LATEST])
+        Current = Latest & MAX_SLOTS
+        Reading = int(Header[FIELD_READING])
+        Slot = (Current + 1) % self.Slots
+        while Slot == Reading or (Slot == Current and Latest != 0):
+            Slot = (Slot + 1) % self.Slots
+        Header[FIELD_SEQUENCES + Slot] = 2 * ((Latest >> 8) + 1) + 1
+        self.Writing = Slot
+        return self.Frames[Slot]
+
+    def Publish(self):
+        """
+        Publish the slot filled since Acquire() as the newest frame.
+
+        Returns
+        -------
+        int
+            The sequence number of the frame, counting from 1.
+        """
+        if self.Writing < 0:
+            raise RuntimeError("Publish() must follow Acquire().")
+        Header = self.Header
+        Sequence = (int(Header[FIELD_LATEST]) >> 8) + 1
+        Header[FIELD_SEQUENCES + self.Writing] = 2 * Sequence
+        Header[FIELD_LATEST] = (Sequence << 8) | self.Writing
+        self.Writing = -1
+        return Sequence
+
+    def Write(self, Frame):
+        """Copy a frame into a free slot and publish it, returns its sequence number."""
+        numpy.copyto(self.Acquire(), Frame, casting="unsafe")
+        return self.Publish()
+
+    def GetSequence(self):
+        """Get the sequence number of the newest published frame, 0 if none was published yet."""
+        return int(self.Header[FIELD_LATEST]) >> 8
+
+    def Wait(self, Sequence, Timeout=None, Interval=0.0005):
+        """
+        Wait until a frame newer than Sequence is published or the producer closed the channel.
+
+        Returns
+        -------
+        bool
+            True if a newer frame is available.
+        """
+        Deadline = time.perf_counter() + Timeout if Timeout is not None else None
+        while self.GetSequence() <= Sequence:
+            if self.Header[FIELD_CLOSED] != 0 or (Deadline is not None and time.perf_counter() >= Deadline):
+                return False
+            time.sleep(Interval)
+        return True
+
+    def Claim(self):
+        """
+        Claim the newest published frame, the producer does not write it until Release() is called.
+
+        Returns
+        -------
+        tuple of (int, numpy.ndarray or None)
+            The sequence number and the frame, a view of the shared memory. The frame is None if nothing was published yet.
+        """
+        Header = self.Header
+        for _ in range(self.Slots + 1):
+            Latest = int(Header[FIELD_LATEST])
+            if Latest == 0:
+                return 0, None
+            Slot, Sequence = Latest & MAX_SLOTS, Latest >> 8
+            Header[FIELD_READING] = Slot
+            # The producer may have picked the slot before the claim was visible, then its sequence number already changed.
+            if Header[FIELD_SEQUENCES + Slot] == 2 * Sequence:
+                self.Claimed = Slot
+                self.ClaimedSequence = Sequence
+                return Sequence, self.Frames[Slot]
+        Header[FIELD_READING] = -1
+        return 0, None
+
+    def Release(self):
+        """
+        Release the claimed frame.
+
+        Returns
+        -------
+        bool
+            False if the producer overwrote the frame while it was claimed, such frames are counted in Torn.
+        """
+        if self.Claimed < 0:
+            return True
+        Intact = self.Header[FIELD_SEQUENCES + self.Claimed] == 2 * self.ClaimedSequence
+        self.Header[FIELD_READING] = -1
+        self.Claimed = -1
+        if Intact == False:
+            self.Torn += 1
+        return bool(Intact)
+
+    def Close(self):
+        """Detach from the channel, the producer which created it also marks it closed and frees the shared memory."""
+        if self.Memory is None:
+            return
+        if self.Owner:
+            self.Header[FIELD_CLOSED] = 1
+        self.Header = None
+        self.Frames = []
+        try:
+            self.Memory.close()
+        except BufferError:
+            # Views of the frames are still referenced, the mapping is released once they are collected.
+            pass
+        if self.Owner:
+            if os.name == "posix" and sys.version_info < (3, 13):
+                # A consumer sharing the resource tracker of this process removed the registration in AttachMemory(), which unlink() expects.
+                from multiprocessing import resource_tracker
+                resource_tracker.register(self.Memory._name, "shared_memory")
+            self.Memory.unlink()
+        self.Memory = None
+
+    def GetClosed(self):
+        """Check if the producer closed the channel."""
+        return self.Memory is None or self.Header[FIELD_CLOSED] != 0
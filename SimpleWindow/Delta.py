@@ -0,0 +1,125 @@
+import numpy
+
+
+# MARK: ChangedTiles()
+def ChangedTiles(Frame, Previous, TileSize=64):
+    """
+    Compare two frames of the same shape tile by tile.
+
+    Parameters
+    ----------
+    Frame : numpy.ndarray
+        The new frame.
+    Previous : numpy.ndarray
+        The previous frame.
+    TileSize : int
+        The width and height of a tile in pixels, tiles at the right and bottom border may be smaller.
+
+    Returns
+    -------
+    numpy.ndarray
+        A boolean array of shape (tile rows, tile columns) which is True for every tile that changed.
+    """
+    Mask = Frame != Previous
+    if Mask.ndim == 3:
+        Mask = Mask.any(axis=2)
+    Mask = numpy.logical_or.reduceat(Mask, numpy.arange(0, Mask.shape[0], TileSize), axis=0)
+    return numpy.logical_or.reduceat(Mask, numpy.arange(0, Mask.shape[1], TileSize), axis=1)
+
+
+# MARK: TileRects()
+def TileRects(Tiles, TileSize, Size):
+    """
+    Convert changed tiles into rectangles, merging horizontally adjacent tiles of a tile row.
+
+    Parameters
+    ----------
+    Tiles : numpy.ndarray
+        The result of ChangedTiles().
+    TileSize : int
+        The tile size passed to ChangedTiles().
+    Size : tuple of (int, int)
+        The size (width, height) of the frame.
+
+    Returns
+    -------
+    list of tuple of (int, int, int, int)
+        The changed rectangles as (x, y, width, height).
+    """
+    Rects = []
+    Width, Height = Size
+    for Row in numpy.flatnonzero(Tiles.any(axis=1)):
+        Y = Row * TileSize
+        RectHeight = min(TileSize, Height - Y)
+        Padded = numpy.concatenate(([False], Tiles[Row], [False]))
+        Edges = numpy.flatnonzero(Padded[1:] != Padded[:-1])
+        for Start, End in zip(Edges[0::2], Edges[1::2]):
+            X = Start * TileSize
+            Rects.append((int(X), int(Y), int(min(End * TileSize, Width) - X), int(RectHeight)))
+    return Rects
+
+
+# MARK: Delta
+class Delta:
+    """
+    Tracks what a window presented last to skip redundant presents.
+
+    Parameters
+    ----------
+    Mode : str
+        "Identity" to skip a frame if it is the same array object with the same version as the last one.
+        "Tiles" to additionally compare the prepared frame tile by tile with the last presented one and only present the changed tiles.
+        In "Tiles" mode the identity check is only used if a version is given.
+    TileSize : int
+        The width and height of a tile in pixels.
+    """
+    __slots__ = ("Mode", "TileSize", "Frame", "Version", "Previous")
+
+    def __init__(self, Mode="Tiles", TileSize=64):
+        if Mode not in ("Identity", "Tiles"):
+            raise ValueError(f"DeltaMode must be 'Identity' or 'Tiles', not {Mode!r}.")
+        self.Mode = Mode
+        self.TileSize = TileSize
+        self.Reset()
+
+    def Reset(self):
+        """Forget the last frame so that the next one is presented completely, for example after the window content was damaged."""
+        self.Frame = None
+        self.Version = None
+        self.Previous = None
+
+    def Unchanged(self, Frame, Version=None):
+        """Check if the frame is the same array object with the same version as the last one."""
+        if self.Frame is not Frame or self.Version != Version:
+            return False
+        return self.Mode == "Identity" or Version is not None
+
+    def Remember(self, Frame, Version=None):
+        """Remember the frame and its version for the next identity check."""
+        self.Frame = Frame
+        self.Version = Version
+
+    def ChangedRects(self, Prepared):
+        """
+        Compare the prepared frame with the last presented one and remember it.
+
+        Returns
+        -------
+        list of tuple of (int, int, int, int) or None
+            The changed rectangles as (x, y, width, height), an empty list if nothing changed,
+            None if the whole frame should be presented.
+        """
+        Previous = self.Previous
+        if Previous is None or Previous.shape != Prepared.shape or Previous.dtype != Prepared.dtype:
+            self.Previous = Prepared.copy()
+            return None
+
+        Tiles = ChangedTiles(Prepared, Previous, self.TileSize)
+        if Tiles.mean() > 0.5:
+            numpy.copyto(Previous, Prepared)
+            return None
+
+        Rects = TileRects(Tiles, self.TileSize, (Prepared.shape[1], Prepared.shape[0]))
+        for X, Y, Width, Height in Rects:
+            Previous[Y:Y + Height, X:X + Width] = Prepared[Y:Y + Height, X:X + Width]
+        return Rects
@@ -0,0 +1,271 @@
+import threading
+import numpy
+
+from .Frame import ImportCV2
+
+
+# MARK: MatchColor()
+def MatchColor(Color, Channels, Swap=False):
+    """Convert a colour given in the channel order of the frames to a tuple for a prepared frame with the given number of channels."""
+    if isinstance(Color, (int, float)):
+        Color = (Color, Color, Color)
+    Color = tuple(int(Value) for Value in Color)
+    if len(Color) == 1:
+        Color = Color * 3
+    if Swap:
+        Color = Color[2::-1] + Color[3:]
+    if Channels == 1:
+        return (round(0.114 * Color[0] + 0.587 * Color[1] + 0.299 * Color[2]),)
+    if Channels == 4:
+        return Color[:3] + (Color[3] if len(Color) > 3 else 255,)
+    return Color[:3]
+
+
+# MARK: ColorKey()
+def ColorKey(Color):
+    """Make a colour hashable, so shapes of the same colour can be grouped."""
+    return Color if isinstance(Color, (int, float)) else tuple(Color)
+
+
+# MARK: Font
+class Font:
+    """
+    The glyphs of a Hershey font at one scale and thickness, rendered once with anti-aliasing into alpha masks.
+    Every mask has the rows Pad + Ascent + Descent + Pad, the baseline of the glyph is at the row Pad + Ascent and its origin at the column Pad.
+    """
+    __slots__ = ("Face", "Scale", "Thickness", "Ascent", "Descent", "Pad", "Glyphs")
+
+    def __init__(self, Face=0, Scale=0.5, Thickness=1):
+        cv2 = ImportCV2()
+        self.Face = Face
+        self.Scale = Scale
+        self.Thickness = Thickness
+        (_, self.Ascent), self.Descent = cv2.getTextSize("Hgjpqy|", Face, Scale, Thickness)
+        self.Pad = Thickness + 2
+        self.Glyphs = {}
+
+    def Glyph(self, Character):
+        """Get the alpha mask and the advance of a character, rendering it on first use."""
+        Glyph = self.Glyphs.get(Character)
+        if Glyph is None:
+            cv2 = ImportCV2()
+            (Width, _), _ = cv2.getTextSize(Character, self.Face, self.Scale, self.Thickness)
+            # The width of a single glyph includes the stroke, the advance between two glyphs does not.
+            (Double, _), _ = cv2.getTextSize(Character * 2, self.Face, self.Scale, self.Thickness)
+            Mask = numpy.zeros((2 * self.Pad + self.Ascent + self.Descent, Width + 2 * self.Pad), numpy.uint8)
+            cv2.putText(Mask, Character, (self.Pad, self.Pad + self.Ascent), self.Face, self.Scale, 255, self.Thickness, cv2.LINE_AA)
+            Glyph = self.Glyphs[Character] = Mask, Double - Width
+        return Glyph
+
+    def Render(self, Text):
+        """Compose the alpha mask of a text from the glyph masks, overlapping glyphs keep the stronger alpha."""
+        Glyphs = [self.Glyph(Character) for Character in Text]
+        Offsets, Width = [], 0
+        for Mask, Advance in Glyphs:
+            Offsets.append(Width)
+            Width += Advance
+        Width = max((Offset + Mask.shape[1] for Offset, (Mask, _) in zip(Offsets, Glyphs)), default=0)
+        Label = numpy.zeros((2 * self.Pad + self.Ascent + self.Descent, Width), numpy.uint8)
+        for Offset, (Mask, _) in zip(Offsets, Glyphs):
+            Region = Label[:, Offset:Offset + Mask.shape[1]]
+            numpy.maximum(Region, Mask, out=Region)
+        return Label
+
+
+# MARK: GlyphAtlas
+class GlyphAtlas:
+    """
+    A cache of rendered text shared by all windows.
+    Glyphs are rendered once per font, scale and thickness, see Font. Labels composed of them are kept per text, font and colours
+    premultiplied for blending, so a label which is drawn again costs a single blend of its bounding box and no rendering,
+    or a single copy if it has a background.
+    The least recently used labels are evicted once more than Capacity are cached.
+    """
+    __slots__ = ("Lock", "Fonts", "Labels", "Capacity", "Hits", "Misses")
+
+    def __init__(self, Capacity=1024):
+        self.Lock = threading.Lock()
+        self.Fonts = {}
+        self.Labels = {}
+        self.Capacity = Capacity
+        self.Hits = 0
+        self.Misses = 0
+
+    def Label(self, Text, Face, Scale, Thickness, Color, Background, Channels, Swap=False):
+        """
+        Get a rendered label for prepared frames with the given number of channels, the colours are converted with MatchColor().
+
+        Returns
+        -------
+        tuple of (numpy.ndarray, numpy.ndarray or None, int, int)
+            The pixels of the label and, without Background, the inverse alpha to blend them with,
+            and the offset (x, y) of the top left corner of the label from the origin of the text on the baseline.
+            With Background the label is opaque and its pixels are copied as they are, otherwise they are premultiplied with the alpha.
+        """
+        Key = Text, Face, Scale, Thickness, Color, Background, Channels, Swap
+        with self.Lock:
+            Label = self.Labels.pop(Key, None)
+            if Label is not None:
+                self.Labels[Key] = Label
+                self.Hits += 1
+                return Label
+            self.Misses += 1
+            FontKey = Face, Scale, Thickness
+            Glyphs = self.Fonts.get(FontKey)
+            if Glyphs is None:
+                Glyphs = self.Fonts[FontKey] = Font(Face, Scale, Thickness)
+            Alpha = Glyphs.Render(Text)
+        cv2 = ImportCV2()
+        if Channels > 1:
+            Alpha = cv2.merge([Alpha] * Channels)
+        Pixels = cv2.multiply(Alpha, MatchColor(Color, Channels, Swap), scale=1 / 255)
+        InverseAlpha = cv2.bitwise_not(Alpha)
+        if Background is not None:
+            # Blending over a known background is done once here, drawing the label is a plain copy then.
+            Pixels = cv2.add(Pixels, cv2.multiply(InverseAlpha, MatchColor(Background, Channels, Swap), scale=1 / 255))
+            InverseAlpha = None
+        Label = Pixels, InverseAlpha, -Glyphs.Pad, -Glyphs.Pad - Glyphs.Ascent
+        with self.Lock:
+            self.Labels[Key] = Label
+            while len(self.Labels) > self.Capacity:
+                del self.Labels[next(iter(self.Labels))]
+        return Label
+
+
+ATLAS = GlyphAtlas()
+
+
+# MARK: DrawList
+class DrawList:
+    """
+    A list of annotations drawn onto a frame in one pass after it was scaled and converted, see Show().
+    Positions, sizes and radii are in frame coordinates, line thickness and text scale are in window pixels, so annotations stay sharp at any window size.
+    Colours are in the channel order of the frames, like the frames converted to BGR(A) for RGB windows.
+
+    Shapes of the same kind, colour and thickness are drawn with one OpenCV call, text is blended from the labels of the glyph atlas.
+    Rectangles are drawn first, then lines, circles and text, each kind in the order it was added.
+    Threaded windows draw the list on the presenter thread, so a list passed to Show() must not be changed afterwards, use a new list for every frame.
+    """
+    __slots__ = ("Rectangles", "Lines", "Circles", "Texts")
+
+    def __init__(self):
+        self.Rectangles = {}
+        self.Lines = {}
+        self.Circles = []
+        self.Texts = []
+
+    def __len__(self):
+        return sum(1 if isinstance(Item, tuple) else Item.shape[0] for Group in (self.Rectangles, self.Lines) for Items in Group.values() for Item in Items) + len(self.Circles) + len(self.Texts)
+
+    def Clear(self):
+        """Remove all annotations."""
+        self.Rectangles = {}
+        self.Lines = {}
+        self.Circles = []
+        self.Texts = []
+
+    def Rectangle(self, X1, Y1, X2, Y2, Color=(0, 255, 0), Thickness=1):
+        """Add a rectangle between the corners (X1, Y1) and (X2, Y2), filled if Thickness is negative."""
+        self.Rectangles.setdefault((ColorKey(Color), Thickness), []).append((X1, Y1, X2, Y2))
+
+    def RectangleArray(self, Boxes, Color=(0, 255, 0), Thickness=1):
+        """Add many rectangles at once from an array of the shape (count, 4) with the corners (x1, y1, x2, y2), like the boxes of a detector."""
+        Boxes = numpy.asarray(Boxes, numpy.float64).reshape(-1, 4)
+        if Boxes.shape[0] > 0:
+            self.Rectangles.setdefault((ColorKey(Color), Thickness), []).append(Boxes)
+
+    def Line(self, X1, Y1, X2, Y2, Color=(0, 255, 0), Thickness=1):
+        """Add a line from (X1, Y1) to (X2, Y2)."""
+        self.Lines.setdefault((ColorKey(Color), Thickness), []).append((X1, Y1, X2, Y2))
+
+    def Circle(self, X, Y, Radius, Color=(0, 255, 0), Thickness=1):
+        """Add a circle around (X, Y), filled if Thickness is negative."""
+        self.Circles.append((X, Y, Radius, Color, Thickness))
+
+    def Text(self, Text, X, Y, Color=(255, 255, 255), Scale=0.5, Thickness=1, Font=0, Background=None):
+        """
+        Add a line of text with its origin (X, Y) at the left end of its baseline, like cv2.putText().
+
+        Parameters
+        ----------
+        Text : str
+            The text, characters outside of ASCII are drawn as "?" by the Hershey fonts.
+        Color : tuple of int
+            The colour of the text.
+        Scale : float
+            The font scale in window pixels, see cv2.getFontScaleFromHeight().
+        Thickness : int
+            The stroke thickness in window pixels.
+        Font : int
+            A Hershey font face of OpenCV, 0 is cv2.FONT_HERSHEY_SIMPLEX.
+        Background : tuple of int, optional
+            If given, the box behind the text is filled with this colour, such labels are copied instead of blended.
+        """
+        self.Texts.append((str(Text), X, Y, ColorKey(Color), Scale, Thickness, Font, None if Background is None else ColorKey(Background)))
+
+    def Execute(self, Frame, Crop, Swap=False):
+        """
+        Draw the annotations onto a prepared frame in place.
+
+        Parameters
+        ----------
+        Frame : numpy.ndarray
+            The prepared uint8 frame, made from the region Crop (x, y, width, height) of the source frame.
+        Crop : tuple of (int, int, int, int)
+            The region of the source frame the prepared frame shows.
+        Swap : bool
+            If True, the prepared frame was converted from RGB(A) to BGR(A), so the colours are swapped the same way.
+        """
+        cv2 = ImportCV2()
+        Height, Width = Frame.shape[:2]
+        Channels = Frame.shape[2] if Frame.ndim == 3 else 1
+        Scale = numpy.array([Width / Crop[2], Height / Crop[3]])
+        Offset = numpy.array([Crop[0], Crop[1]])
+        Corners = numpy.array([[1, 1], [-1, 1], [-1, -1], [1, -1]], numpy.int32)
+
+        for Closed, Group in ((True, self.Rectangles), (False, self.Lines)):
+            for (Color, Thickness), Items in Group.items():
+                Single = [Item for Item in Items if isinstance(Item, tuple)]
+                Points = [Item for Item in Items if isinstance(Item, tuple) == False]
+                if Single:
+                    Points.append(numpy.array(Single, numpy.float64))
+                Points = numpy.concatenate(Points).reshape(-1, 2, 2)
+                Points = numpy.rint((Points - Offset) * Scale).astype(numpy.int32)
+                if Closed:
+                    Left, Top, Right, Bottom = Points[:, 0, 0], Points[:, 0, 1], Points[:, 1, 0], Points[:, 1, 1]
+                    Points = numpy.stack((Left, Top, Right, Top, Right, Bottom, Left, Bottom), axis=1).reshape(-1, 4, 2)
+                Color = MatchColor(Color, Channels, Swap)
+                if Closed == False:
+                    cv2.polylines(Frame, Points, False, Color, max(Thickness, 1), cv2.LINE_AA)
+                elif Thickness < 0:
+                    cv2.fillPoly(Frame, Points, Color)
+                else:
+                    # Thick polylines get round caps and cost several times more, so thick rectangles are drawn as nested thin outlines.
+                    for Inset in range(-(Thickness // 2), Thickness - Thickness // 2):
+                        cv2.polylines(Frame, Points + Inset * Corners, True, Color, 1)
+
+        for X, Y, Radius, Color, Thickness in self.Circles:
+            Center = numpy.rint((numpy.array([X, Y]) - Offset) * Scale).astype(int)
+            cv2.circle(Frame, (int(Center[0]), int(Center[1])), max(round(Radius * Scale[0]), 0), MatchColor(Color, Channels, Swap), Thickness, cv2.LINE_AA)
+
+        if self.Texts:
+            Origins = numpy.rint((numpy.array([(X, Y) for _, X, Y, *_ in self.Texts], numpy.float64) - Offset) * Scale).astype(numpy.int64).tolist()
+        for (Text, _, _, Color, FontScale, Thickness, Face, Background), (X, Y) in zip(self.Texts, Origins if self.Texts else ()):
+            if Text == "":
+                continue
+            Pixels, InverseAlpha, DX, DY = ATLAS.Label(Text, Face, FontScale, Thickness, Color, Background, Channels, Swap)
+            Left, Top = X + DX, Y + DY
+            Right, Bottom = Left + Pixels.shape[1], Top + Pixels.shape[0]
+            if InverseAlpha is None and Left >= 0 and Top >= 0 and Right <= Width and Bottom <= Height:
+                Frame[Top:Bottom, Left:Right] = Pixels
+                continue
+            ClippedLeft, ClippedTop, ClippedRight, ClippedBottom = max(Left, 0), max(Top, 0), min(Right, Width), min(Bottom, Height)
+            if ClippedLeft >= ClippedRight or ClippedTop >= ClippedBottom:
+                continue
+            Region = Frame[ClippedTop:ClippedBottom, ClippedLeft:ClippedRight]
+            Rows, Columns = slice(ClippedTop - Top, ClippedBottom - Top), slice(ClippedLeft - Left, ClippedRight - Left)
+            if InverseAlpha is None:
+                Region[...] = Pixels[Rows, Columns]
+            else:
+                cv2.multiply(Region, InverseAlpha[Rows, Columns], dst=Region, scale=1 / 255)
+                cv2.add(Region, Pixels[Rows, Columns], dst=Region)
@@ -0,0 +1,142 @@
+import threading
+import logging
+import time
+import sys
+
+
+LOGGER = logging.getLogger("SimpleWindow")
+RED = "\033[91m"
+NORMAL = "\033[0m"
+
+STRICT = False
+INTERVAL = 5.0
+LASTERRORS = {}
+SITES = {}
+LOCK = threading.Lock()
+
+
+# MARK: ColorHandler
+class ColorHandler(logging.Handler):
+    """
+    The default handler of the SimpleWindow logger, prints the errors and warnings in color to stdout.
+    Remove it with logging.getLogger("SimpleWindow").removeHandler() to handle the records with your own logging configuration.
+    """
+
+    def emit(self, Record):
+        try:
+            Message = Record.getMessage()
+            if Record.exc_info:
+                Message += "\n" + logging.Formatter().formatException(Record.exc_info)
+            Type, _, Message = Message.partition("\n")
+            Message = Message.strip("\n")
+            if Message:
+                Message = f"{RED}>{NORMAL} " + Message.replace("\n", f"\n{RED}>{NORMAL} ")
+            print(f"{RED}{Type}{NORMAL}\n{Message}\n")
+        except:
+            self.handleError(Record)
+
+
+LOGGER.addHandler(ColorHandler())
+LOGGER.propagate = False
+
+
+# MARK: ReportError()
+def ReportError(Function, Name="", Raise=True):
+    """
+    Report the exception which is currently handled, must be called from an except block.
+
+    The error is remembered as the last error of the window, see GetLastError().
+    Errors are deduplicated by the function, the exception type and the line which raised it:
+    the first one is logged with its traceback, repeats are only counted and logged as a one line summary at most every INTERVAL seconds,
+    so an error which happens every frame neither floods the log nor spends the frame time on formatting tracebacks.
+    In strict mode the exception is raised again instead.
+
+    Parameters
+    ----------
+    Function : str
+        The name of the public function the error occurred in.
+    Name : str
+        The name of the window the error belongs to, "" if it belongs to no window.
+    Raise : bool
+        If False, the error is logged even in strict mode, for errors without a caller to raise them to, like those in the presenter thread.
+
+    Returns
+    -------
+    None
+    """
+    Type, Error, Traceback = sys.exc_info()
+    Now = time.time()
+    with LOCK:
+        Last = LASTERRORS.get(Name)
+        if Last is not None and Last["Function"] == Function and Last["Type"] == Type.__name__:
+            Last["Count"] += 1
+            Last["Time"] = Now
+            Last["Message"] = str(Error)
+        else:
+            LASTERRORS[Name] = {"Function": Function, "Type": Type.__name__, "Message": str(Error), "Time": Now, "Count": 1}
+    if STRICT and Raise:
+        raise
+
+    Last = Traceback
+    while Last.tb_next is not None:
+        Last = Last.tb_next
+    Key = Function, Type, Last.tb_frame.f_code.co_filename, Last.tb_lineno
+    Window = f" for window '{Name}'" if Name else ""
+    with LOCK:
+        Site = SITES.get(Key)
+        if Site is None:
+            SITES[Key] = [Now, 0]
+        elif Now - Site[0] < INTERVAL:
+            Site[1] += 1
+            return
+        else:
+            Suppressed, Elapsed = Site[1], Now - Site[0]
+            Site[0], Site[1] = Now, 0
+    if Site is None:
+        LOGGER.error("SimpleWindow - Error in function %s%s.", Function, Window, exc_info=(Type, Error, Traceback))
+    else:
+        LOGGER.error("SimpleWindow - Error in function %s%s.\n%s: %s (repeated, %d more suppressed in the last %.1f s)", Function, Window, Type.__name__, Error, Suppressed, Elapsed)
+
+
+# MARK: SetErrorReporting()
+def SetErrorReporting(Strict=False, Interval=5.0):
+    """
+    Configure how errors in the functions of this package are reported.
+    Errors are logged to the "SimpleWindow" logger, which prints them in color to stdout unless its handler is replaced.
+    Warnings about invalid arguments, which windows created with NoWarnings=True do not emit, go to the same logger with the WARNING level.
+
+    Parameters
+    ----------
+    Strict : bool
+        If True, errors are raised to the caller instead of being logged.
+    Interval : float
+        The minimum time in seconds between two log records of the same error, repeats in between are only counted.
+
+    Returns
+    -------
+    None
+    """
+    global STRICT, INTERVAL
+    STRICT = Strict == True
+    INTERVAL = Interval
+
+
+# MARK: GetLastError()
+def GetLastError(Name=""):
+    """
+    Get the last error which occurred for the specified window, also while it was logged only as a summary or suppressed.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window, "" for errors which belong to no window.
+
+    Returns
+    -------
+    dict or None
+        None if no error occurred, otherwise a dict with the keys "Function", "Type" (the exception class name), "Message",
+        "Time" (time.time() of the last occurrence) and "Count" (how often this error occurred in a row).
+    """
+    with LOCK:
+        Last = LASTERRORS.get(Name)
+        return dict(Last) if Last is not None else None
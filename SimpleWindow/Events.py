@@ -0,0 +1,94 @@
+import threading
+import time
+import numpy
+
+
+EVENT_TYPES = ("Key", "Char", "MouseButton", "Cursor", "Scroll")
+KEY, CHAR, MOUSEBUTTON, CURSOR, SCROLL = range(len(EVENT_TYPES))
+
+EVENT_DTYPE = numpy.dtype([
+    ("Time", numpy.float64),
+    ("Type", numpy.uint8),
+    ("Action", numpy.int8),
+    ("Mods", numpy.int16),
+    ("Key", numpy.int32),
+    ("X", numpy.float32),
+    ("Y", numpy.float32)
+])
+
+
+# MARK: EventQueue
+class EventQueue:
+    """
+    A preallocated ring buffer of the input events of a window, filled by the GLFW callbacks and drained with GetEvents().
+
+    Every record has the fields of EVENT_DTYPE:
+    Time is the time.perf_counter() value when the event was received, Type an index into EVENT_TYPES,
+    Key the GLFW key or mouse button or the code point of a Char event, Action the GLFW action (release, press, repeat) and Mods the GLFW modifier bits.
+    X and Y are the cursor position in frame coordinates for Cursor and MouseButton events and the scroll offsets for Scroll events.
+    If the queue is full, the oldest events are overwritten and counted in Dropped.
+
+    Parameters
+    ----------
+    Capacity : int
+        The number of events the queue holds.
+    Coalesce : bool
+        If True, a Cursor event directly following another Cursor event replaces it, so only the newest position of a mouse move is kept.
+
+    Every callable in the set Waiters is called without arguments after every pushed event, GetEventsAsync() adds one to wait for events.
+    """
+    __slots__ = ("Lock", "Records", "Start", "Count", "Dropped", "Coalesce", "CursorX", "CursorY", "Waiters")
+
+    def __init__(self, Capacity=1024, Coalesce=False):
+        self.Lock = threading.Lock()
+        self.Records = numpy.zeros(Capacity, EVENT_DTYPE)
+        self.Start = 0
+        self.Count = 0
+        self.Dropped = 0
+        self.Coalesce = Coalesce
+        self.CursorX = 0.0
+        self.CursorY = 0.0
+        self.Waiters = set()
+
+    def Configure(self, Capacity=1024, Coalesce=False):
+        """Change the capacity and the coalescing of the queue in place, keeping its waiters and the newest queued events that fit."""
+        with self.Lock:
+            Old = len(self.Records)
+            Kept = min(self.Count, Capacity)
+            Records = numpy.zeros(Capacity, EVENT_DTYPE)
+            Records[:Kept] = self.Records[(self.Start + self.Count - Kept + numpy.arange(Kept)) % Old]
+            self.Dropped += self.Count - Kept
+            self.Records = Records
+            self.Start = 0
+            self.Count = Kept
+            self.Coalesce = Coalesce
+
+    def Push(self, Type, Key=0, Action=0, Mods=0, X=0.0, Y=0.0):
+        """Append an event, overwriting the oldest one if the queue is full."""
+        Capacity = len(self.Records)
+        with self.Lock:
+            if self.Coalesce and Type == CURSOR and self.Count > 0 and self.Records[(self.Start + self.Count - 1) % Capacity]["Type"] == CURSOR:
+                Index = (self.Start + self.Count - 1) % Capacity
+            elif self.Count == Capacity:
+                Index = self.Start
+                self.Start = (self.Start + 1) % Capacity
+                self.Dropped += 1
+            else:
+                Index = (self.Start + self.Count) % Capacity
+                self.Count += 1
+            self.Records[Index] = (time.perf_counter(), Type, Action, Mods, Key, X, Y)
+        for Waiter in tuple(self.Waiters):
+            Waiter()
+
+    def Drain(self):
+        """Remove all queued events and return them as a structured array of EVENT_DTYPE, oldest first."""
+        with self.Lock:
+            End = self.Start + self.Count
+            if End <= len(self.Records):
+                Events = self.Records[self.Start:End].copy()
+            else:
+                Events = numpy.concatenate((self.Records[self.Start:], self.Records[:End - len(self.Records)]))
+            self.Start = 0
+            self.Count = 0
+            return Events
+
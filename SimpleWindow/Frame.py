@@ -0,0 +1,141 @@
+import numpy
+
+
+cv2 = None
+
+
+# MARK: ImportCV2()
+def ImportCV2():
+    """
+    Import OpenCV on first use, so importing the package does not load it.
+
+    Returns
+    -------
+    module
+        The cv2 module.
+    """
+    global cv2
+    if cv2 is None:
+        import cv2
+    return cv2
+
+
+# MARK: IsRowPacked()
+def IsRowPacked(Frame):
+    """
+    Check if the pixels of each row of a frame are packed, so that only the distance between the rows may differ from a C-contiguous frame.
+    This is true for C-contiguous frames and for crops like Frame[100:500, 200:900] of them.
+    Such frames can be described to OpenCV and to most blit APIs with a row stride and do not need to be copied.
+
+    Parameters
+    ----------
+    Frame : numpy.ndarray
+        The frame to check.
+
+    Returns
+    -------
+    bool
+        True if the rows of the frame are packed and in top-down order.
+    """
+    PixelSize = Frame.itemsize * (Frame.shape[2] if Frame.ndim == 3 else 1)
+    if Frame.strides[1] != PixelSize or (Frame.ndim == 3 and Frame.strides[2] != Frame.itemsize):
+        return False
+    return Frame.strides[0] >= Frame.shape[1] * PixelSize
+
+
+# MARK: PrepareFrame()
+def PrepareFrame(Frame, Size, Buffer=None, Interpolation=None):
+    """
+    Prepare a frame for presentation in a client area of the given size.
+    The frame is only resized if its size differs from the target size and is only copied if its rows are not packed, see IsRowPacked().
+    Both of these write into Buffer if it has the right shape and dtype, otherwise a new buffer is allocated.
+    This function does not depend on any native window and can be used and benchmarked on any platform.
+
+    Parameters
+    ----------
+    Frame : numpy.ndarray
+        The frame to prepare, as given to Show().
+    Size : tuple of (int, int)
+        The target size (width, height).
+    Buffer : numpy.ndarray, optional
+        The destination buffer from the previous call, reused if possible.
+    Interpolation : int, optional
+        The OpenCV interpolation flag used for resizing, cv2.INTER_LINEAR if None.
+
+    Returns
+    -------
+    numpy.ndarray
+        The prepared top-down frame with packed rows. This is either Frame itself, Buffer or a newly allocated array which should be passed as Buffer in the next call.
+    """
+    Width, Height = Size
+    if Frame.shape[1] == Width and Frame.shape[0] == Height:
+        if IsRowPacked(Frame):
+            return Frame
+        if Buffer is None or Buffer.shape != Frame.shape or Buffer.dtype != Frame.dtype:
+            Buffer = numpy.empty(Frame.shape, Frame.dtype)
+        numpy.copyto(Buffer, Frame)
+        return Buffer
+
+    ImportCV2()
+    Shape = (Height, Width) + Frame.shape[2:]
+    if Buffer is None or Buffer.shape != Shape or Buffer.dtype != Frame.dtype:
+        Buffer = numpy.empty(Shape, Frame.dtype)
+    cv2.resize(Frame, (Width, Height), dst=Buffer, interpolation=cv2.INTER_LINEAR if Interpolation is None else Interpolation)
+    return Buffer
+
+
+# MARK: ConvertFrame()
+def ConvertFrame(Frame, Range=None, RGB=False, Buffer=None):
+    """
+    Convert a frame into an uint8 frame which can be presented without further conversion.
+    Grayscale frames keep one channel and BGRA frames keep four channels, uint8 frames in BGR(A) order are returned as they are.
+    Other dtypes are scaled from Range to 0 - 255 with saturation in a single vectorised pass.
+
+    Parameters
+    ----------
+    Frame : numpy.ndarray
+        A frame of the shape (height, width), (height, width, 1), (height, width, 3) or (height, width, 4).
+    Range : tuple of (float, float) or str, optional
+        The input values which are mapped to 0 and 255. "Auto" uses the minimum and maximum of each frame.
+        If None, (0, 1) is used for floating point frames and the full range of the dtype for integer frames.
+        Boolean frames ignore the range, False and True are mapped to 0 and 255.
+    RGB : bool
+        If True, the channels of the frame are in RGB(A) order and are swapped to BGR(A).
+    Buffer : numpy.ndarray, optional
+        The destination buffer from the previous call, reused if possible.
+
+    Returns
+    -------
+    numpy.ndarray
+        The converted frame. This is either Frame itself, a view of it, Buffer or a newly allocated array which should be passed as Buffer in the next call.
+    """
+    if Frame.ndim == 3 and Frame.shape[2] == 1:
+        Frame = Frame[:, :, 0]
+    if Frame.ndim != 2 and (Frame.ndim != 3 or Frame.shape[2] not in (3, 4)):
+        raise ValueError(f"Frame must have the shape (height, width), (height, width, 1), (height, width, 3) or (height, width, 4), not {Frame.shape}.")
+
+    Swap = RGB and Frame.ndim == 3
+    if Frame.dtype == numpy.uint8 and Swap == False:
+        return Frame
+
+    ImportCV2()
+    if Buffer is None or Buffer.shape != Frame.shape or Buffer.dtype != numpy.uint8:
+        Buffer = numpy.empty(Frame.shape, numpy.uint8)
+
+    if Frame.dtype == numpy.bool_:
+        # Masks have no integer range, False and True are shown as 0 and 255.
+        numpy.multiply(Frame.view(numpy.uint8), 255, out=Buffer)
+        Frame = Buffer
+    elif Frame.dtype != numpy.uint8:
+        if Range is None:
+            Range = (0, 1) if Frame.dtype.kind == "f" else (numpy.iinfo(Frame.dtype).min, numpy.iinfo(Frame.dtype).max)
+        elif Range == "Auto":
+            Range = (float(Frame.min()), float(Frame.max()))
+        Low, High = float(Range[0]), float(Range[1])
+        Alpha = 255 / (High - Low) if High != Low else 0.0
+        cv2.addWeighted(Frame, Alpha, Frame, 0, -Low * Alpha, dst=Buffer, dtype=cv2.CV_8U)
+        Frame = Buffer
+
+    if Swap:
+        cv2.cvtColor(Frame, cv2.COLOR_RGB2BGR if Frame.shape[2] == 3 else cv2.COLOR_RGBA2BGRA, dst=Buffer)
+    return Buffer
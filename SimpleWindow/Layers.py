@@ -0,0 +1,190 @@
+import threading
+import numpy
+
+from .Frame import ConvertFrame, ImportCV2
+
+
+MODES = ("Alpha", "ColorKey", "Opaque")
+
+
+# MARK: Layer
+class Layer:
+    """
+    An overlay image of a window with its placement, blending and the cache of its scaled and converted pixels.
+
+    Parameters
+    ----------
+    Image : numpy.ndarray
+        The overlay in the channel order of the frames of the window, BGRA or RGBA for per pixel alpha.
+    Position : tuple of (int, int)
+        The position (x, y) of the top left corner of the overlay in frame coordinates.
+    Mode : str
+        "Alpha" to blend with the alpha channel of the image and Opacity, "ColorKey" to leave out the pixels of the colour Key,
+        "Opaque" to cover the frame with the image.
+    Key : tuple of int
+        The transparent colour of the "ColorKey" mode, in the channel order of the image.
+    Opacity : float
+        A factor from 0 to 1 applied to the alpha of the "Alpha" mode.
+    Order : int
+        Layers with a higher order are drawn on top of layers with a lower order, layers of the same order in the order they were added.
+    Version : hashable
+        The version of the content, the cached pixels are reused while the version, the layout and the image object stay the same.
+    """
+    __slots__ = ("Image", "Position", "Mode", "Key", "Opacity", "Order", "Version", "Visible", "CacheKey", "Rect", "Color", "InverseAlpha", "Mask")
+
+    def __init__(self, Image, Position=(0, 0), Mode="Alpha", Key=(0, 0, 0), Opacity=1.0, Order=0, Version=None, Visible=True):
+        if Mode not in MODES:
+            raise ValueError(f"Mode must be one of {MODES}, not {Mode!r}.")
+        self.Image = Image
+        self.Position = Position
+        self.Mode = Mode
+        self.Key = Key
+        self.Opacity = Opacity
+        self.Order = Order
+        self.Version = Version
+        self.Visible = Visible
+        self.CacheKey = None
+        self.Rect = (0, 0, 0, 0)
+        self.Color = None
+        self.InverseAlpha = None
+        self.Mask = None
+
+    def Prepare(self, Crop, Size, Channels, Swap):
+        """
+        Scale and convert the overlay for frames prepared from the region Crop of the source frame to the given size, unless the cache is still valid.
+        Afterwards Rect is the clipped rectangle (left, top, right, bottom) the overlay covers in the prepared frame and
+        Color holds its pixels, premultiplied with InverseAlpha = 255 - alpha for blending, or with Mask for colour keying.
+        """
+        Key = id(self.Image), Crop, Size, Channels, Swap
+        if Key == self.CacheKey:
+            return
+        self.CacheKey = Key
+        self.Color = self.InverseAlpha = self.Mask = None
+        cv2 = ImportCV2()
+        Image = self.Image if isinstance(self.Image, numpy.ndarray) else numpy.asarray(self.Image)
+        if Image.ndim == 3 and Image.shape[2] == 1:
+            Image = Image[:, :, 0]
+
+        ScaleX, ScaleY = Size[0] / Crop[2], Size[1] / Crop[3]
+        Left, Top = round((self.Position[0] - Crop[0]) * ScaleX), round((self.Position[1] - Crop[1]) * ScaleY)
+        Right, Bottom = round((self.Position[0] + Image.shape[1] - Crop[0]) * ScaleX), round((self.Position[1] + Image.shape[0] - Crop[1]) * ScaleY)
+        self.Rect = max(Left, 0), max(Top, 0), min(Right, Size[0]), min(Bottom, Size[1])
+        if self.Rect[0] >= self.Rect[2] or self.Rect[1] >= self.Rect[3]:
+            return
+
+        if (Right - Left, Bottom - Top) != (Image.shape[1], Image.shape[0]):
+            # Keyed colours must survive scaling exactly, so colour keyed overlays are scaled without interpolation.
+            Interpolation = cv2.INTER_NEAREST if self.Mode == "ColorKey" else cv2.INTER_AREA if Right - Left < Image.shape[1] else cv2.INTER_LINEAR
+            Image = cv2.resize(Image, (Right - Left, Bottom - Top), interpolation=Interpolation)
+        Image = Image[self.Rect[1] - Top:self.Rect[3] - Top, self.Rect[0] - Left:self.Rect[2] - Left]
+
+        Alpha = None
+        if self.Mode == "ColorKey":
+            Key = numpy.ravel(numpy.asarray(self.Key, Image.dtype))
+            if Image.ndim == 3:
+                Mask = numpy.any(Image[:, :, :len(Key)] != Key, axis=2)
+            else:
+                Mask = Image != Key[0]
+            self.Mask = Mask.view(numpy.uint8)
+        if Image.ndim == 3 and Image.shape[2] == 4:
+            if self.Mode == "Alpha":
+                Alpha = ConvertFrame(numpy.ascontiguousarray(Image[:, :, 3]))
+            Image = Image[:, :, :3]
+        Color = ConvertFrame(numpy.ascontiguousarray(Image), RGB=Swap)
+        if Channels == 1 and Color.ndim == 3:
+            Color = cv2.cvtColor(Color, cv2.COLOR_BGR2GRAY)
+        elif Channels > 1 and Color.ndim == 2:
+            Color = cv2.cvtColor(Color, cv2.COLOR_GRAY2BGR)
+        if Channels == 4:
+            Color = numpy.dstack((Color, numpy.full(Color.shape[:2], 255, numpy.uint8)))
+
+        if self.Mode == "Alpha" and (Alpha is not None or self.Opacity < 1):
+            if Alpha is None:
+                Alpha = numpy.full(Color.shape[:2], 255, numpy.uint8)
+            if self.Opacity < 1:
+                Alpha = cv2.convertScaleAbs(Alpha, alpha=max(self.Opacity, 0.0))
+            if Channels > 1:
+                Alpha = cv2.merge([Alpha] * Channels)
+            Color = cv2.multiply(Color, Alpha, scale=1 / 255)
+            self.InverseAlpha = cv2.bitwise_not(Alpha)
+        self.Color = Color
+
+    def Draw(self, Frame):
+        """Draw the prepared overlay onto the frame in place, touching only its rectangle."""
+        Left, Top, Right, Bottom = self.Rect
+        if self.Color is None or Left >= Right or Top >= Bottom:
+            return
+        Region = Frame[Top:Bottom, Left:Right]
+        if self.InverseAlpha is not None:
+            cv2 = ImportCV2()
+            cv2.multiply(Region, self.InverseAlpha, dst=Region, scale=1 / 255)
+            cv2.add(Region, self.Color, dst=Region)
+        elif self.Mask is not None:
+            ImportCV2().copyTo(self.Color, self.Mask, Region)
+        else:
+            Region[...] = self.Color
+
+
+# MARK: Layers
+class Layers:
+    """
+    The overlay layers of a window, composited onto every presented frame after it was scaled and converted, see SetLayer().
+    Each layer is scaled and converted once per content version and layout and then only blended over its bounding box.
+    Dirty is set whenever a layer changes, so a frame which is otherwise unchanged is still presented.
+    """
+    __slots__ = ("Lock", "Items", "Dirty")
+
+    def __init__(self):
+        self.Lock = threading.Lock()
+        self.Items = {}
+        self.Dirty = False
+
+    def Set(self, Name, Image=None, Position=(0, 0), Mode="Alpha", Key=(0, 0, 0), Opacity=1.0, Order=0, Version=None, Visible=True):
+        """Add or replace a layer, the cache of an existing layer is kept if its image object and version did not change."""
+        with self.Lock:
+            Old = self.Items.get(Name)
+            if Image is None:
+                if Old is None:
+                    raise ValueError(f"The layer {Name!r} does not exist yet, an image is required.")
+                Image = Old.Image
+            New = Layer(Image, Position, Mode, Key, Opacity, Order, Version, Visible)
+            if Old is not None and Old.Image is Image and Version is not None and Old.Version == Version and (Old.Position, Old.Mode, Old.Key, Old.Opacity) == (Position, Mode, Key, Opacity):
+                if (Old.Order, Old.Visible) == (Order, Visible):
+                    return
+                New.CacheKey, New.Rect, New.Color, New.InverseAlpha, New.Mask = Old.CacheKey, Old.Rect, Old.Color, Old.InverseAlpha, Old.Mask
+            # Replacing the object keeps a frame which is composited on another thread consistent.
+            Items = dict(self.Items)
+            Items[Name] = New
+            self.Items = dict(sorted(Items.items(), key=lambda Item: Item[1].Order))
+            self.Dirty = True
+
+    def Remove(self, Name=None):
+        """Remove a layer, or all layers if Name is None."""
+        with self.Lock:
+            if Name is None:
+                self.Items = {}
+            else:
+                Items = dict(self.Items)
+                del Items[Name]
+                self.Items = Items
+            self.Dirty = True
+
+    def Composite(self, Frame, Crop, Swap=False):
+        """
+        Draw the visible layers onto a prepared frame in place.
+
+        Parameters
+        ----------
+        Frame : numpy.ndarray
+            The prepared uint8 frame, made from the region Crop (x, y, width, height) of the source frame.
+        Crop : tuple of (int, int, int, int)
+            The region of the source frame the prepared frame shows.
+        Swap : bool
+            If True, the prepared frame was converted from RGB(A) to BGR(A), so the layers are converted the same way.
+        """
+        self.Dirty = False
+        Size, Channels = (Frame.shape[1], Frame.shape[0]), Frame.shape[2] if Frame.ndim == 3 else 1
+        for Item in self.Items.values():
+            if Item.Visible:
+                Item.Prepare(Crop, Size, Channels, Swap)
+                Item.Draw(Frame)
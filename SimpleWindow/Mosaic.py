@@ -0,0 +1,181 @@
+import threading
+import numpy
+
+from .Frame import ConvertFrame, ImportCV2
+from .Scaling import SCALINGS, INTERPOLATIONS, ScaleLayout, HalveFrame
+from .Drawing import MatchColor
+
+
+# Conversion codes from the channels of a stream to the channels of the canvas, (source channels, canvas channels, RGB): code name.
+CONVERSIONS = {
+    (1, 3, False): "COLOR_GRAY2BGR", (1, 4, False): "COLOR_GRAY2BGRA", (3, 1, False): "COLOR_BGR2GRAY",
+    (3, 4, False): "COLOR_BGR2BGRA", (4, 1, False): "COLOR_BGRA2GRAY", (4, 3, False): "COLOR_BGRA2BGR",
+    (1, 3, True): "COLOR_GRAY2RGB", (1, 4, True): "COLOR_GRAY2RGBA", (3, 1, True): "COLOR_RGB2GRAY",
+    (3, 4, True): "COLOR_RGB2RGBA", (4, 1, True): "COLOR_RGBA2GRAY", (4, 3, True): "COLOR_RGBA2RGB"
+}
+
+
+# MARK: Mosaic
+class Mosaic:
+    """
+    A preallocated canvas divided into a grid of tiles, each showing one stream, see SetMosaic() and ShowTile().
+
+    Every stream is cropped and resized straight into its tile of the canvas, so a tile costs one resize and no intermediate copy.
+    The canvas is presented like a frame, but only the tiles which changed since the last present are handed to the backend.
+    Tiles are numbered row by row from the top left, the canvas keeps the channel order of the frames of the window.
+
+    Parameters
+    ----------
+    Grid : tuple of (int, int)
+        The number of tile columns and rows.
+    TileSize : tuple of (int, int)
+        The size (width, height) of a tile in pixels.
+    Gap : int
+        The space between neighbouring tiles in pixels.
+    Background : tuple of int
+        The colour of the gaps, of empty tiles and of the borders around streams with another aspect ratio.
+    Channels : int
+        The channels of the canvas, 1, 3 or 4. Streams with other channels are converted.
+    Scaling : str
+        How a stream is fitted into its tile, see ScaleLayout().
+    Interpolation : str
+        "Nearest", "Linear" or "Area".
+    RGB : bool
+        If True, the frames of the window are in RGB(A) order, which matters for the conversion to grayscale.
+    """
+    __slots__ = ("Lock", "Grid", "TileSize", "Gap", "Background", "Scaling", "Interpolation", "RGB", "Canvas", "Layouts", "Pyramids", "Scratch", "Dirty", "Full")
+
+    def __init__(self, Grid=(4, 4), TileSize=(320, 180), Gap=0, Background=(0, 0, 0), Channels=3, Scaling="Fit", Interpolation="Linear", RGB=False):
+        if Scaling not in SCALINGS:
+            raise ValueError(f"Scaling must be one of {SCALINGS}, not {Scaling!r}.")
+        if Interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Interpolation must be one of {tuple(INTERPOLATIONS)}, not {Interpolation!r}.")
+        if Channels not in (1, 3, 4):
+            raise ValueError(f"Channels must be 1, 3 or 4, not {Channels!r}.")
+        Columns, Rows = Grid
+        self.Lock = threading.Lock()
+        self.Grid = (Columns, Rows)
+        self.TileSize = tuple(TileSize)
+        self.Gap = Gap
+        self.Background = MatchColor(Background, Channels)
+        self.Scaling = Scaling
+        self.Interpolation = Interpolation
+        self.RGB = RGB
+        Width, Height = Columns * TileSize[0] + (Columns - 1) * Gap, Rows * TileSize[1] + (Rows - 1) * Gap
+        self.Canvas = numpy.empty((Height, Width, Channels) if Channels > 1 else (Height, Width), numpy.uint8)
+        self.Canvas[...] = self.Background
+        self.Layouts = [None] * (Columns * Rows)
+        self.Pyramids = [[] for _ in range(Columns * Rows)]
+        self.Scratch = [None] * (Columns * Rows)
+        self.Dirty = set()
+        self.Full = True
+
+    def TileRect(self, Index):
+        """Get the rectangle (x, y, width, height) of a tile in the canvas."""
+        Column, Row = Index % self.Grid[0], Index // self.Grid[0]
+        return Column * (self.TileSize[0] + self.Gap), Row * (self.TileSize[1] + self.Gap), self.TileSize[0], self.TileSize[1]
+
+    def Put(self, Index, Frame=None, Range=None):
+        """
+        Resize a frame into its tile and mark the tile as changed.
+
+        Parameters
+        ----------
+        Index : int
+            The index of the tile.
+        Frame : numpy.ndarray, optional
+            The frame of the stream, see Show(). If None, the tile is cleared.
+        Range : tuple of (float, float) or str, optional
+            The input range of frames which are not uint8, see ConvertFrame().
+        """
+        if Index < 0 or Index >= len(self.Layouts):
+            raise IndexError(f"The tile index {Index} is outside of the {self.Grid[0]}x{self.Grid[1]} grid.")
+        Left, Top, Width, Height = self.TileRect(Index)
+        if Frame is None:
+            with self.Lock:
+                self.Canvas[Top:Top + Height, Left:Left + Width] = self.Background
+                self.Layouts[Index] = None
+                self.Dirty.add(Index)
+            return
+
+        cv2 = ImportCV2()
+        Source = Frame if isinstance(Frame, numpy.ndarray) else numpy.asarray(Frame)
+        Source = ConvertFrame(Source, Range)
+        Layout = ScaleLayout((Source.shape[1], Source.shape[0]), (Width, Height), self.Scaling)
+        (CropX, CropY, CropWidth, CropHeight), (ViewX, ViewY, ViewWidth, ViewHeight) = Layout
+        if (CropWidth, CropHeight) != (Source.shape[1], Source.shape[0]):
+            Source = Source[CropY:CropY + CropHeight, CropX:CropX + CropWidth]
+        if self.Interpolation == "Area":
+            Source = HalveFrame(Source, (ViewWidth, ViewHeight), self.Pyramids[Index])
+        Interpolation = getattr(cv2, INTERPOLATIONS[self.Interpolation])
+        SourceChannels = Source.shape[2] if Source.ndim == 3 else 1
+        Channels = self.Canvas.shape[2] if self.Canvas.ndim == 3 else 1
+
+        with self.Lock:
+            Tile = self.Canvas[Top:Top + Height, Left:Left + Width]
+            if Layout != self.Layouts[Index]:
+                # The borders of a letterboxed stream only need to be cleared when its layout changes.
+                Tile[...] = self.Background
+                self.Layouts[Index] = Layout
+            View = Tile[ViewY:ViewY + ViewHeight, ViewX:ViewX + ViewWidth]
+            if SourceChannels != Channels:
+                # Streams with other channels are resized first, so only the small result is converted into the tile.
+                Shape = (ViewHeight, ViewWidth) + Source.shape[2:]
+                if (Source.shape[1], Source.shape[0]) != (ViewWidth, ViewHeight):
+                    if self.Scratch[Index] is None or self.Scratch[Index].shape != Shape:
+                        self.Scratch[Index] = numpy.empty(Shape, numpy.uint8)
+                    Source = cv2.resize(Source, (ViewWidth, ViewHeight), dst=self.Scratch[Index], interpolation=Interpolation)
+                cv2.cvtColor(Source, getattr(cv2, CONVERSIONS[SourceChannels, Channels, self.RGB]), dst=View)
+            elif (Source.shape[1], Source.shape[0]) != (ViewWidth, ViewHeight):
+                cv2.resize(Source, (ViewWidth, ViewHeight), dst=View, interpolation=Interpolation)
+            else:
+                numpy.copyto(View, Source)
+            self.Dirty.add(Index)
+
+    def Changed(self):
+        """
+        Get the changed tiles, called while presenting the canvas with Lock held.
+        The tiles stay changed until Presented() is called, so they are presented again if presenting them fails.
+
+        Returns
+        -------
+        list of tuple of (int, int, int, int) or None
+            The rectangles (x, y, width, height) of the tiles changed since the last present,
+            None if the whole canvas should be presented because it was reset or most tiles changed.
+        """
+        if self.Full == False and len(self.Dirty) <= len(self.Layouts) // 2:
+            return [self.TileRect(Index) for Index in sorted(self.Dirty)]
+        return None
+
+    def Presented(self):
+        """Mark all tiles as presented, called with Lock held once the canvas was presented."""
+        self.Dirty = set()
+        self.Full = False
+
+    def Reset(self):
+        """Present the whole canvas next time, for example after the window content was damaged."""
+        self.Full = True
+
+    def Locate(self, X, Y):
+        """
+        Find the tile at a position of the canvas, like the X and Y of a MouseButton event.
+
+        Returns
+        -------
+        tuple of (int, float, float) or None
+            The tile index and the position in frame coordinates of the stream shown in the tile,
+            or in tile coordinates if the tile is empty. None if the position is outside of all tiles.
+        """
+        Column, Row = int(X // (self.TileSize[0] + self.Gap)), int(Y // (self.TileSize[1] + self.Gap))
+        if X < 0 or Y < 0 or Column >= self.Grid[0] or Row >= self.Grid[1]:
+            return None
+        Index = Row * self.Grid[0] + Column
+        Left, Top, Width, Height = self.TileRect(Index)
+        X, Y = X - Left, Y - Top
+        if X >= Width or Y >= Height:
+            return None
+        Layout = self.Layouts[Index]
+        if Layout is not None:
+            (CropX, CropY, CropWidth, CropHeight), (ViewX, ViewY, ViewWidth, ViewHeight) = Layout
+            X, Y = CropX + (X - ViewX) * CropWidth / ViewWidth, CropY + (Y - ViewY) * CropHeight / ViewHeight
+        return Index, X, Y
@@ -0,0 +1,66 @@
+import time
+
+
+# MARK: SleepUntil()
+def SleepUntil(Deadline, SpinTime=0.002):
+    """
+    Wait until time.perf_counter() reaches the deadline.
+    Most of the time is slept, the last SpinTime seconds are spun to hit the deadline accurately despite the coarse sleep granularity of the OS.
+
+    Parameters
+    ----------
+    Deadline : float
+        The deadline as a time.perf_counter() value.
+    SpinTime : float
+        The time in seconds before the deadline from which on the CPU spins instead of sleeping.
+
+    Returns
+    -------
+    None
+    """
+    Remaining = Deadline - time.perf_counter()
+    if Remaining > SpinTime:
+        time.sleep(Remaining - SpinTime)
+    while time.perf_counter() < Deadline:
+        pass
+
+
+# MARK: Pacer
+class Pacer:
+    """
+    Paces the presentation of a window to a target FPS.
+
+    Parameters
+    ----------
+    FPS : float
+        The target frames per second.
+    Pacing : str
+        "Wait" to wait for the next deadline before presenting, "Drop" to drop frames which arrive before the next deadline.
+    """
+    __slots__ = ("Interval", "Drop", "Deadline")
+
+    def __init__(self, FPS, Pacing="Wait"):
+        if Pacing not in ("Wait", "Drop"):
+            raise ValueError(f"Pacing must be 'Wait' or 'Drop', not {Pacing!r}.")
+        self.Interval = 1 / FPS
+        self.Drop = Pacing == "Drop"
+        self.Deadline = 0.0
+
+    def Ready(self):
+        """Check if the next deadline has been reached."""
+        return time.perf_counter() >= self.Deadline
+
+    def Wait(self):
+        """Wait until the next deadline."""
+        SleepUntil(self.Deadline)
+
+    def Remaining(self):
+        """Get the time in seconds until the next deadline, 0 if it has been reached."""
+        return max(0.0, self.Deadline - time.perf_counter())
+
+    def Next(self):
+        """Advance to the next deadline after a frame was presented, restarting the schedule if it fell behind by more than one interval."""
+        Now = time.perf_counter()
+        self.Deadline += self.Interval
+        if self.Deadline < Now:
+            self.Deadline = Now + self.Interval
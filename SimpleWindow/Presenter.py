@@ -0,0 +1,188 @@
+import threading
+import queue
+
+
+# MARK: Mailbox
+class Mailbox:
+    """
+    A one slot mailbox holding the newest frame of a threaded window and its draw list.
+    Putting a frame into a full mailbox replaces the old frame, which is counted as skipped.
+    """
+    __slots__ = ("Lock", "Frame", "Version", "Draw", "Presented", "Skipped")
+
+    def __init__(self):
+        self.Lock = threading.Lock()
+        self.Frame = None
+        self.Version = None
+        self.Draw = None
+        self.Presented = 0
+        self.Skipped = 0
+
+    def Put(self, Frame, Version=None, Draw=None):
+        """Put a frame, its version and its draw list into the mailbox, replacing a frame which was not presented yet."""
+        with self.Lock:
+            if self.Frame is not None:
+                self.Skipped += 1
+            self.Frame = Frame
+            self.Version = Version
+            self.Draw = Draw
+
+    def Take(self):
+        """Take the newest frame, its version and its draw list out of the mailbox, the frame is None if the mailbox is empty."""
+        with self.Lock:
+            Frame, Draw = self.Frame, self.Draw
+            self.Frame = self.Draw = None
+            return Frame, self.Version, Draw
+
+
+# MARK: Presenter
+class Presenter(threading.Thread):
+    """
+    A background thread which owns threaded windows and their GLFW contexts.
+
+    The thread creates the windows, presents the newest frame of each mailbox and polls the events of their backends.
+    Frames of paced windows stay in the mailbox until the next frame deadline of the window.
+    While idle, the thread blocks in the event wait of a backend with Waits set, or sleeps if there is none,
+    until an event arrives, a frame or call is handed over, or the next frame deadline is reached, so idle windows cost almost no CPU.
+    Other threads never touch the native windows directly, they run native calls on this thread with Call().
+
+    Parameters
+    ----------
+    ErrorHandler : callable
+        Called from the except block with (Function, Name) if presenting a window or polling the events fails, see ReportError().
+    Interval : float
+        The longest time in seconds the thread sleeps without a new frame or event.
+    WaitInterval : float
+        The longest time in seconds the thread blocks in the event wait of a backend, which is woken by every event, frame and call.
+    """
+
+    def __init__(self, ErrorHandler, Interval=0.01, WaitInterval=0.5):
+        super().__init__(name="SimpleWindow Presenter", daemon=True)
+        self.ErrorHandler = ErrorHandler
+        self.Interval = Interval
+        self.WaitInterval = WaitInterval
+        self.Windows = {}
+        self.Calls = queue.SimpleQueue()
+        self.Wake = threading.Event()
+        self.Waiting = None
+        self.Running = True
+        self.Lock = threading.Lock()
+        self.Stopped = False
+
+    def Add(self, Window):
+        """Register a window and return its mailbox."""
+        if Window not in self.Windows:
+            self.Windows[Window] = Mailbox()
+        return self.Windows[Window]
+
+    def Remove(self, Window):
+        """Unregister a window, its native window must already be closed."""
+        self.Windows.pop(Window, None)
+
+    def Notify(self):
+        """Wake the presenter thread, also from the event wait of a backend."""
+        self.Wake.set()
+        Waiting = self.Waiting
+        if Waiting is not None:
+            Waiting.WakeUp()
+
+    def Put(self, Window, Frame, Version=None, Draw=None):
+        """Hand a frame to the presenter thread without waiting for it to be presented."""
+        self.Windows[Window].Put(Frame, Version, Draw)
+        self.Notify()
+
+    def Call(self, Function, *Args):
+        """
+        Run a function on the presenter thread and wait for its result.
+        If called from the presenter thread itself, the function is run directly.
+        Raises RuntimeError if the thread is not running, also if it stops before it ran the function.
+        """
+        if threading.current_thread() is self:
+            return Function(*Args)
+        import concurrent.futures
+        Future = concurrent.futures.Future()
+        with self.Lock:
+            if self.Stopped or self.is_alive() == False:
+                raise RuntimeError("The presenter thread is not running, the native calls of threaded windows cannot be run.")
+            self.Calls.put((Future, Function, Args))
+        self.Notify()
+        return Future.result()
+
+    def Stop(self):
+        """Stop the presenter thread after its current iteration."""
+        self.Running = False
+        self.Notify()
+
+    def run(self):
+        try:
+            self.Loop()
+        finally:
+            # Calls handed over after the last iteration, or left behind by an error which ended the thread, would wait forever.
+            with self.Lock:
+                self.Stopped = True
+            while True:
+                try:
+                    Future, Function, Args = self.Calls.get_nowait()
+                except queue.Empty:
+                    break
+                if Future.set_running_or_notify_cancel():
+                    Future.set_exception(RuntimeError("The presenter thread stopped before it ran the call."))
+
+    def Loop(self):
+        """Present the windows and run the calls until the thread is stopped, see run()."""
+        Timeout = self.Interval
+        Waiter = None
+        while self.Running:
+            if Waiter is not None and self.Wake.is_set() == False:
+                self.Waiting = Waiter
+                try:
+                    # Checking the flag again after publishing Waiting closes the gap in which a Notify() would not wake the wait.
+                    if self.Wake.is_set() == False:
+                        Waiter.WaitEvents(Timeout)
+                except:
+                    self.ErrorHandler("Presenter")
+                self.Waiting = None
+            else:
+                self.Wake.wait(Timeout)
+            self.Wake.clear()
+            Timeout = self.Interval if Waiter is None else self.WaitInterval
+
+            while True:
+                try:
+                    Future, Function, Args = self.Calls.get_nowait()
+                except queue.Empty:
+                    break
+                if Future.set_running_or_notify_cancel():
+                    try:
+                        Future.set_result(Function(*Args))
+                    except BaseException as Error:
+                        Future.set_exception(Error)
+
+            Backends = []
+            for Window, Box in list(self.Windows.items()):
+                if Window.Pacer is not None and Window.Pacer.Ready() == False:
+                    if Box.Frame is not None:
+                        Timeout = min(Timeout, Window.Pacer.Remaining())
+                    Frame = None
+                else:
+                    Frame, Version, Draw = Box.Take()
+                if Frame is not None:
+                    try:
+                        if Window.Stats is not None:
+                            Window.Stats.Start()
+                        Presented = Window.Update(Frame, Version, Draw)
+                        if Window.Stats is not None:
+                            Window.Stats.End(Presented)
+                        if Presented:
+                            Box.Presented += 1
+                    except:
+                        self.ErrorHandler("Presenter", Window.Name)
+                if Window.Open == True and Window.Backend not in Backends:
+                    Backends.append(Window.Backend)
+
+            Waiter = next((Backend for Backend in Backends if Backend.Waits), None)
+            for Backend in Backends:
+                try:
+                    Backend.Poll()
+                except:
+                    self.ErrorHandler("Presenter")
@@ -0,0 +1,224 @@
+import traceback
+import time
+import numpy
+
+from .Frame import ImportCV2
+
+
+# MARK: RecordWorker()
+def RecordWorker(Path, Codec, FPS, Size, MemoryName, SlotBytes, Free, Filled, Info, Total, Written, Errors):
+    """
+    Encode the frames handed over through the shared memory slots, runs in the worker process of a Recorder.
+    The slots are used in order as a ring, Info holds the width, height, channels and RGB flag of the frame in every slot.
+    The worker stops once it encoded Total frames, which the Recorder sets before it releases Filled a last time.
+    """
+    from multiprocessing import shared_memory
+    import cv2
+    Memory = shared_memory.SharedMemory(name=MemoryName)
+    Slots = len(Info) // 4
+    Writer = None
+    Frame = None
+    try:
+        Index = 0
+        while True:
+            Filled.acquire()
+            if Index == Total.value:
+                break
+            Slot = Index % Slots
+            Width, Height, Channels, RGB = Info[4 * Slot:4 * Slot + 4]
+            Frame = numpy.ndarray((Height, Width, Channels) if Channels > 1 else (Height, Width), numpy.uint8, Memory.buf, Slot * SlotBytes)
+            if Channels == 1:
+                Frame = cv2.cvtColor(Frame, cv2.COLOR_GRAY2BGR)
+            elif Channels == 4:
+                Frame = cv2.cvtColor(Frame, cv2.COLOR_RGBA2BGR if RGB else cv2.COLOR_BGRA2BGR)
+            elif RGB:
+                Frame = cv2.cvtColor(Frame, cv2.COLOR_RGB2BGR)
+            if Writer is None:
+                Size = Size if Size is not None else (Width, Height)
+                Writer = cv2.VideoWriter(Path, cv2.VideoWriter_fourcc(*Codec), FPS, Size)
+                if Writer.isOpened() == False:
+                    raise RuntimeError(f"The video file {Path!r} could not be opened for writing with the codec {Codec!r}.")
+            if (Width, Height) != Size:
+                Frame = cv2.resize(Frame, Size, interpolation=cv2.INTER_AREA)
+            Writer.write(Frame)
+            Frame = None
+            Free.release()
+            Index += 1
+            Written.value = Index
+    except:
+        Errors.put(traceback.format_exc())
+    finally:
+        Frame = None
+        if Writer is not None:
+            Writer.release()
+        Memory.close()
+
+
+# MARK: Recorder
+class Recorder:
+    """
+    Records the presented frames of a window into a video file.
+
+    Frames are copied into a ring of preallocated shared memory slots and encoded by a worker process,
+    so neither the encoding nor pickling the frames costs time on the thread which presents the window.
+    Two semaphores count the free and the filled slots, handing over a frame costs one copy and no message.
+    If all slots are in use, the frame is dropped, or with Block the caller waits up to Timeout seconds for a free slot.
+    The video has the size of the first frame unless Size is given, the worker resizes frames of another size.
+
+    Parameters
+    ----------
+    Path : str
+        The path of the video file.
+    FPS : float
+        The frame rate stored in the video file.
+    Codec : str
+        The four character code of the codec passed to cv2.VideoWriter_fourcc().
+    Size : tuple of (int, int), optional
+        The size (width, height) of the video.
+    Capacity : tuple of (int, int), optional
+        The largest frame size (width, height) expected, used to size the slots and start the worker right away.
+        If None, the worker is started with the first frame.
+    Slots : int
+        The number of frames which can wait for the encoder.
+    Block : bool
+        If True, a frame waits for a free slot instead of being dropped.
+    Timeout : float
+        The longest time in seconds a blocked frame waits before it is dropped.
+    """
+    __slots__ = ("Path", "FPS", "Codec", "Size", "Slots", "Block", "Timeout", "Context", "Memory", "SlotBytes", "Free", "Filled", "Info", "Total", "Written", "Errors", "Process", "Frames", "Queued", "Dropped", "BlockedTime")
+
+    def __init__(self, Path, FPS=30.0, Codec="mp4v", Size=None, Capacity=None, Slots=8, Block=False, Timeout=1.0):
+        if len(Codec) != 4:
+            raise ValueError(f"Codec must be a four character code, not {Codec!r}.")
+        import multiprocessing
+        # The worker is spawned instead of forked, a fork would copy the GLFW and OpenGL state of this process.
+        self.Context = multiprocessing.get_context("spawn")
+        self.Path = str(Path)
+        self.FPS = FPS
+        self.Codec = Codec
+        self.Size = Size
+        self.Slots = Slots
+        self.Block = Block
+        self.Timeout = Timeout
+        self.Memory = None
+        self.SlotBytes = 0
+        self.Free = None
+        self.Filled = None
+        self.Info = None
+        self.Total = None
+        self.Written = None
+        self.Errors = None
+        self.Process = None
+        self.Frames = 0
+        self.Queued = 0
+        self.Dropped = 0
+        self.BlockedTime = 0.0
+        if Capacity is not None:
+            self.Start(Capacity)
+
+    def Start(self, Capacity):
+        """Create the shared memory slots for frames up to the size Capacity and the video size, and start the worker process."""
+        from multiprocessing import shared_memory
+        Pixels = Capacity[0] * Capacity[1]
+        if self.Size is not None:
+            Pixels = max(Pixels, self.Size[0] * self.Size[1])
+        self.SlotBytes = Pixels * 4
+        self.Memory = shared_memory.SharedMemory(create=True, size=self.SlotBytes * self.Slots)
+        self.Free = self.Context.Semaphore(self.Slots)
+        self.Filled = self.Context.Semaphore(0)
+        self.Info = self.Context.RawArray("i", 4 * self.Slots)
+        self.Total = self.Context.RawValue("q", -1)
+        self.Written = self.Context.RawValue("q", 0)
+        self.Errors = self.Context.SimpleQueue()
+        self.Process = self.Context.Process(target=RecordWorker, args=(self.Path, self.Codec, self.FPS, self.Size, self.Memory.name, self.SlotBytes, self.Free, self.Filled, self.Info, self.Total, self.Written, self.Errors), name="SimpleWindow Recorder", daemon=True)
+        self.Process.start()
+
+    def Write(self, Frame, RGB=False):
+        """
+        Copy a presented uint8 frame into a free slot and hand it to the worker.
+
+        Parameters
+        ----------
+        Frame : numpy.ndarray
+            The frame in the shape (height, width), (height, width, 3) or (height, width, 4).
+        RGB : bool
+            If True, the channels of the frame are in RGB(A) order.
+
+        Returns
+        -------
+        bool
+            False if the frame was dropped.
+        """
+        self.Frames += 1
+        if self.Process is None:
+            self.Start((Frame.shape[1], Frame.shape[0]))
+        if self.Size is None:
+            self.Size = (Frame.shape[1], Frame.shape[0])
+        if self.Block:
+            Begin = time.perf_counter()
+            Acquired = self.Free.acquire(True, self.Timeout)
+            self.BlockedTime += time.perf_counter() - Begin
+        else:
+            Acquired = self.Free.acquire(False)
+        if Acquired == False:
+            self.Dropped += 1
+            if self.Block and self.Process.is_alive() == False:
+                # A dead worker never frees a slot again, so later frames are dropped without waiting.
+                self.Block = False
+            return False
+        if Frame.nbytes > self.SlotBytes:
+            # Only frames of a window which grew beyond the slots are resized here instead of in the worker.
+            Frame = ImportCV2().resize(Frame, self.Size, interpolation=ImportCV2().INTER_AREA)
+        Slot = self.Queued % self.Slots
+        Target = numpy.ndarray(Frame.shape, numpy.uint8, self.Memory.buf, Slot * self.SlotBytes)
+        numpy.copyto(Target, Frame)
+        del Target
+        self.Info[4 * Slot:4 * Slot + 4] = [Frame.shape[1], Frame.shape[0], Frame.shape[2] if Frame.ndim == 3 else 1, RGB]
+        self.Queued += 1
+        self.Filled.release()
+        return True
+
+    def Stop(self):
+        """
+        Wait until the worker encoded all queued frames, close the video file and free the shared memory.
+        Raises a RuntimeError with the traceback of the worker if encoding failed.
+        """
+        if self.Process is None:
+            return
+        Error = None
+        try:
+            self.Total.value = self.Queued
+            self.Filled.release()
+            self.Process.join()
+            if self.Errors.empty() == False:
+                Error = self.Errors.get()
+            elif self.Process.exitcode != 0:
+                Error = f"The recording worker exited with code {self.Process.exitcode}."
+        finally:
+            self.Errors.close()
+            self.Memory.close()
+            self.Memory.unlink()
+            self.Process = None
+        if Error is not None:
+            raise RuntimeError(f"Recording to {self.Path!r} failed:\n{Error}")
+
+    def Summary(self):
+        """
+        Summarize the counters of the recording, see GetRecordingStats().
+
+        Returns
+        -------
+        dict
+            The counters of the recording.
+        """
+        Written = self.Written.value if self.Written is not None else 0
+        return {
+            "Path": self.Path,
+            "Size": self.Size,
+            "Frames": self.Frames,
+            "Queued": self.Queued,
+            "Dropped": self.Dropped,
+            "Written": Written,
+            "Pending": self.Queued - Written,
+            "BlockedTime": self.BlockedTime
+        }
@@ -0,0 +1,160 @@
+import math
+
+from .Frame import PrepareFrame, ImportCV2
+
+
+SCALINGS = ("Stretch", "Fit", "Fill", "Integer", "Off")
+INTERPOLATIONS = {"Nearest": "INTER_NEAREST", "Linear": "INTER_LINEAR", "Area": "INTER_AREA"}
+
+
+# MARK: ScaleLayout()
+def ScaleLayout(SourceSize, TargetSize, Scaling="Stretch"):
+    """
+    Compute which part of a frame is visible with a scaling mode and where it is placed in the client area.
+
+    Parameters
+    ----------
+    SourceSize : tuple of (int, int)
+        The size (width, height) of the frame.
+    TargetSize : tuple of (int, int)
+        The size (width, height) of the client area.
+    Scaling : str
+        "Stretch" to stretch the frame to the client area, "Fit" to keep the aspect ratio and letterbox the frame,
+        "Fill" to keep the aspect ratio and crop the frame, "Integer" to scale the frame by the largest integer factor which fits
+        (or to shrink it by the smallest integer divisor) and "Off" to show the frame unscaled. All modes except "Stretch" center the frame.
+
+    Returns
+    -------
+    tuple of (tuple of (int, int, int, int), tuple of (int, int, int, int))
+        The visible part of the frame as (x, y, width, height) and the viewport in the client area it is scaled to as (x, y, width, height).
+    """
+    SourceWidth, SourceHeight = SourceSize
+    TargetWidth, TargetHeight = TargetSize
+    if Scaling == "Stretch":
+        return (0, 0, SourceWidth, SourceHeight), (0, 0, TargetWidth, TargetHeight)
+
+    if Scaling == "Fit":
+        Scale = min(TargetWidth / SourceWidth, TargetHeight / SourceHeight)
+    elif Scaling == "Fill":
+        Scale = max(TargetWidth / SourceWidth, TargetHeight / SourceHeight)
+    elif Scaling == "Integer":
+        Scale = min(TargetWidth / SourceWidth, TargetHeight / SourceHeight)
+        Scale = math.floor(Scale) if Scale >= 1 else 1 / math.ceil(1 / Scale)
+    else:
+        Scale = 1
+
+    CropWidth = max(1, min(SourceWidth, round(TargetWidth / Scale)))
+    CropHeight = max(1, min(SourceHeight, round(TargetHeight / Scale)))
+    if Scaling == "Fill":
+        Width, Height = TargetWidth, TargetHeight
+    else:
+        Width = max(1, min(TargetWidth, round(CropWidth * Scale)))
+        Height = max(1, min(TargetHeight, round(CropHeight * Scale)))
+    return ((SourceWidth - CropWidth) // 2, (SourceHeight - CropHeight) // 2, CropWidth, CropHeight), ((TargetWidth - Width) // 2, (TargetHeight - Height) // 2, Width, Height)
+
+
+# MARK: HalveFrame()
+def HalveFrame(Frame, Size, Pyramid):
+    """
+    Halve a frame with INTER_AREA as long as it is at least twice the given size (width, height) in both dimensions.
+    The halvings are written into the cached buffers of the list Pyramid, which grows as needed.
+    A final resize of the result to Size gives nearly the same result as a single INTER_AREA resize at a fraction of the cost.
+    """
+    cv2 = ImportCV2()
+    Level = 0
+    while Frame.shape[1] >= 2 * Size[0] and Frame.shape[0] >= 2 * Size[1]:
+        if Level == len(Pyramid):
+            Pyramid.append(None)
+        Pyramid[Level] = Frame = PrepareFrame(Frame, (Frame.shape[1] // 2, Frame.shape[0] // 2), Pyramid[Level], cv2.INTER_AREA)
+        Level += 1
+    return Frame
+
+
+# MARK: Scaler
+class Scaler:
+    """
+    Scales the frames of a window to its client area.
+
+    The layout of the last source and client size and the destination buffers are cached, so they are only recomputed when one of the sizes changes.
+    Area downscaling by a factor of two or more is done as a cascade of exact halvings into cached buffers followed by one final resize, see HalveFrame().
+
+    Parameters
+    ----------
+    Scaling : str
+        The scaling mode, see ScaleLayout().
+    Interpolation : str, optional
+        "Nearest", "Linear" or "Area". If None, "Nearest" is used for "Integer" scaling and "Linear" otherwise.
+    BlitterScaling : bool
+        If True, the frame is only cropped and the backend scales it to the viewport while presenting it.
+    """
+    __slots__ = ("Scaling", "Interpolation", "BlitterScaling", "Key", "Crop", "Viewport", "Buffer", "Pyramid")
+
+    def __init__(self, Scaling="Stretch", Interpolation=None, BlitterScaling=False):
+        if Scaling not in SCALINGS:
+            raise ValueError(f"Scaling must be one of {SCALINGS}, not {Scaling!r}.")
+        if Interpolation is None:
+            Interpolation = "Nearest" if Scaling == "Integer" else "Linear"
+        if Interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Interpolation must be one of {tuple(INTERPOLATIONS)}, not {Interpolation!r}.")
+        self.Scaling = Scaling
+        self.Interpolation = Interpolation
+        self.BlitterScaling = BlitterScaling
+        self.Reset()
+
+    def Reset(self):
+        """Drop the cached layout and buffers."""
+        self.Key = None
+        self.Crop = None
+        self.Viewport = None
+        self.Buffer = None
+        self.Pyramid = []
+
+    def Layout(self, SourceSize, TargetSize):
+        """Get the cached result of ScaleLayout() for the given sizes."""
+        Key = SourceSize, TargetSize
+        if Key != self.Key:
+            self.Crop, self.Viewport = ScaleLayout(SourceSize, TargetSize, self.Scaling)
+            self.Key = Key
+        return self.Crop, self.Viewport
+
+    def ToFrame(self, X, Y):
+        """Map a position in the client area to frame coordinates with the layout of the last scaled frame, unchanged if no frame was scaled yet."""
+        if self.Key is None:
+            return X, Y
+        CropX, CropY, CropWidth, CropHeight = self.Crop
+        ViewX, ViewY, ViewWidth, ViewHeight = self.Viewport
+        return CropX + (X - ViewX) * CropWidth / ViewWidth, CropY + (Y - ViewY) * CropHeight / ViewHeight
+
+    def Scale(self, Frame, Size, Blit=False):
+        """
+        Crop and scale a frame for a client area of the given size.
+
+        Parameters
+        ----------
+        Frame : numpy.ndarray
+            The frame to scale.
+        Size : tuple of (int, int)
+            The size (width, height) of the client area.
+        Blit : bool
+            If True, the frame is only cropped and left to be scaled by the backend, as with BlitterScaling.
+
+        Returns
+        -------
+        tuple of (numpy.ndarray, tuple of (int, int, int, int))
+            The prepared frame, see PrepareFrame(), and the viewport (x, y, width, height) in the client area it is presented in.
+        """
+        (X, Y, Width, Height), Viewport = self.Layout((Frame.shape[1], Frame.shape[0]), Size)
+        if Width != Frame.shape[1] or Height != Frame.shape[0]:
+            Frame = Frame[Y:Y + Height, X:X + Width]
+        cv2 = ImportCV2()
+        if Blit or self.BlitterScaling:
+            Size, Interpolation = (Width, Height), cv2.INTER_LINEAR
+        else:
+            Size, Interpolation = Viewport[2:], getattr(cv2, INTERPOLATIONS[self.Interpolation])
+
+        if self.Interpolation == "Area":
+            Frame = HalveFrame(Frame, Size, self.Pyramid)
+        Prepared = PrepareFrame(Frame, Size, self.Buffer, Interpolation)
+        if Prepared is not Frame:
+            self.Buffer = Prepared
+        return Prepared, Viewport
@@ -0,0 +1,376 @@
+import threading
+import struct
+import errno
+import stat
+import time
+import os
+import numpy
+
+from .Frame import ImportCV2
+
+
+ENCODINGS = ("Raw", "JPEG")
+MAGIC = b"SWFS"
+
+# Magic, sequence number, time.time() when the frame was shown, width, height, channels, encoding, payload length.
+HEADER = struct.Struct("<4sQdIIBB2xQ")
+
+
+# MARK: ImportSocket()
+def ImportSocket():
+    """
+    Import the socket module on first use and check that it supports Unix domain sockets, which FrameServer and FrameClient are built on.
+
+    Returns
+    -------
+    module
+        The socket module.
+    """
+    import socket
+    if hasattr(socket, "AF_UNIX") == False:
+        raise NotImplementedError("Frame servers need Unix domain sockets (socket.AF_UNIX), which this platform or Python build does not support.")
+    return socket
+
+
+# MARK: FrameServer
+class FrameServer:
+    """
+    Publishes the presented frames of a window to other processes on the same host over a Unix domain socket.
+    The server is POSIX-only, on platforms without Unix domain sockets NotImplementedError is raised.
+
+    The window only copies each frame into a recycled buffer, and only while clients are connected.
+    An encoder thread downscales the newest frame to fit into Size and encodes it, every client has a sender thread which sends the newest message.
+    Clients request each frame with one byte, so no frame waits in the socket buffers and a slow client gets the newest frame instead of a backlog.
+    The first request of a new client is answered right away with the current frame, if one was encoded since the last client disconnected.
+    Frames which arrive while the encoder or a client is busy are skipped, a slow client never holds back the window or the other clients.
+    Every message is a HEADER followed by the payload, the raw BGR(A) or grayscale pixels or a JPEG file, see FrameClient.
+
+    Parameters
+    ----------
+    Path : str
+        The path of the socket. A stale socket at this path is replaced, a socket another server still listens on raises an OSError.
+    Size : tuple of (int, int), optional
+        The largest size (width, height) of the published frames, larger frames are downscaled keeping the aspect ratio.
+    Encoding : str
+        "Raw" or "JPEG".
+    Quality : int
+        The JPEG quality from 0 to 100.
+    History : int
+        The number of frames the timing percentiles are computed over.
+    """
+    __slots__ = ("Path", "Size", "Encoding", "Quality", "Socket", "Lock", "Ready", "Published", "Running", "Frame", "RGB", "Time", "WallTime", "Spare",
+                 "Sequence", "Message", "MessageTime", "Clients", "Threads", "Started", "Frames", "Skipped", "Encoded", "Sent", "BytesSent", "EncodeTimes", "Latencies", "Index")
+
+    def __init__(self, Path, Size=None, Encoding="Raw", Quality=90, History=1000):
+        if Encoding not in ENCODINGS:
+            raise ValueError(f"Encoding must be one of {ENCODINGS}, not {Encoding!r}.")
+        socket = ImportSocket()
+        self.Path = str(Path)
+        self.Size = Size
+        self.Encoding = Encoding
+        self.Quality = Quality
+        if os.path.exists(self.Path) and stat.S_ISSOCK(os.stat(self.Path).st_mode):
+            # Only a socket nobody listens on is stale, a running server keeps its path.
+            Probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                Probe.connect(self.Path)
+            except ConnectionRefusedError:
+                os.unlink(self.Path)
+            except FileNotFoundError:
+                pass
+            else:
+                raise OSError(errno.EADDRINUSE, f"Another server is listening on {self.Path}.")
+            finally:
+                Probe.close()
+        self.Socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.Socket.bind(self.Path)
+        self.Socket.listen()
+        self.Socket.settimeout(0.1)
+        self.Lock = threading.Lock()
+        self.Ready = threading.Condition(self.Lock)
+        self.Published = threading.Condition(self.Lock)
+        self.Running = True
+        self.Frame = None
+        self.RGB = False
+        self.Time = 0.0
+        self.WallTime = 0.0
+        self.Spare = []
+        self.Sequence = 0
+        self.Message = None
+        self.MessageTime = 0.0
+        self.Clients = []
+        self.Started = time.perf_counter()
+        self.Frames = 0
+        self.Skipped = 0
+        self.Encoded = 0
+        self.Sent = 0
+        self.BytesSent = 0
+        self.EncodeTimes = numpy.zeros(History)
+        self.Latencies = numpy.zeros(History)
+        self.Index = [0, 0]
+        self.Threads = [threading.Thread(target=self.Accept, name="SimpleWindow Server", daemon=True), threading.Thread(target=self.Encode, name="SimpleWindow Encoder", daemon=True)]
+        for Thread in self.Threads:
+            Thread.start()
+
+    def Put(self, Frame, RGB=False):
+        """
+        Hand a presented uint8 frame to the encoder thread, replacing a frame which was not encoded yet.
+
+        Returns
+        -------
+        bool
+            False if no client is connected, then the frame is not even copied.
+        """
+        if len(self.Clients) == 0:
+            if self.Message is not None:
+                # The message falls behind the window while nobody is connected, so a new client waits for the next frame instead.
+                with self.Lock:
+                    self.Message = None
+            return False
+        Buffer = None
+        with self.Lock:
+            while self.Spare and Buffer is None:
+                Buffer = self.Spare.pop()
+                if Buffer.shape != Frame.shape:
+                    Buffer = None
+        if Buffer is None:
+            Buffer = numpy.empty(Frame.shape, numpy.uint8)
+        numpy.copyto(Buffer, Frame)
+        with self.Lock:
+            if self.Frame is not None:
+                self.Skipped += 1
+                self.Spare.append(self.Frame)
+            self.Frame = Buffer
+            self.RGB = RGB
+            self.Time = time.perf_counter()
+            self.WallTime = time.time()
+            self.Frames += 1
+            self.Ready.notify()
+        return True
+
+    def Accept(self):
+        """Accept clients until the server is stopped, runs on its own thread."""
+        import socket
+        while self.Running:
+            try:
+                Connection, _ = self.Socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            Connection.settimeout(None)
+            Thread = threading.Thread(target=self.Serve, args=(Connection,), name="SimpleWindow Client", daemon=True)
+            with self.Lock:
+                self.Clients.append(Connection)
+            Thread.start()
+
+    def Serve(self, Connection):
+        """Answer every request of one client with the newest message it did not get yet, until it disconnects or the server is stopped, runs on one thread per client."""
+        with self.Lock:
+            # A new client gets the current message right away, also if the window shows no new frame for a while.
+            Last = self.Sequence - 1 if self.Message is not None else self.Sequence
+        try:
+            while True:
+                if Connection.recv(1) == b"":
+                    break
+                with self.Lock:
+                    while self.Running and self.Sequence == Last:
+                        self.Published.wait()
+                    if self.Running == False:
+                        break
+                    Last, Message, Time = self.Sequence, self.Message, self.MessageTime
+                Connection.sendall(Message)
+                Latency = time.perf_counter() - Time
+                with self.Lock:
+                    self.Sent += 1
+                    self.BytesSent += len(Message)
+                    self.Latencies[self.Index[1] % len(self.Latencies)] = Latency
+                    self.Index[1] += 1
+        except OSError:
+            pass
+        finally:
+            with self.Lock:
+                if Connection in self.Clients:
+                    self.Clients.remove(Connection)
+            Connection.close()
+
+    def Encode(self):
+        """Encode the newest frame and publish it to the sender threads, runs on its own thread."""
+        while True:
+            with self.Lock:
+                while self.Running and self.Frame is None:
+                    self.Ready.wait()
+                if self.Running == False:
+                    return
+                Frame, RGB, Time, WallTime = self.Frame, self.RGB, self.Time, self.WallTime
+                self.Frame = None
+            Begin = time.perf_counter()
+            Message = self.EncodeFrame(Frame, RGB, WallTime)
+            Elapsed = time.perf_counter() - Begin
+            with self.Lock:
+                if len(self.Spare) < 2:
+                    self.Spare.append(Frame)
+                self.Sequence += 1
+                self.Message = Message
+                self.MessageTime = Time
+                self.Encoded += 1
+                self.EncodeTimes[self.Index[0] % len(self.EncodeTimes)] = Elapsed
+                self.Index[0] += 1
+                self.Published.notify_all()
+
+    def EncodeFrame(self, Frame, RGB, WallTime):
+        """Build the message of a frame, converted to BGR(A), downscaled to fit into Size and encoded."""
+        Channels = Frame.shape[2] if Frame.ndim == 3 else 1
+        if RGB and Channels > 1:
+            cv2 = ImportCV2()
+            Frame = cv2.cvtColor(Frame, cv2.COLOR_RGB2BGR if Channels == 3 else cv2.COLOR_RGBA2BGRA)
+        if self.Size is not None:
+            Scale = min(self.Size[0] / Frame.shape[1], self.Size[1] / Frame.shape[0])
+            if Scale < 1:
+                cv2 = ImportCV2()
+                Frame = cv2.resize(Frame, (max(1, round(Frame.shape[1] * Scale)), max(1, round(Frame.shape[0] * Scale))), interpolation=cv2.INTER_AREA)
+        Height, Width = Frame.shape[:2]
+        if self.Encoding == "JPEG":
+            cv2 = ImportCV2()
+            if Channels == 4:
+                Frame = cv2.cvtColor(Frame, cv2.COLOR_BGRA2BGR)
+                Channels = 3
+            Payload = cv2.imencode(".jpg", Frame, [cv2.IMWRITE_JPEG_QUALITY, self.Quality])[1]
+        else:
+            Payload = Frame
+        Message = bytearray(HEADER.size + Payload.nbytes)
+        HEADER.pack_into(Message, 0, MAGIC, self.Sequence + 1, WallTime, Width, Height, Channels, ENCODINGS.index(self.Encoding), Payload.nbytes)
+        numpy.frombuffer(Message, numpy.uint8, Payload.nbytes, HEADER.size).reshape(Payload.shape)[...] = Payload
+        return Message
+
+    def Stop(self):
+        """Stop the threads, disconnect the clients and remove the socket."""
+        import socket
+        with self.Lock:
+            self.Running = False
+            self.Ready.notify_all()
+            self.Published.notify_all()
+            Clients = list(self.Clients)
+        self.Socket.close()
+        for Connection in Clients:
+            try:
+                Connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        for Thread in self.Threads:
+            Thread.join()
+        if os.path.exists(self.Path):
+            os.unlink(self.Path)
+
+    def Summary(self):
+        """
+        Summarize the counters of the server, see GetServerStats().
+
+        Returns
+        -------
+        dict
+            The counters of the server and the timing percentiles in milliseconds.
+        """
+        with self.Lock:
+            EncodeTimes = self.EncodeTimes[:min(self.Index[0], len(self.EncodeTimes))] * 1000
+            Latencies = self.Latencies[:min(self.Index[1], len(self.Latencies))] * 1000
+            Elapsed = time.perf_counter() - self.Started
+            Result = {
+                "Path": self.Path,
+                "Clients": len(self.Clients),
+                "Frames": self.Frames,
+                "Skipped": self.Skipped,
+                "Encoded": self.Encoded,
+                "Sent": self.Sent,
+                "BytesSent": self.BytesSent,
+                "SentPerSecond": self.Sent / Elapsed if Elapsed > 0 else 0.0,
+                "BytesPerSecond": self.BytesSent / Elapsed if Elapsed > 0 else 0.0
+            }
+        for Name, Timings in (("EncodeTime", EncodeTimes), ("Latency", Latencies)):
+            if len(Timings) == 0:
+                Result[Name] = dict.fromkeys(("Mean", "P50", "P95", "Max"), 0.0)
+                continue
+            P50, P95 = numpy.percentile(Timings, (50, 95))
+            Result[Name] = {"Mean": float(Timings.mean()), "P50": float(P50), "P95": float(P95), "Max": float(Timings.max())}
+        return Result
+
+
+# MARK: FrameClient
+class FrameClient:
+    """
+    Receives the frames a FrameServer publishes, see StartServer(). Every Receive() requests the newest frame the client did not get yet.
+    After every Receive(), Sequence is the number of the frame, Skipped counts the frames the server published but this client did not get,
+    and Latency is the time in seconds from showing the frame to receiving it.
+
+    Parameters
+    ----------
+    Path : str
+        The path of the socket of the server.
+    Timeout : float, optional
+        The longest time in seconds Receive() waits for a frame. If None, it waits until a frame arrives or the server stops.
+    """
+    __slots__ = ("Path", "Socket", "Header", "Sequence", "Received", "Skipped", "Latency")
+
+    def __init__(self, Path, Timeout=None):
+        socket = ImportSocket()
+        self.Path = str(Path)
+        self.Socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.Socket.settimeout(Timeout)
+        self.Socket.connect(self.Path)
+        self.Header = bytearray(HEADER.size)
+        self.Sequence = 0
+        self.Received = 0
+        self.Skipped = 0
+        self.Latency = 0.0
+
+    def ReceiveInto(self, Buffer):
+        """Fill the buffer from the socket, returns False if the server closed the connection."""
+        View = memoryview(Buffer)
+        while len(View):
+            Count = self.Socket.recv_into(View)
+            if Count == 0:
+                return False
+            View = View[Count:]
+        return True
+
+    def Receive(self):
+        """
+        Receive the next frame.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            The frame in BGR(A) or grayscale as uint8, None if the server stopped.
+            Raises socket.timeout if no frame arrived within Timeout.
+        """
+        if self.Socket is None:
+            return None
+        try:
+            self.Socket.sendall(b"\1")
+        except (BrokenPipeError, ConnectionResetError):
+            return None
+        if self.ReceiveInto(self.Header) == False:
+            return None
+        Magic, Sequence, WallTime, Width, Height, Channels, Encoding, Length = HEADER.unpack(self.Header)
+        if Magic != MAGIC:
+            raise ValueError(f"The server at {self.Path!r} sent an invalid message.")
+        Payload = numpy.empty(Length, numpy.uint8)
+        if self.ReceiveInto(Payload) == False:
+            return None
+        if ENCODINGS[Encoding] == "JPEG":
+            cv2 = ImportCV2()
+            Frame = cv2.imdecode(Payload, cv2.IMREAD_UNCHANGED)
+        else:
+            Frame = Payload.reshape((Height, Width, Channels) if Channels > 1 else (Height, Width))
+        if self.Sequence:
+            self.Skipped += Sequence - self.Sequence - 1
+        self.Sequence = Sequence
+        self.Received += 1
+        self.Latency = time.time() - WallTime
+        return Frame
+
+    def Close(self):
+        """Disconnect from the server."""
+        if self.Socket is not None:
+            self.Socket.close()
+            self.Socket = None
@@ -1,62 +1,672 @@
-from ctypes import Structure, c_int32, c_int16, c_int, windll, sizeof, byref
-import win32gui, win32con
-import traceback
-import ctypes
 import numpy
-import glfw
-import cv2
 import os
 
+from .Backends import GetDefaultBackend, TerminateGLFW
+from .Presenter import Presenter
+from .Pacing import Pacer
+from .Delta import Delta
+from .Scaling import Scaler
+from .Stats import Stats
+from .Recording import Recorder
+from .Server import FrameServer
+from .Layers import Layers
+from .Mosaic import Mosaic
+from .Events import EventQueue, EVENT_TYPES
+from .Frame import ConvertFrame
+from .Errors import ReportError, LOGGER
 
-glfw.init()
-
-class BITMAPINFO(Structure):
-    _fields_ = [
-        ("biSize", c_int32),
-        ("biWidth", c_int32),
-        ("biHeight", c_int32),
-        ("biPlanes", c_int16),
-        ("biBitCount", c_int16),
-        ("biCompression", c_int32),
-        ("biSizeImage", c_int32),
-        ("biXPelsPerMeter", c_int32),
-        ("biYPelsPerMeter", c_int32),
-        ("biClrUsed", c_int32),
-        ("biClrImportant", c_int32)
-    ]
-
-    def __init__(self, width, height, planes=1, bpp=24):
-        self.biSize = sizeof(self)
-        self.biWidth = width
-        self.biHeight = height
-        self.biPlanes = planes
-        self.biBitCount = bpp
-        self.biCompression = 0
-        self.biSizeImage = width * height * (bpp // 8)
-        self.biXPelsPerMeter = 0
-        self.biYPelsPerMeter = 0
-        self.biClrUsed = 0
-        self.biClrImportant = 0
 
 WINDOWS = {}
-RED = "\033[91m"
-NORMAL = "\033[0m"
+BACKEND = None
+PRESENTER = None
 
 
-def ShowError(Type, Message):
+# MARK: Window
+class Window:
+    """
+    A window created by Initialize().
+
+    All native calls go through the Backend of the window.
+    The native handle is resolved once when the window is created and cached until the window is closed,
+    so the methods of this class never have to look the window up by its title.
+    Backends built on GLFW keep the geometry and state of the window in its Cache, updated by the GLFW callbacks,
+    so the getters read them without native calls and without waiting for the presenter thread.
+    The name based functions of this module are thin wrappers around these methods.
+    Unlike the name based functions, the methods raise exceptions instead of printing them.
+    The Scaler of the window and the destination buffer of ConvertFrame() and the BITMAPINFO header are kept until the size of the client area changes.
+    Threaded windows are owned by the presenter thread, their native calls are run on that thread with Call()
+    and Show() only puts the frame into their Mailbox.
+    """
+    __slots__ = ("Name", "Size", "Position", "TitleBarColor", "Resizable", "TopMost", "Foreground", "Minimized", "Undestroyable", "Icon", "NoWarnings", "Open", "Backend", "Presenter", "Mailbox", "Pacer", "Delta", "Scaler", "Stats", "Events", "Recorder", "Server", "Layers", "Composite", "Mosaic", "Range", "RGB", "GLFWWindow", "HWND", "Cache", "ConvertBuffer", "Staging", "BackBuffer", "BackBufferHandles", "BitmapInfo")
+
+    def __init__(self, Name="", Size=(None, None), Position=(None, None), TitleBarColor=(0, 0, 0), Resizable=True, TopMost=False, Foreground=True, Minimized=False, Undestroyable=False, Icon="", NoWarnings=False, Backend=None, Threaded=False, FPS=None, Pacing="Wait", DeltaMode=None, TileSize=64, Scaling="Stretch", Interpolation=None, BlitterScaling=False, Range=None, RGB=False):
+        self.Name = Name
+        self.Size = Size
+        self.Position = Position
+        self.TitleBarColor = TitleBarColor
+        self.Resizable = Resizable
+        self.TopMost = TopMost
+        self.Foreground = Foreground
+        self.Minimized = Minimized
+        self.Undestroyable = Undestroyable
+        self.Icon = Icon
+        self.NoWarnings = NoWarnings
+        self.Open = False
+        self.Backend = Backend if Backend is not None else GetBackend()
+        self.Presenter = GetPresenter() if Threaded else None
+        self.Mailbox = self.Presenter.Add(self) if Threaded else None
+        self.Pacer = Pacer(FPS, Pacing) if FPS else None
+        self.Delta = Delta(DeltaMode, TileSize) if DeltaMode else None
+        self.Scaler = Scaler(Scaling, Interpolation, BlitterScaling)
+        self.Stats = None
+        self.Events = EventQueue()
+        self.Recorder = None
+        self.Server = None
+        self.Layers = None
+        self.Composite = None
+        self.Mosaic = None
+        self.Range = Range
+        self.RGB = RGB
+        self.GLFWWindow = None
+        self.HWND = None
+        self.Cache = None
+        self.ConvertBuffer = None
+        self.Staging = None
+        self.BackBuffer = None
+        self.BackBufferHandles = None
+        self.BitmapInfo = None
+
+    def __repr__(self):
+        return f"Window(Name={self.Name!r}, Open={self.Open!r}, Handle={self.GetHandle()!r})"
+
+    def Call(self, Function, *Args):
+        """Run a native call, on the presenter thread if the window is threaded."""
+        if self.Presenter is None:
+            return Function(*Args)
+        return self.Presenter.Call(Function, *Args)
+
+    def CreateWindow(self):
+        """Create the native window and cache its handle, see CreateWindow()."""
+        Size = self.Size
+        Position = self.Position
+
+        if Size[0] == None:
+            Size = 150, Size[1]
+        if Size[1] == None:
+            Size = Size[0], 50
+
+        if Position[0] == None:
+            Position = 0, Position[1]
+        if Position[1] == None:
+            Position = Position[0], 0
+
+        self.Size = Size
+        self.Position = Position
+
+        self.Call(self.Backend.Create, self)
+        self.Open = True
+
+        if self.Foreground:
+            self.SetForeground(State=True)
+
+        if self.Minimized:
+            self.SetMinimized(State=True)
+
+    def Close(self):
+        """Destroy the native window and drop the cached handle, see Close()."""
+        try:
+            if self.Server is not None:
+                self.StopServer()
+            if self.Recorder is not None:
+                self.StopRecording()
+        finally:
+            try:
+                self.Call(self.Destroy)
+            except:
+                self.Open = False
+            self.Scaler.Reset()
+            self.ConvertBuffer = None
+            self.Composite = None
+            self.Invalidate()
+
+    def Destroy(self):
+        """Destroy the native window for Close(), on the presenter thread for threaded windows so no queued frame is presented afterwards."""
+        if self.Mailbox is not None:
+            self.Mailbox.Take()
+        self.Open = False
+        self.Backend.Destroy(self)
+
+    def SetSize(self, Size=(None, None)):
+        """Set the size of the window, see SetSize()."""
+        if self.Size != Size and self.Open:
+            if len(Size) != 2:
+                if self.NoWarnings != True:
+                    LOGGER.warning("Size must be a tuple of (int, int).")
+                return
+            if (type(Size[0]) != int and type(Size[1]) != type(None)) or (type(Size[1]) != int and type(Size[0]) != type(None)):
+                if self.NoWarnings != True:
+                    LOGGER.warning("Size must be a tuple of (int, int).")
+                return
+            if Size[0] == None:
+                Size = (self.Size[0], Size[1])
+            if Size[1] == None:
+                Size = (Size[0], self.Size[1])
+            Size = max(150, round(Size[0])), max(50, round(Size[1]))
+            self.Size = Size
+            self.Call(self.Backend.SetSize, self, Size)
+
+    def GetSize(self):
+        """Get the size of the client area of the window, see GetSize()."""
+        if self.Open:
+            if self.Cache is not None:
+                return self.Backend.GetSize(self)
+            return self.Call(self.Backend.GetSize, self)
+        return self.Size
+
+    def SetPosition(self, Position=(None, None)):
+        """Set the position of the window, see SetPosition()."""
+        if self.Position != Position and self.Open:
+            if len(Position) != 2:
+                if self.NoWarnings != True:
+                    LOGGER.warning("Position must be a tuple of (int, int).")
+                return
+            if (type(Position[0]) != int and type(Position[0]) != type(None)) or (type(Position[1]) != int and type(Position[1]) != type(None)):
+                if self.NoWarnings != True:
+                    LOGGER.warning("Position must be a tuple of (int, int).")
+                return
+            if Position[0] == None:
+                Position = (self.Position[0], Position[1])
+            if Position[1] == None:
+                Position = (Position[0], self.Position[1])
+            Position = round(Position[0]), round(Position[1])
+            self.Position = Position
+            self.Call(self.Backend.SetPosition, self, Position)
+
+    def GetPosition(self):
+        """Get the screen position of the top-left corner of the client area, see GetPosition()."""
+        if self.Open:
+            if self.Cache is not None:
+                return self.Backend.GetPosition(self)
+            return self.Call(self.Backend.GetPosition, self)
+        return self.Position
+
+    def SetTitleBarColor(self, Color=(0, 0, 0)):
+        """Set the title bar color of the window, see SetTitleBarColor()."""
+        if self.TitleBarColor != Color and self.Open:
+            if len(Color) != 3:
+                if self.NoWarnings != True:
+                    LOGGER.warning("TitleBarColor must be a tuple of (int, int, int).")
+                return
+            self.TitleBarColor = Color
+            self.Call(self.Backend.SetTitleBarColor, self, Color)
+
+    def SetResizable(self, State=True):
+        """Set the resizable property of the window, see SetResizable()."""
+        if self.Resizable != State:
+            self.Resizable = State == True
+            self.Call(self.Backend.SetResizable, self, self.Resizable)
+
+    def SetTopMost(self, State=True):
+        """Set the TopMost property of the window, see SetTopMost()."""
+        if self.TopMost != State:
+            self.TopMost = State == True
+            self.Call(self.Backend.SetTopMost, self, self.TopMost)
+
+    def SetForeground(self, State=True):
+        """Move the window to the foreground or background, see SetForeground()."""
+        if self.Open == True:
+            self.Foreground = State == True
+            self.Call(self.Backend.SetForeground, self, State)
+
+    def GetForeground(self):
+        """Check if the window is the foreground window, see GetForeground()."""
+        if self.Open == True:
+            if self.Cache is not None:
+                return self.Backend.GetForeground(self)
+            return self.Call(self.Backend.GetForeground, self)
+        return False
+
+    def SetMinimized(self, State=False):
+        """Minimize or restore the window, see SetMinimized()."""
+        if self.Open:
+            self.Minimized = State == True
+            self.Call(self.Backend.SetMinimized, self, State)
+
+    def GetMinimized(self):
+        """Check if the window is minimized, see GetMinimized()."""
+        if self.Open:
+            if self.Cache is not None:
+                return self.Backend.GetMinimized(self)
+            return self.Call(self.Backend.GetMinimized, self)
+        return False
+
+    def SetIcon(self, Icon=""):
+        """Set the icon of the window, see SetIcon()."""
+        if self.Icon != Icon and self.Open:
+            if type(Icon) != str:
+                if self.NoWarnings != True:
+                    LOGGER.warning("Icon must be an absolute path as a string.")
+                return
+            if os.path.exists(Icon) == False:
+                if self.NoWarnings != True:
+                    LOGGER.warning("Icon file does not exist.")
+                return
+            if Icon.endswith(".ico") == False:
+                if self.NoWarnings != True:
+                    LOGGER.warning("Icon must be a .ico file.")
+                return
+            self.Icon = Icon
+            self.Call(self.Backend.SetIcon, self, Icon.replace("\\", "/"))
+
+    def SetOpen(self, State=True):
+        """Open or close the window, see SetOpen()."""
+        if State == True and self.Open != True:
+            self.CreateWindow()
+        elif State == False and self.Open == True:
+            self.Close()
+
+    def SetPacing(self, FPS=None, Pacing="Wait"):
+        """Set the target FPS and the pacing mode of the window, see SetPacing()."""
+        self.Pacer = Pacer(FPS, Pacing) if FPS else None
+
+    def SetScaling(self, Scaling="Stretch", Interpolation=None, BlitterScaling=False):
+        """Set how frames are scaled to the client area, see SetScaling()."""
+        self.Scaler = Scaler(Scaling, Interpolation, BlitterScaling)
+        self.Invalidate()
+
+    def Invalidate(self):
+        """Forget what was presented last, so the next frame is presented completely, for example after the window content was damaged."""
+        if self.Delta is not None:
+            self.Delta.Reset()
+        if self.Mosaic is not None:
+            self.Mosaic.Reset()
+
+    def GetHandle(self):
+        """Get the cached native handle of the window, 0 if the window is not open."""
+        if self.Open:
+            return self.Call(self.Backend.GetHandle, self)
+        return 0
+
+    def Refresh(self):
+        """Create or recreate the window if needed and handle a close request of the user, returns True if the window is open afterwards."""
+        if self.Open == False:
+            self.CreateWindow()
+        elif self.Open == None and self.Undestroyable == False:
+            return False
+        if self.Backend.ShouldClose(self):
+            if self.Open == True:
+                self.Close()
+            if self.Undestroyable == True:
+                self.CreateWindow()
+            else:
+                self.Open = None
+                return False
+        return True
+
+    def Update(self, Frame=None, Version=None, Draw=None):
+        """Create or recreate the window if needed and present the frame and its draw list without polling the events, returns True if the frame was presented."""
+        Mosaic = self.Mosaic
+        if Mosaic is not None and Frame is Mosaic.Canvas:
+            # The tiles are not written while the canvas is presented, so no tile is presented half updated.
+            with Mosaic.Lock:
+                return self.Render(Frame, Version, Draw, Mosaic)
+        return self.Render(Frame, Version, Draw)
+
+    def Render(self, Frame, Version=None, Draw=None, Mosaic=None):
+        """Present a frame for Update(), Mosaic is given if the frame is the canvas of the mosaic of the window, then only its changed tiles are presented."""
+        if self.Refresh() == False:
+            return False
+
+        if Frame is None or self.Backend.GetMinimized(self):
+            return False
+        Layers = self.Layers
+        if Draw is not None and len(Draw) == 0:
+            Draw = None
+        LayersDirty = Layers is not None and Layers.Dirty
+        if Mosaic is not None:
+            Tiles = Mosaic.Changed()
+            if Tiles == [] and Draw is None and LayersDirty == False:
+                return False
+        elif self.Delta is not None and Draw is None and LayersDirty == False and self.Delta.Unchanged(Frame, Version):
+            return False
+
+        Stats = self.Stats
+        Source = Frame if isinstance(Frame, numpy.ndarray) else numpy.asarray(Frame)
+        if Source.ndim == 3 and Source.shape[2] == 1:
+            Source = Source[:, :, 0]
+        Swap = self.RGB and self.Backend.NativeRGB == False
+        if Source.dtype == numpy.bool_:
+            # OpenCV cannot resize bool frames, so masks are converted before they are scaled.
+            Source = self.ConvertBuffer = ConvertFrame(Source, None, Swap, self.ConvertBuffer)
+            Swap = False
+            if Stats is not None:
+                Stats.Lap("Convert")
+        Prepared, Viewport = self.Scaler.Scale(Source, self.Backend.GetSize(self), self.Backend.Scales)
+        if Stats is not None:
+            Stats.Lap("Scale")
+            if Prepared is self.Scaler.Buffer:
+                Stats.Copied(Prepared.nbytes)
+        Converted = ConvertFrame(Prepared, self.Range, Swap, self.ConvertBuffer)
+        if Converted is not Prepared:
+            self.ConvertBuffer = Converted
+        Prepared = Converted
+        if Stats is not None:
+            Stats.Lap("Convert")
+            if Prepared is self.ConvertBuffer:
+                Stats.Copied(Prepared.nbytes)
+        if Layers is not None and Layers.Items == {}:
+            Layers = None
+        if (Layers is not None or Draw is not None) and Prepared is not self.ConvertBuffer and Prepared is not self.Scaler.Buffer:
+            # The frame of the caller is never drawn on, it is copied once into a buffer of the window first.
+            if self.Composite is None or self.Composite.shape != Prepared.shape:
+                self.Composite = numpy.empty(Prepared.shape, numpy.uint8)
+            numpy.copyto(self.Composite, Prepared)
+            Prepared = self.Composite
+            if Stats is not None:
+                Stats.Copied(Prepared.nbytes)
+        if Layers is not None:
+            Layers.Composite(Prepared, self.Scaler.Crop, self.RGB and self.Backend.NativeRGB == False)
+            if Stats is not None:
+                Stats.Lap("Composite")
+        if Draw is not None:
+            Draw.Execute(Prepared, self.Scaler.Crop, self.RGB and self.Backend.NativeRGB == False)
+            if Stats is not None:
+                Stats.Lap("Draw")
+
+        Rects = None
+        if Mosaic is not None:
+            # The changed tiles are only valid for a canvas which was neither scaled nor cropped and has nothing drawn over it that changed.
+            if Draw is None and LayersDirty == False and Prepared.shape[:2] == Frame.shape[:2] and self.Scaler.Crop[:2] == (0, 0):
+                Rects = Tiles
+            if self.Delta is not None:
+                self.Delta.Reset()
+        elif self.Delta is not None:
+            self.Delta.Remember(Frame, Version)
+            if self.Delta.Mode == "Tiles":
+                Rects = self.Delta.ChangedRects(Prepared)
+                if Stats is not None:
+                    Stats.Lap("Delta")
+                if Rects == []:
+                    return False
+        self.Backend.Present(self, Prepared, Rects, Viewport)
+        if Mosaic is not None:
+            Mosaic.Presented()
+        if Stats is not None:
+            Stats.Lap("Present")
+            Stats.Copied(Prepared.nbytes if Rects is None else sum(Width * Height for X, Y, Width, Height in Rects) * Prepared.itemsize * (Prepared.shape[2] if Prepared.ndim == 3 else 1))
+        Recorder = self.Recorder
+        if Recorder is not None:
+            if Recorder.Write(Prepared, self.RGB and self.Backend.NativeRGB) and Stats is not None:
+                Stats.Copied(Prepared.nbytes)
+            if Stats is not None:
+                Stats.Lap("Record")
+        Server = self.Server
+        if Server is not None:
+            if Server.Put(Prepared, self.RGB and self.Backend.NativeRGB) and Stats is not None:
+                Stats.Copied(Prepared.nbytes)
+            if Stats is not None:
+                Stats.Lap("Serve")
+        if self.Pacer is not None:
+            self.Pacer.Next()
+        return True
+
+    def GetBackBuffer(self, Channels=3):
+        """Get the persistent back buffer of the window, see GetBackBuffer()."""
+        if self.Open != True:
+            self.Call(self.CreateWindow)
+        Size = self.GetSize()
+        BackBuffer = self.BackBuffer
+        if BackBuffer is None or BackBuffer.shape[0] != Size[1] or BackBuffer.shape[1] != Size[0] or BackBuffer.shape[2] != Channels:
+            self.Call(self.Backend.CreateBackBuffer, self, Size, Channels)
+        return self.BackBuffer
+
+    def PresentBackBuffer(self):
+        """Present the back buffer of the window, see Present()."""
+        if self.BackBuffer is None or self.Call(self.Refresh) == False or self.Call(self.Backend.GetMinimized, self):
+            return False
+        # Refresh() releases the back buffer if the window was resized or recreated in the meantime.
+        if self.BackBuffer is None:
+            return False
+        self.Call(self.Backend.PresentBackBuffer, self)
+        if self.Presenter is None:
+            self.Backend.Poll()
+        return True
+
+    def Show(self, Frame=None, Version=None, Draw=None):
+        """Display the window and update its content with the given frame and draw list, see Show()."""
+        if Frame is None and self.Mosaic is not None:
+            Frame = self.Mosaic.Canvas
+        if self.Presenter is not None:
+            if Frame is not None:
+                self.Presenter.Put(self, Frame, Version, Draw)
+                return True
+            if self.Open == False:
+                self.Call(self.CreateWindow)
+            return False
+        Stats = self.Stats if Frame is not None else None
+        if Stats is not None:
+            Stats.Start()
+        if self.Pacer is not None and Frame is not None:
+            if self.Pacer.Drop:
+                if self.Pacer.Ready() == False:
+                    if Stats is not None:
+                        Stats.Skip()
+                    return False
+            else:
+                self.Pacer.Wait()
+                if Stats is not None:
+                    Stats.Lap("Wait")
+        Presented = self.Update(Frame, Version, Draw)
+        self.Backend.Poll()
+        if Stats is not None:
+            Stats.Lap("Poll")
+            Stats.End(Presented)
+        return Presented
+
+    def ShowFromChannel(self, Channel, Timeout=0.1):
+        """Display the newest frame of a frame channel without copying it, see ShowFromChannel()."""
+        if Channel.Wait(Channel.Shown, Timeout) == False:
+            if self.Presenter is None:
+                self.Show()
+            return False
+        Shown = Channel.Shown
+        for Attempt in range(2):
+            Sequence, Frame = Channel.Claim()
+            if Frame is None:
+                return False
+            try:
+                Channel.Shown = Sequence
+                # The torn frame already used the frame deadline of the pacer, so the newer frame replacing it is not paced again.
+                Presented = self.PresentClaimed(Frame, Sequence, Attempt == 0)
+            finally:
+                Intact = Channel.Release()
+            if Intact or Presented == False:
+                return Presented
+        # The producer overwrote the frame twice while it was presented, the next call shows the newest frame again.
+        Channel.Shown = Shown
+        return False
+
+    def PresentClaimed(self, Frame, Sequence, Paced=True):
+        """Present a claimed frame of a frame channel for ShowFromChannel(), also threaded windows present it before returning, as it is only claimed until then."""
+        Stats = self.Stats
+        if Stats is not None:
+            Stats.Start()
+        if Paced and self.Pacer is not None:
+            if self.Pacer.Drop:
+                if self.Pacer.Ready() == False:
+                    if Stats is not None:
+                        Stats.Skip()
+                    return False
+            else:
+                self.Pacer.Wait()
+                if Stats is not None:
+                    Stats.Lap("Wait")
+        Presented = self.Call(self.Update, Frame, Sequence)
+        if self.Presenter is None:
+            self.Backend.Poll()
+            if Stats is not None:
+                Stats.Lap("Poll")
+        if Stats is not None:
+            Stats.End(Presented)
+        return Presented
+
+    def SetStats(self, State=True, Callback=None, History=1000):
+        """Enable or disable the performance counters of the window, see SetStats()."""
+        self.Stats = Stats(self.Name, History, Callback) if State else None
+
+    def SetEvents(self, Capacity=1024, Coalesce=False):
+        """Reconfigure the event queue of the window, see SetEvents()."""
+        self.Events.Configure(Capacity, Coalesce)
+
+    def GetEvents(self, AsList=False):
+        """Drain the queued input events of the window, see GetEvents()."""
+        Events = self.Events.Drain()
+        if AsList == False:
+            return Events
+        return [{"Time": Time, "Type": EVENT_TYPES[Type], "Action": Action, "Mods": Mods, "Key": Key, "X": X, "Y": Y} for Time, Type, Action, Mods, Key, X, Y in Events.tolist()]
+
+    def StartRecording(self, Path, FPS=None, Codec="mp4v", Size=None, Slots=8, Block=False, Timeout=1.0):
+        """Start recording the presented frames of the window, see StartRecording()."""
+        if self.Recorder is not None:
+            self.StopRecording()
+        if FPS is None:
+            FPS = 1 / self.Pacer.Interval if self.Pacer is not None else 30.0
+        # Prepared frames are never larger than the window, so the slots are sized for it and the worker starts before the first frame.
+        Capacity = self.GetSize()
+        self.Recorder = Recorder(Path, FPS, Codec, Size, Capacity if None not in Capacity else None, Slots, Block, Timeout)
+
+    def StopRecording(self):
+        """Stop recording the window and finish the video file, see StopRecording()."""
+        Recorder = self.Recorder
+        if Recorder is None:
+            return None
+        # Detaching the recorder on the presenter thread makes sure no frame of a threaded window is written while it is stopped,
+        # waiting for the encoder happens on the calling thread so the presenter thread keeps running.
+        self.Call(setattr, self, "Recorder", None)
+        Recorder.Stop()
+        return Recorder.Summary()
+
+    def SetLayer(self, Layer, Image=None, Position=(0, 0), Mode="Alpha", Key=(0, 0, 0), Opacity=1.0, Order=0, Version=None, Visible=True):
+        """Add or replace an overlay layer of the window, see SetLayer()."""
+        if self.Layers is None:
+            self.Layers = Layers()
+        self.Layers.Set(Layer, Image, Position, Mode, Key, Opacity, Order, Version, Visible)
+
+    def RemoveLayer(self, Layer=None):
+        """Remove an overlay layer of the window, see RemoveLayer()."""
+        if self.Layers is not None:
+            self.Layers.Remove(Layer)
+
+    def SetMosaic(self, State=True, Grid=(4, 4), TileSize=(320, 180), Gap=0, Background=(0, 0, 0), Channels=3, Scaling="Fit", Interpolation="Linear"):
+        """Turn the window into a mosaic of tiles or back into a normal window, see SetMosaic()."""
+        if State == False:
+            self.Call(setattr, self, "Mosaic", None)
+            return
+        New = Mosaic(Grid, TileSize, Gap, Background, Channels, Scaling, Interpolation, self.RGB)
+        if self.Open == False and self.Size == (None, None):
+            self.Size = New.Canvas.shape[1], New.Canvas.shape[0]
+        self.Mosaic = New
+
+    def ShowTile(self, Index, Frame=None):
+        """Resize a frame into a tile of the mosaic of the window, see ShowTile()."""
+        if self.Mosaic is None:
+            raise RuntimeError(f"The window {self.Name!r} is not a mosaic, see SetMosaic().")
+        self.Mosaic.Put(Index, Frame, self.Range)
+
+    def GetTile(self, X, Y):
+        """Find the tile of the mosaic of the window at a position in frame coordinates, see GetTile()."""
+        if self.Mosaic is None:
+            raise RuntimeError(f"The window {self.Name!r} is not a mosaic, see SetMosaic().")
+        return self.Mosaic.Locate(X, Y)
+
+    def StartServer(self, Path, Size=None, Encoding="Raw", Quality=90):
+        """Start publishing the presented frames of the window over a Unix domain socket, see StartServer()."""
+        if self.Server is not None:
+            self.StopServer()
+        self.Server = FrameServer(Path, Size, Encoding, Quality)
+
+    def StopServer(self):
+        """Stop publishing the frames of the window, see StopServer()."""
+        Server = self.Server
+        if Server is None:
+            return None
+        self.Call(setattr, self, "Server", None)
+        Server.Stop()
+        return Server.Summary()
+
+    def GetStats(self):
+        """Get the performance counters of the window, see GetStats()."""
+        if self.Stats is None:
+            return None
+        Result = self.Stats.Summary()
+        if self.Mailbox is not None:
+            Result["Skipped"] += self.Mailbox.Skipped
+        Buffers = [self.Scaler.Buffer, self.ConvertBuffer, self.Composite, self.Staging, self.BackBuffer] + self.Scaler.Pyramid
+        if self.Mosaic is not None:
+            Buffers += [self.Mosaic.Canvas] + self.Mosaic.Scratch + [Buffer for Pyramid in self.Mosaic.Pyramids for Buffer in Pyramid]
+        if self.Delta is not None:
+            Buffers.append(self.Delta.Previous)
+        Result["BufferBytes"] = sum(Buffer.nbytes for Buffer in Buffers if Buffer is not None)
+        return Result
+
+
+# MARK: SetBackend()
+def SetBackend(Backend=None):
+    """
+    Set the backend used by windows initialized without an explicit backend.
+
+    Parameters
+    ----------
+    Backend : Backend
+        The backend instance, for example HeadlessBackend(). If None, the platform default will be used.
+
+    Returns
+    -------
+    None
+    """
+    global BACKEND
     try:
-        while Message.startswith('\n'):
-            Message = Message[1:]
-        while Message.endswith('\n'):
-            Message = Message[:-1]
-        Message = f"{RED}>{NORMAL} " + Message.replace("\n", f"\n{RED}>{NORMAL} ")
-        print(f"{RED}{Type}{NORMAL}\n{Message}\n")
+        BACKEND = Backend
     except:
-        print(f"Failed to parse the following error message:\n{Type}\n{Message}\n\nTraceback:\n{str(traceback.format_exc())}")
+        ReportError("SetBackend")
+
+
+# MARK: GetBackend()
+def GetBackend():
+    """
+    Get the backend used by windows initialized without an explicit backend.
+
+    Returns
+    -------
+    Backend
+        The backend instance, created on first use if none was set.
+    """
+    global BACKEND
+    if BACKEND is None:
+        BACKEND = GetDefaultBackend()
+    return BACKEND
+
+
+
+# MARK: GetPresenter()
+def GetPresenter():
+    """
+    Get the presenter thread which owns the threaded windows, it is started on first use.
+
+    Returns
+    -------
+    Presenter
+        The presenter thread.
+    """
+    global PRESENTER
+    if PRESENTER is None or PRESENTER.is_alive() == False:
+        PRESENTER = Presenter(ErrorHandler=lambda Function, Name="": ReportError(Function, Name, Raise=False))
+        PRESENTER.start()
+    return PRESENTER
 
 
 # MARK: Initialize()
-def Initialize(Name="", Size=(None, None), Position=(None, None), TitleBarColor=(0, 0, 0), Resizable=True, TopMost=False, Foreground=True, Minimized=False, Undestroyable=False, Icon="", NoWarnings=False):
+def Initialize(Name="", Size=(None, None), Position=(None, None), TitleBarColor=(0, 0, 0), Resizable=True, TopMost=False, Foreground=True, Minimized=False, Undestroyable=False, Icon="", NoWarnings=False, Backend=None, Threaded=False, FPS=None, Pacing="Wait", DeltaMode=None, TileSize=64, Scaling="Stretch", Interpolation=None, BlitterScaling=False, Range=None, RGB=False):
     """
     Initialize a window with the specified parameters. The window will not be shown until Show() is called.
 
@@ -84,35 +694,74 @@ def Initialize(Name="", Size=(None, None), Position=(None, None), TitleBarColor=
         Path to the icon file for the window. Must be a .ico file.
     NoWarnings : bool
         If True, no warnings will be printed.
+    Backend : Backend, optional
+        The backend which creates and presents the window. If None, the backend set with SetBackend() will be used.
+    Threaded : bool
+        If True, the window is created and presented by a background presenter thread.
+        Show() then only hands the frame over and returns immediately, only the newest frame is presented.
+        The frame must not be modified after passing it to Show().
+    FPS : float, optional
+        The target frames per second of the window. If None, every frame passed to Show() is presented immediately.
+    Pacing : str
+        How the target FPS is reached, see SetPacing().
+    DeltaMode : str, optional
+        "Identity" to skip presenting a frame which is the same array object with the same Version as the last one passed to Show().
+        "Tiles" to additionally compare the frame tile by tile with the last presented one and only present the changed tiles.
+        In "Tiles" mode the identity check is only used if a Version is passed to Show(). If None, every frame is presented completely.
+    TileSize : int
+        The width and height in pixels of the tiles compared in "Tiles" mode.
+    Scaling : str
+        How frames are scaled to the client area, see SetScaling().
+    Interpolation : str, optional
+        The interpolation used for scaling, see SetScaling().
+    BlitterScaling : bool
+        If True, the backend scales the frames while presenting them instead of OpenCV, see SetScaling().
+    Range : tuple of (float, float) or str, optional
+        The values of float and integer frames which are mapped to black and white, "Auto" uses the minimum and maximum of each frame.
+        If None, (0, 1) is used for float frames and the full range of the dtype for integer frames. Not used for uint8 frames.
+    RGB : bool
+        If True, the frames passed to Show() are in RGB(A) order instead of BGR(A) order.
 
     Returns
     -------
-    bool
-        True if the window was successfully initialized, False otherwise.
+    Window or bool
+        The Window object if the window was successfully initialized, False otherwise.
     """
     try:
-        HWND = win32gui.FindWindow(None, Name)
-        if HWND != 0:
+        if Name in WINDOWS and WINDOWS[Name].Open == True:
             if NoWarnings != True:
-                print(RED + f"The window '{Name}' already exists, not creating a new window. ({Name}: {HWND})" + NORMAL)
+                LOGGER.warning("The window '%s' already exists, not creating a new window. (%s: %s)", Name, Name, WINDOWS[Name].GetHandle())
             return False
 
-        WINDOWS[Name] = {"Size": Size,
-                        "Position": Position,
-                        "TitleBarColor": TitleBarColor,
-                        "Resizable": Resizable,
-                        "TopMost": TopMost,
-                        "Foreground": Foreground,
-                        "Minimized": Minimized,
-                        "Undestroyable": Undestroyable,
-                        "Icon": Icon,
-                        "NoWarnings": NoWarnings,
-                        "Open": False,
-                        "Window": None}
-
-        return True
+        if Name in WINDOWS and WINDOWS[Name].Presenter is not None:
+            WINDOWS[Name].Presenter.Remove(WINDOWS[Name])
+
+        WINDOWS[Name] = Window(Name=Name,
+                               Size=Size,
+                               Position=Position,
+                               TitleBarColor=TitleBarColor,
+                               Resizable=Resizable,
+                               TopMost=TopMost,
+                               Foreground=Foreground,
+                               Minimized=Minimized,
+                               Undestroyable=Undestroyable,
+                               Icon=Icon,
+                               NoWarnings=NoWarnings,
+                               Backend=Backend,
+                               Threaded=Threaded,
+                               FPS=FPS,
+                               Pacing=Pacing,
+                               DeltaMode=DeltaMode,
+                               TileSize=TileSize,
+                               Scaling=Scaling,
+                               Interpolation=Interpolation,
+                               BlitterScaling=BlitterScaling,
+                               Range=Range,
+                               RGB=RGB)
+
+        return WINDOWS[Name]
     except:
-        ShowError("SimpleWindow - Error in function Initialize.", str(traceback.format_exc()))
+        ReportError("Initialize", Name)
         return False
 
 
@@ -132,57 +781,9 @@ def CreateWindow(Name=""):
     None
     """
     try:
-        Size = WINDOWS[Name]["Size"]
-        Position = WINDOWS[Name]["Position"]
-        TitleBarColor = WINDOWS[Name]["TitleBarColor"]
-        Resizable = WINDOWS[Name]["Resizable"]
-        TopMost = WINDOWS[Name]["TopMost"]
-        Foreground = WINDOWS[Name]["Foreground"]
-        Minimized = WINDOWS[Name]["Minimized"]
-        Icon = WINDOWS[Name]["Icon"]
-
-        if Size[0] == None:
-            Size = 150, Size[1]
-        if Size[1] == None:
-            Size = Size[0], 50
-
-        if Position[0] == None:
-            Position = 0, Position[1]
-        if Position[1] == None:
-            Position = Position[0], 0
-
-        WINDOWS[Name]["Size"] = Size
-        WINDOWS[Name]["Position"] = Position
-
-        Window = glfw.create_window(Size[0], Size[1], Name, None, None)
-        glfw.make_context_current(Window)
-
-        if Resizable == False:
-            glfw.set_window_attrib(Window, glfw.RESIZABLE, glfw.FALSE)
-
-        if TopMost:
-            glfw.set_window_attrib(Window, glfw.FLOATING, glfw.TRUE)
-
-        glfw.set_window_pos(Window, Position[0], Position[1])
-
-        HWND = win32gui.FindWindow(None, Name)
-        windll.dwmapi.DwmSetWindowAttribute(HWND, 35, byref(c_int((TitleBarColor[0] << 16) | (TitleBarColor[1] << 8) | TitleBarColor[2])), sizeof(c_int))
-        Icon = Icon.replace("\\", "/")
-        if os.path.exists(Icon) and Icon.endswith(".ico"):
-            IconHandle = win32gui.LoadImage(None, Icon, win32con.IMAGE_ICON, 0, 0, win32con.LR_LOADFROMFILE | win32con.LR_DEFAULTSIZE)
-            win32gui.SendMessage(HWND, win32con.WM_SETICON, win32con.ICON_SMALL, IconHandle)
-            win32gui.SendMessage(HWND, win32con.WM_SETICON, win32con.ICON_BIG, IconHandle)
-
-        WINDOWS[Name]["Open"] = True
-        WINDOWS[Name]["Window"] = Window
-
-        if Foreground:
-            SetForeground(Name=Name, State=True)
-
-        if Minimized:
-            SetMinimized(Name=Name, State=True)
+        WINDOWS[Name].CreateWindow()
     except:
-        ShowError("SimpleWindow - Error in function CreateWindow.", str(traceback.format_exc()))
+        ReportError("CreateWindow", Name)
 
 
 # MARK: Close()
@@ -200,13 +801,9 @@ def Close(Name=""):
     None
     """
     try:
-        try:
-            glfw.destroy_window(WINDOWS[Name]["Window"])
-        except:
-            pass
-        WINDOWS[Name]["Open"] = False
+        WINDOWS[Name].Close()
     except:
-        ShowError("SimpleWindow - Error in function Close.", str(traceback.format_exc()))
+        ReportError("Close", Name)
 
 
 # MARK: SetSize()
@@ -227,24 +824,9 @@ def SetSize(Name="", Size=(None, None)):
     None
     """
     try:
-        if WINDOWS[Name]["Size"] != Size and WINDOWS[Name]["Open"]:
-            if len(Size) != 2:
-                if WINDOWS[Name]["NoWarnings"] != True:
-                    print(RED + "Size must be a tuple of (int, int)." + NORMAL)
-                return
-            if (type(Size[0]) != int and type(Size[1]) != type(None)) or (type(Size[1]) != int and type(Size[0]) != type(None)):
-                if WINDOWS[Name]["NoWarnings"] != True:
-                    print(RED + "Size must be a tuple of (int, int)." + NORMAL)
-                return
-            if Size[0] == None:
-                Size = (WINDOWS[Name]["Size"][0], Size[1])
-            if Size[1] == None:
-                Size = (Size[0], WINDOWS[Name]["Size"][1])
-            Size = max(150, round(Size[0])), max(50, round(Size[1]))
-            WINDOWS[Name]["Size"] = Size
-            glfw.set_window_size(WINDOWS[Name]["Window"], Size[0], Size[1])
+        WINDOWS[Name].SetSize(Size=Size)
     except:
-        ShowError("SimpleWindow - Error in function SetSize.", str(traceback.format_exc()))
+        ReportError("SetSize", Name)
 
 
 # MARK: GetSize()
@@ -263,18 +845,9 @@ def GetSize(Name=""):
         The current width and height of the window.
     """
     try:
-        if WINDOWS[Name]["Open"]:
-            HWND = win32gui.FindWindow(None, Name)
-            if HWND == None:
-                Close(Name=Name)
-                return WINDOWS[Name]["Size"]
-            RECT = win32gui.GetClientRect(HWND)
-            TopLeft = win32gui.ClientToScreen(HWND, (RECT[0], RECT[1]))
-            BottomRight = win32gui.ClientToScreen(HWND, (RECT[2], RECT[3]))
-            return BottomRight[0] - TopLeft[0], BottomRight[1] - TopLeft[1]
-        return WINDOWS[Name]["Size"]
+        return WINDOWS[Name].GetSize()
     except:
-        ShowError("SimpleWindow - Error in function GetSize.", str(traceback.format_exc()))
+        ReportError("GetSize", Name)
 
 
 # MARK: SetPosition()
@@ -295,24 +868,9 @@ def SetPosition(Name="", Position=(None, None)):
     None
     """
     try:
-        if WINDOWS[Name]["Position"] != Position and WINDOWS[Name]["Open"]:
-            if len(Position) != 2:
-                if WINDOWS[Name]["NoWarnings"] != True:
-                    print(RED + "Position must be a tuple of (int, int)." + NORMAL)
-                return
-            if (type(Position[0]) != int and type(Position[0]) != type(None)) or (type(Position[1]) != int and type(Position[1]) != type(None)):
-                if WINDOWS[Name]["NoWarnings"] != True:
-                    print(RED + "Position must be a tuple of (int, int)." + NORMAL)
-                return
-            if Position[0] == None:
-                Position = (WINDOWS[Name]["Position"][0], Position[1])
-            if Position[1] == None:
-                Position = (Position[0], WINDOWS[Name]["Position"][1])
-            Position = round(Position[0]), round(Position[1])
-            WINDOWS[Name]["Position"] = Position
-            glfw.set_window_pos(WINDOWS[Name]["Window"], Position[0], Position[1])
+        WINDOWS[Name].SetPosition(Position=Position)
     except:
-        ShowError("SimpleWindow - Error in function SetPosition.", str(traceback.format_exc()))
+        ReportError("SetPosition", Name)
 
 
 # MARK: GetPosition()
@@ -331,18 +889,10 @@ def GetPosition(Name=""):
         The (x, y) coordinates of the window's top-left corner.
     """
     try:
-        if WINDOWS[Name]["Open"]:
-            HWND = win32gui.FindWindow(None, Name)
-            if HWND == None:
-                Close(Name=Name)
-                return WINDOWS[Name]["Position"]
-            RECT = win32gui.GetClientRect(HWND)
-            TopLeft = win32gui.ClientToScreen(HWND, (RECT[0], RECT[1]))
-            return TopLeft[0], TopLeft[1]
-        return WINDOWS[Name]["Position"]
+        return WINDOWS[Name].GetPosition()
     except:
-        ShowError("SimpleWindow - Error in function GetPosition.", str(traceback.format_exc()))
-        try: return WINDOWS[Name]["Position"]
+        ReportError("GetPosition", Name)
+        try: return WINDOWS[Name].Position
         except: return (0, 0)
 
 
@@ -363,16 +913,9 @@ def SetTitleBarColor(Name="", Color=(0, 0, 0)):
     None
     """
     try:
-        if WINDOWS[Name]["TitleBarColor"] != Color and WINDOWS[Name]["Open"]:
-            if len(Color) != 3:
-                if WINDOWS[Name]["NoWarnings"] != True:
-                    print(RED + "TitleBarColor must be a tuple of (int, int, int)." + NORMAL)
-                return
-            WINDOWS[Name]["TitleBarColor"] = Color
-            HWND = win32gui.FindWindow(None, Name)
-            windll.dwmapi.DwmSetWindowAttribute(HWND, 35, byref(c_int((max(0, min(255, round(Color[0]))) << 16) | (max(0, min(255, round(Color[1]))) << 8) | max(0, min(255, round(Color[2]))))), sizeof(c_int))
+        WINDOWS[Name].SetTitleBarColor(Color=Color)
     except:
-        ShowError("SimpleWindow - Error in function SetTitleBarColor.", str(traceback.format_exc()))
+        ReportError("SetTitleBarColor", Name)
 
 
 # MARK: GetTitleBarColor()
@@ -391,9 +934,9 @@ def GetTitleBarColor(Name=""):
         The RGB color of the title bar.
     """
     try:
-        return WINDOWS[Name]["TitleBarColor"]
+        return WINDOWS[Name].TitleBarColor
     except:
-        ShowError("SimpleWindow - Error in function GetTitleBarColor.", str(traceback.format_exc()))
+        ReportError("GetTitleBarColor", Name)
         return (0, 0, 0)
 
 
@@ -414,11 +957,9 @@ def SetResizable(Name="", State=True):
     None
     """
     try:
-        if WINDOWS[Name]["Resizable"] != State:
-            WINDOWS[Name]["Resizable"] = State == True
-            glfw.set_window_attrib(WINDOWS[Name]["Window"], glfw.RESIZABLE, glfw.TRUE if WINDOWS[Name]["Resizable"] else glfw.FALSE)
+        WINDOWS[Name].SetResizable(State=State)
     except:
-        ShowError("SimpleWindow - Error in function SetResizable.", str(traceback.format_exc()))
+        ReportError("SetResizable", Name)
 
 
 # MARK: GetResizable()
@@ -437,9 +978,9 @@ def GetResizable(Name=""):
         True if the window is resizable, False otherwise.
     """
     try:
-        return WINDOWS[Name]["Resizable"]
+        return WINDOWS[Name].Resizable
     except:
-        ShowError("SimpleWindow - Error in function GetResizable.", str(traceback.format_exc()))
+        ReportError("GetResizable", Name)
         return True
 
 
@@ -460,11 +1001,9 @@ def SetTopMost(Name="", State=True):
     None
     """
     try:
-        if WINDOWS[Name]["TopMost"] != State:
-            WINDOWS[Name]["TopMost"] = State == True
-            glfw.set_window_attrib(WINDOWS[Name]["Window"], glfw.FLOATING, glfw.TRUE if WINDOWS[Name]["TopMost"] else glfw.FALSE)
+        WINDOWS[Name].SetTopMost(State=State)
     except:
-        ShowError("SimpleWindow - Error in function SetTopMost.", str(traceback.format_exc()))
+        ReportError("SetTopMost", Name)
 
 
 # MARK: GetTopMost()
@@ -483,9 +1022,9 @@ def GetTopMost(Name=""):
         True if the window is always on top, False otherwise.
     """
     try:
-        return WINDOWS[Name]["TopMost"]
+        return WINDOWS[Name].TopMost
     except:
-        ShowError("SimpleWindow - Error in function GetTopMost.", str(traceback.format_exc()))
+        ReportError("GetTopMost", Name)
         return False
 
 
@@ -507,15 +1046,9 @@ def SetForeground(Name="", State=True):
     None
     """
     try:
-        if WINDOWS[Name]["Open"] == True:
-            WINDOWS[Name]["Foreground"] = State == True
-            HWND = win32gui.FindWindow(None, Name)
-            if State == True:
-                win32gui.SetWindowPos(HWND, win32con.HWND_TOPMOST if WINDOWS[Name]["TopMost"] == True else win32con.HWND_TOP, GetSize(Name=Name)[0], GetSize(Name=Name)[1], 0, 0, win32con.SWP_NOMOVE | win32con.SWP_NOSIZE)
-            elif State == False:
-                win32gui.SetWindowPos(HWND, win32con.HWND_BOTTOM, GetSize(Name=Name)[0], GetSize(Name=Name)[1], 0, 0, win32con.SWP_NOMOVE | win32con.SWP_NOSIZE)
+        WINDOWS[Name].SetForeground(State=State)
     except:
-        ShowError("SimpleWindow - Error in function SetForeground.", str(traceback.format_exc()))
+        ReportError("SetForeground", Name)
 
 
 # MARK: GetForeground()
@@ -534,12 +1067,9 @@ def GetForeground(Name=""):
         True if the window is in the foreground, False otherwise.
     """
     try:
-        if WINDOWS[Name]["Open"] == True:
-            HWND = win32gui.FindWindow(None, Name)
-            return HWND == win32gui.GetForegroundWindow()
-        return False
+        return WINDOWS[Name].GetForeground()
     except:
-        ShowError("SimpleWindow - Error in function GetForeground.", str(traceback.format_exc()))
+        ReportError("GetForeground", Name)
         return False
 
 
@@ -560,12 +1090,9 @@ def SetMinimized(Name="", State=False):
     None
     """
     try:
-        if WINDOWS[Name]["Open"]:
-            WINDOWS[Name]["Minimized"] = State == True
-            HWND = win32gui.FindWindow(None, Name)
-            win32gui.ShowWindow(HWND, win32con.SW_MINIMIZE if State else win32con.SW_RESTORE)
+        WINDOWS[Name].SetMinimized(State=State)
     except:
-        ShowError("SimpleWindow - Error in function SetMinimized.", str(traceback.format_exc()))
+        ReportError("SetMinimized", Name)
 
 
 # MARK: GetMinimized()
@@ -584,11 +1111,9 @@ def GetMinimized(Name=""):
         True if the window is minimized, False otherwise.
     """
     try:
-        if WINDOWS[Name]["Open"]:
-            HWND = win32gui.FindWindow(None, Name)
-            return int(win32gui.IsIconic(HWND)) == 1
+        return WINDOWS[Name].GetMinimized()
     except:
-        ShowError("SimpleWindow - Error in function GetMinimized.", str(traceback.format_exc()))
+        ReportError("GetMinimized", Name)
         return False
 
 
@@ -609,10 +1134,9 @@ def SetUndestroyable(Name="", State=True):
     None
     """
     try:
-        if WINDOWS[Name]["Undestroyable"] != State:
-            WINDOWS[Name]["Undestroyable"] = State == True
+        WINDOWS[Name].Undestroyable = State == True
     except:
-        ShowError("SimpleWindow - Error in function SetUndestroyable.", str(traceback.format_exc()))
+        ReportError("SetUndestroyable", Name)
 
 
 # MARK: GetUndestroyable()
@@ -631,9 +1155,9 @@ def GetUndestroyable(Name=""):
         True if the window is undestroyable, False otherwise.
     """
     try:
-        return WINDOWS[Name]["Undestroyable"] == True
+        return WINDOWS[Name].Undestroyable == True
     except:
-        ShowError("SimpleWindow - Error in function GetUndestroyable.", str(traceback.format_exc()))
+        ReportError("GetUndestroyable", Name)
         return False
 
 
@@ -654,27 +1178,9 @@ def SetIcon(Name="", Icon=""):
     None
     """
     try:
-        if WINDOWS[Name]["Icon"] != Icon and WINDOWS[Name]["Open"]:
-            if type(Icon) != str:
-                if WINDOWS[Name]["NoWarnings"] != True:
-                    print(RED + "Icon must be an absolute path as a string." + NORMAL)
-                return
-            if os.path.exists(Icon) == False:
-                if WINDOWS[Name]["NoWarnings"] != True:
-                    print(RED + "Icon file does not exist." + NORMAL)
-                return
-            if Icon.endswith(".ico") == False:
-                if WINDOWS[Name]["NoWarnings"] != True:
-                    print(RED + "Icon must be a .ico file." + NORMAL)
-                return
-            WINDOWS[Name]["Icon"] = Icon
-            HWND = win32gui.FindWindow(None, Name)
-            Icon = Icon.replace("\\", "/")
-            IconHandle = win32gui.LoadImage(None, Icon, win32con.IMAGE_ICON, 0, 0, win32con.LR_LOADFROMFILE | win32con.LR_DEFAULTSIZE)
-            win32gui.SendMessage(HWND, win32con.WM_SETICON, win32con.ICON_SMALL, IconHandle)
-            win32gui.SendMessage(HWND, win32con.WM_SETICON, win32con.ICON_BIG, IconHandle)
+        WINDOWS[Name].SetIcon(Icon=Icon)
     except:
-        ShowError("SimpleWindow - Error in function SetIcon.", str(traceback.format_exc()))
+        ReportError("SetIcon", Name)
 
 
 # MARK: GetIcon()
@@ -693,9 +1199,9 @@ def GetIcon(Name=""):
         The path to the icon file (must be a .ico file).
     """
     try:
-        return WINDOWS[Name]["Icon"]
+        return WINDOWS[Name].Icon
     except:
-        ShowError("SimpleWindow - Error in function GetIcon.", str(traceback.format_exc()))
+        ReportError("GetIcon", Name)
         return ""
 
 
@@ -716,12 +1222,9 @@ def SetOpen(Name="", State=True):
     None
     """
     try:
-        if State == True and WINDOWS[Name]["Open"] != True:
-            CreateWindow(Name=Name)
-        elif State == False and WINDOWS[Name]["Open"] == True:
-            Close(Name=Name)
+        WINDOWS[Name].SetOpen(State=State)
     except:
-        ShowError("SimpleWindow - Error in function SetOpen.", str(traceback.format_exc()))
+        ReportError("SetOpen", Name)
 
 
 # MARK: GetOpen()
@@ -740,10 +1243,505 @@ def GetOpen(Name=""):
         True if the window is open, False if closed by code, None if closed by the user.
     """
     try:
-        return WINDOWS[Name]["Open"]
+        return WINDOWS[Name].Open
+    except:
+        ReportError("GetOpen", Name)
+        return True
+
+
+# MARK: SetPacing()
+def SetPacing(Name="", FPS=None, Pacing="Wait"):
+    """
+    Set the target FPS and the pacing mode of the specified window.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    FPS : float, optional
+        The target frames per second. If None, every frame passed to Show() is presented immediately.
+    Pacing : str
+        "Wait" to let Show() wait for the next frame deadline, sleeping first and spinning for the last few milliseconds to hit it accurately.
+        "Drop" to let Show() return immediately and drop frames which arrive before the next deadline.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        WINDOWS[Name].SetPacing(FPS=FPS, Pacing=Pacing)
+    except:
+        ReportError("SetPacing", Name)
+
+
+# MARK: SetScaling()
+def SetScaling(Name="", Scaling="Stretch", Interpolation=None, BlitterScaling=False):
+    """
+    Set how the frames of the specified window are scaled to its client area.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    Scaling : str
+        "Stretch" to stretch the frame to the client area.
+        "Fit" to keep the aspect ratio and letterbox the frame with black borders.
+        "Fill" to keep the aspect ratio and crop the frame to fill the client area.
+        "Integer" to scale the frame by the largest integer factor which fits, or to shrink it by the smallest integer divisor, for pixel perfect output.
+        "Off" to present the frame unscaled, cropped if it is larger than the client area.
+        All modes except "Stretch" center the frame.
+    Interpolation : str, optional
+        "Nearest", "Linear" or "Area". "Area" gives the best quality for downscaling. If None, "Nearest" is used for "Integer" scaling and "Linear" otherwise.
+    BlitterScaling : bool
+        If True, frames are only cropped in Python and scaled by the backend while presenting them, by GDI StretchDIBits on Windows.
+        This avoids resizing with OpenCV, the backend only distinguishes "Nearest" from smooth interpolation.
+        The OpenGLBackend always scales on the GPU.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        WINDOWS[Name].SetScaling(Scaling=Scaling, Interpolation=Interpolation, BlitterScaling=BlitterScaling)
+    except:
+        ReportError("SetScaling", Name)
+
+
+# MARK: SetStats()
+def SetStats(Name="", State=True, Callback=None, History=1000):
+    """
+    Enable or disable the performance counters of the specified window, see GetStats(). Enabling them again resets them.
+    Windows without performance counters do not measure anything, so they cost nothing while disabled.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    State : bool
+        If True, the performance counters are enabled.
+    Callback : callable, optional
+        Called after every frame with (Name, Presented, Timings, Bytes), where Timings is a dict of {stage: nanoseconds}
+        and Bytes is the number of bytes copied for the frame. Threaded windows call it on the presenter thread.
+    History : int
+        The number of presented frames the percentiles are computed over.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        WINDOWS[Name].SetStats(State=State, Callback=Callback, History=History)
+    except:
+        ReportError("SetStats", Name)
+
+
+# MARK: GetStats()
+def GetStats(Name=""):
+    """
+    Get the performance counters of the specified window.
+    The stages are "Wait" (frame pacing), "Scale", "Convert", "Composite" (drawing the layers), "Draw" (drawing the draw list), "Delta" (tile comparison), "Present" (blit or upload), "Record" (handing the frame to the recorder),
+    "Serve" (handing the frame to the frame server), "Poll" and "Total".
+    Poll is only measured for windows shown with Show() without a presenter thread, the other paths poll once for many windows.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+
+    Returns
+    -------
+    dict or None
+        None if the counters are disabled, otherwise a dict with the keys
+        "Presented" and "Skipped" (frame counts), "BytesPerFrame" (average bytes copied per presented frame),
+        "BufferBytes" (memory held by the staging buffers of the window) and
+        "Timings", a dict of {stage: {"Mean", "P50", "P95", "P99", "Max"}} in milliseconds over the last presented frames.
+    """
+    try:
+        return WINDOWS[Name].GetStats()
+    except:
+        ReportError("GetStats", Name)
+        return None
+
+
+# MARK: SetEvents()
+def SetEvents(Name="", Capacity=1024, Coalesce=False):
+    """
+    Configure the input event queue of the specified window.
+    Queued events are kept, if there are more than the new capacity the oldest are dropped, and GetEventsAsync() calls waiting on the window keep waiting.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    Capacity : int
+        The number of events the queue holds, the oldest events are overwritten when it is full.
+    Coalesce : bool
+        If True, consecutive cursor events are merged into the newest one, so a fast mouse move only takes one record.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        WINDOWS[Name].SetEvents(Capacity=Capacity, Coalesce=Coalesce)
+    except:
+        ReportError("SetEvents", Name)
+
+
+# MARK: GetEvents()
+def GetEvents(Name="", AsList=False):
+    """
+    Get and remove all input events the specified window received since the last call.
+    Events are received while the events are polled, by Show(), ShowMany() or the presenter thread.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    AsList : bool
+        If True, the events are returned as a list of dicts with the type as a string instead of a structured array.
+
+    Returns
+    -------
+    numpy.ndarray or list of dict
+        The events, oldest first, as a structured array with the fields
+        "Time" (time.perf_counter() when received), "Type" (index into EVENT_TYPES: "Key", "Char", "MouseButton", "Cursor", "Scroll"),
+        "Action" (glfw.RELEASE, glfw.PRESS or glfw.REPEAT), "Mods" (glfw.MOD_* bits), "Key" (glfw.KEY_*, glfw.MOUSE_BUTTON_* or the code point of a Char event)
+        and "X", "Y" (the cursor position in frame coordinates under the current scaling, or the offsets of a Scroll event).
+        None if an error occurred.
+    """
+    try:
+        return WINDOWS[Name].GetEvents(AsList=AsList)
+    except:
+        ReportError("GetEvents", Name)
+        return None
+
+
+# MARK: SetLayer()
+def SetLayer(Name="", Layer="", Image=None, Position=(0, 0), Mode="Alpha", Key=(0, 0, 0), Opacity=1.0, Order=0, Version=None, Visible=True):
+    """
+    Add or replace an overlay layer of the specified window, like a HUD, grid lines or a logo, which Show() draws on top of every frame.
+    Layers are drawn after the frame was scaled and converted. Each layer is scaled to the window and converted once
+    and then only blended over its bounding box, so a static overlay costs one blend of its own area per frame instead of being redrawn.
+    Pass the same Version again to keep the cached layer, for example on every frame, without any cost.
+    If Version is None, every call counts as a change of the layer.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    Layer : str
+        The name of the layer.
+    Image : numpy.ndarray, optional
+        The overlay in the channel order of the frames of the window, BGRA or RGBA for per pixel alpha. If None, the image of the existing layer is kept.
+    Position : tuple of (int, int)
+        The position (x, y) of the top left corner of the overlay in frame coordinates.
+    Mode : str
+        "Alpha" to blend with the alpha channel of the image and Opacity, "ColorKey" to leave out the pixels of the colour Key,
+        "Opaque" to cover the frame with the image.
+    Key : tuple of int
+        The transparent colour of the "ColorKey" mode, in the channel order of the image.
+    Opacity : float
+        A factor from 0 to 1 applied to the alpha of the "Alpha" mode.
+    Order : int
+        Layers with a higher order are drawn on top of layers with a lower order, layers of the same order in the order they were added.
+    Version : hashable, optional
+        The version of the content of the layer.
+    Visible : bool
+        If False, the layer is kept but not drawn.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        WINDOWS[Name].SetLayer(Layer=Layer, Image=Image, Position=Position, Mode=Mode, Key=Key, Opacity=Opacity, Order=Order, Version=Version, Visible=Visible)
+    except:
+        ReportError("SetLayer", Name)
+
+
+# MARK: RemoveLayer()
+def RemoveLayer(Name="", Layer=None):
+    """
+    Remove an overlay layer of the specified window.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    Layer : str, optional
+        The name of the layer. If None, all layers are removed.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        WINDOWS[Name].RemoveLayer(Layer=Layer)
+    except:
+        ReportError("RemoveLayer", Name)
+
+
+# MARK: SetMosaic()
+def SetMosaic(Name="", State=True, Grid=(4, 4), TileSize=(320, 180), Gap=0, Background=(0, 0, 0), Channels=3, Scaling="Fit", Interpolation="Linear"):
+    """
+    Turn the specified window into a mosaic, a video wall which shows many streams in a grid of tiles of one preallocated canvas.
+    Fill the tiles with ShowTile() and present the canvas once per tick with Show() without a frame, or with ShowMany().
+    Only the tiles which changed since the last present are presented, if the canvas is shown unscaled and nothing changed on top of it.
+    This replaces a window per stream, with its own blit and event polling, by a single window.
+    If the size of the window was not set and it was not created yet, it gets the size of the canvas.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    State : bool
+        If False, the mosaic is removed and the window shows the frames passed to Show() again.
+    Grid : tuple of (int, int)
+        The number of tile columns and rows, tiles are numbered row by row from the top left.
+    TileSize : tuple of (int, int)
+        The size (width, height) of a tile in pixels.
+    Gap : int
+        The space between neighbouring tiles in pixels.
+    Background : tuple of int
+        The colour of the gaps, of empty tiles and of the borders around streams with another aspect ratio.
+    Channels : int
+        The channels of the canvas, 1 for grayscale, 3 for BGR or 4 for BGRA. Streams with other channels are converted.
+    Scaling : str
+        How a stream is fitted into its tile, "Stretch", "Fit", "Fill", "Integer" or "Off", see ScaleLayout().
+    Interpolation : str
+        "Nearest", "Linear" or "Area". "Area" gives the smoothest thumbnails and costs the most.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        WINDOWS[Name].SetMosaic(State=State, Grid=Grid, TileSize=TileSize, Gap=Gap, Background=Background, Channels=Channels, Scaling=Scaling, Interpolation=Interpolation)
     except:
-        ShowError("SimpleWindow - Error in function GetOpen.", str(traceback.format_exc()))
+        ReportError("SetMosaic", Name)
+
+
+# MARK: ShowTile()
+def ShowTile(Name="", Index=0, Frame=None):
+    """
+    Resize a frame of a stream straight into its tile of the canvas of the specified mosaic window, see SetMosaic().
+    The frame is not presented until the next Show(), so many tiles can be updated per present.
+    Tiles can be updated from several threads, the canvas is locked while it is presented.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    Index : int
+        The index of the tile, counted row by row from the top left.
+    Frame : numpy.ndarray, optional
+        The frame of the stream, see Show(). If None, the tile is cleared.
+
+    Returns
+    -------
+    bool
+        True if the tile was updated.
+    """
+    try:
+        WINDOWS[Name].ShowTile(Index=Index, Frame=Frame)
         return True
+    except:
+        ReportError("ShowTile", Name)
+        return False
+
+
+# MARK: GetTile()
+def GetTile(Name="", X=0.0, Y=0.0):
+    """
+    Find the tile of the specified mosaic window at a position in frame coordinates, like the X and Y of a MouseButton event.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    X : float
+        The horizontal position in the canvas.
+    Y : float
+        The vertical position in the canvas.
+
+    Returns
+    -------
+    tuple of (int, float, float) or None
+        The tile index and the position in frame coordinates of the stream shown in the tile, or in tile coordinates if the tile is empty.
+        None if the position is in a gap or outside of the canvas, or if an error occurred.
+    """
+    try:
+        return WINDOWS[Name].GetTile(X, Y)
+    except:
+        ReportError("GetTile", Name)
+        return None
+
+
+# MARK: StartRecording()
+def StartRecording(Name="", Path="", FPS=None, Codec="mp4v", Size=None, Slots=8, Block=False, Timeout=1.0):
+    """
+    Start recording the frames presented in the specified window into a video file, a running recording of the window is stopped first.
+    Each presented frame is tapped after scaling and conversion, exactly as it was shown, and copied into one of Slots shared memory slots.
+    A worker process encodes the slots with cv2.VideoWriter, so recording costs the presenting thread one copy per frame and no encoding.
+    Frames skipped by pacing or because they are unchanged are not recorded.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    Path : str
+        The path of the video file.
+    FPS : float, optional
+        The frame rate stored in the video file. If None, the target FPS of the window is used, or 30 if it is not paced.
+    Codec : str
+        The four character code of the codec, for example "mp4v" or "MJPG".
+    Size : tuple of (int, int), optional
+        The size (width, height) of the video. If None, the size of the first recorded frame is used, later frames of another size are resized.
+    Slots : int
+        The number of frames which can wait for the encoder.
+    Block : bool
+        If False, a frame is dropped when all slots are in use, so recording never delays the window.
+        If True, the window waits for a free slot, at most Timeout seconds per frame.
+    Timeout : float
+        The longest time in seconds a frame waits for a free slot if Block is True.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        WINDOWS[Name].StartRecording(Path=Path, FPS=FPS, Codec=Codec, Size=Size, Slots=Slots, Block=Block, Timeout=Timeout)
+    except:
+        ReportError("StartRecording", Name)
+
+
+# MARK: StopRecording()
+def StopRecording(Name=""):
+    """
+    Stop recording the specified window, wait until all queued frames are encoded and close the video file.
+    Closing the window stops its recording as well.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+
+    Returns
+    -------
+    dict or None
+        The final counters of the recording, see GetRecordingStats(). None if the window was not recorded or an error occurred.
+    """
+    try:
+        return WINDOWS[Name].StopRecording()
+    except:
+        ReportError("StopRecording", Name)
+        return None
+
+
+# MARK: GetRecordingStats()
+def GetRecordingStats(Name=""):
+    """
+    Get the counters of the running recording of the specified window.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+
+    Returns
+    -------
+    dict or None
+        None if the window is not recorded, otherwise a dict with the keys "Path", "Size" (of the video, None before the first frame),
+        "Frames" (frames tapped), "Queued" (frames handed to the encoder), "Dropped" (frames dropped because no slot was free),
+        "Written" (frames encoded), "Pending" (frames waiting for the encoder) and "BlockedTime" (seconds the window waited for a free slot).
+    """
+    try:
+        Recorder = WINDOWS[Name].Recorder
+        return Recorder.Summary() if Recorder is not None else None
+    except:
+        ReportError("GetRecordingStats", Name)
+        return None
+
+
+# MARK: StartServer()
+def StartServer(Name="", Path="", Size=None, Encoding="Raw", Quality=90):
+    """
+    Start publishing the frames presented in the specified window to other processes over a Unix domain socket, see FrameClient.
+    This is POSIX-only, on platforms without Unix domain sockets an error is reported.
+    Each presented frame is copied once for the server while clients are connected, downscaling and encoding run on a worker thread.
+    Clients always get the newest frame, frames are skipped for a client which is slower than the window instead of holding it back.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    Path : str
+        The path of the socket. A stale socket at this path is replaced, a socket another server still listens on is an error.
+    Size : tuple of (int, int), optional
+        The largest size (width, height) of the published frames, larger frames are downscaled keeping the aspect ratio.
+    Encoding : str
+        "Raw" to send the pixels or "JPEG" to send JPEG files.
+    Quality : int
+        The JPEG quality from 0 to 100.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        WINDOWS[Name].StartServer(Path=Path, Size=Size, Encoding=Encoding, Quality=Quality)
+    except:
+        ReportError("StartServer", Name)
+
+
+# MARK: StopServer()
+def StopServer(Name=""):
+    """
+    Stop publishing the frames of the specified window, disconnect the clients and remove the socket.
+    Closing the window stops its server as well.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+
+    Returns
+    -------
+    dict or None
+        The final counters of the server, see GetServerStats(). None if the window had no server or an error occurred.
+    """
+    try:
+        return WINDOWS[Name].StopServer()
+    except:
+        ReportError("StopServer", Name)
+        return None
+
+
+# MARK: GetServerStats()
+def GetServerStats(Name=""):
+    """
+    Get the counters of the frame server of the specified window.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+
+    Returns
+    -------
+    dict or None
+        None if the window has no server, otherwise a dict with the keys "Path", "Clients" (connected clients),
+        "Frames" (frames handed to the server), "Skipped" (frames replaced before they were encoded), "Encoded", "Sent" (messages sent to all clients),
+        "BytesSent", "SentPerSecond" and "BytesPerSecond" (throughput since the start),
+        "EncodeTime" and "Latency" (from showing a frame until it was sent to a client), each a dict of {"Mean", "P50", "P95", "Max"} in milliseconds.
+    """
+    try:
+        Server = WINDOWS[Name].Server
+        return Server.Summary() if Server is not None else None
+    except:
+        ReportError("GetServerStats", Name)
+        return None
 
 
 # MARK: GetHandle()
@@ -762,14 +1760,63 @@ def GetHandle(Name=""):
         The window's handle.
     """
     try:
-        return win32gui.FindWindow(None, Name)
+        return WINDOWS[Name].GetHandle()
     except:
-        ShowError("SimpleWindow - Error in function GetHandle.", str(traceback.format_exc()))
+        ReportError("GetHandle", Name)
         return 0
 
 
+# MARK: GetBackBuffer()
+def GetBackBuffer(Name="", Channels=3):
+    """
+    Get the persistent back buffer of the specified window, a NumPy array view of pixel memory which can be presented directly.
+    Drawing into it and calling Present() avoids all copies of the frame in Python. The window is created if it is not open yet.
+    The back buffer has the size of the client area and is reallocated if the size changed, so call this function again every frame.
+    An old back buffer stays valid memory after it was replaced or the window was closed, but it is not presented anymore.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    Channels : int
+        3 for a BGR back buffer, 4 for a BGRA back buffer.
+
+    Returns
+    -------
+    numpy.ndarray
+        The back buffer as an uint8 array of the shape (height, width, Channels), None if it could not be created.
+    """
+    try:
+        return WINDOWS[Name].GetBackBuffer(Channels=Channels)
+    except:
+        ReportError("GetBackBuffer", Name)
+        return None
+
+
+# MARK: Present()
+def Present(Name=""):
+    """
+    Present the back buffer returned by GetBackBuffer() in the specified window.
+
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+
+    Returns
+    -------
+    bool
+        True if the back buffer was presented, False otherwise.
+    """
+    try:
+        return WINDOWS[Name].PresentBackBuffer()
+    except:
+        ReportError("Present", Name)
+        return False
+
+
 # MARK: Show()
-def Show(Name="", Frame=None):
+def Show(Name="", Frame=None, Version=None, Draw=None):
     """
     Display the specified window and update its content with the given frame.
 
@@ -778,49 +1825,132 @@ def Show(Name="", Frame=None):
     Name : str
         The name of the window.
     Frame : numpy.ndarray, optional
-        The frame to be displayed in the window. If None, the window will not be updated.
+        The frame to be displayed in the window. If None, the window will not be updated, mosaic windows present their changed tiles.
+        Any object supporting the buffer protocol with a shape and format, like a memoryview, is accepted without copying it.
+        Crops of larger frames are presented without copying them if the backend allows it.
+        Grayscale (height, width) or (height, width, 1), BGR (height, width, 3) and BGRA (height, width, 4) frames are supported,
+        uint8 frames are presented as they are, other dtypes are scaled according to the Range of the window.
+    Version : int, optional
+        A version counter of the frame content, used by the DeltaMode of the window to detect unchanged frames.
+        Increase it whenever the content of a reused frame array changes.
+    Draw : DrawList, optional
+        Annotations like boxes and labels, drawn onto the frame in one pass after it was scaled to the window, so they stay sharp.
+        The frame itself is not changed. A frame with annotations is always presented, even if it is unchanged otherwise.
 
     Returns
     -------
-    None
+    bool
+        True if the frame was presented, False if it was dropped or not presented.
+        For threaded windows True means that the frame was handed to the presenter thread.
     """
     try:
-        if WINDOWS[Name]["Open"] == False:
-            CreateWindow(Name=Name)
-        elif WINDOWS[Name]["Open"] == None and WINDOWS[Name]["Undestroyable"] == False:
-            return
-        if glfw.window_should_close(WINDOWS[Name]["Window"]):
-            if WINDOWS[Name]["Open"] == True:
-                Close(Name=Name)
-            if WINDOWS[Name]["Undestroyable"] == True:
-                Initialize(Name=Name, Size=WINDOWS[Name]["Size"], Position=WINDOWS[Name]["Position"], TitleBarColor=WINDOWS[Name]["TitleBarColor"], Resizable=WINDOWS[Name]["Resizable"], TopMost=WINDOWS[Name]["TopMost"], Undestroyable=WINDOWS[Name]["Undestroyable"], Icon=WINDOWS[Name]["Icon"])
-            else:
-                WINDOWS[Name]["Open"] = None
-                return
+        return WINDOWS[Name].Show(Frame=Frame, Version=Version, Draw=Draw)
+    except:
+        ReportError("Show", Name)
+        return False
 
-        if Frame is not None:
-            HWND = win32gui.FindWindow(None, Name)
-            if HWND == 0 or HWND == None:
-                return
-            if int(win32gui.IsIconic(HWND)) == 1:
-                glfw.poll_events()
-                return
 
-            RECT = win32gui.GetClientRect(HWND)
-            TopLeft = win32gui.ClientToScreen(HWND, (RECT[0], RECT[1]))
-            BottomRight = win32gui.ClientToScreen(HWND, (RECT[2], RECT[3]))
-            SIZE = BottomRight[0] - TopLeft[0], BottomRight[1] - TopLeft[1]
+# MARK: ShowFromChannel()
+def ShowFromChannel(Name="", Channel=None, Timeout=0.1):
+    """
+    Display the specified window and update its content with the newest frame of a FrameChannel filled by another process.
+    The frame is read in place from the shared memory, so neither pickling nor a copy is needed to get it into the window.
+    Frames which were replaced by a newer frame before this call are skipped, the frame number is passed to Show() as Version.
+    Threaded windows present the frame on the presenter thread before this call returns, as the slot is only claimed until then.
+    If the producer overwrote the frame while it was presented, the newest frame is claimed and presented again right away.
 
-            HDC = win32gui.GetDC(HWND)
+    Parameters
+    ----------
+    Name : str
+        The name of the window.
+    Channel : FrameChannel
+        The channel, created by the producer or attached with FrameChannel(Name=...).
+    Timeout : float, optional
+        The longest time in seconds to wait for a frame newer than the last one shown. If None, the wait does not time out.
+
+    Returns
+    -------
+    bool
+        True if a new frame was presented.
+        False if no new frame arrived before the timeout, the producer closed the channel, the frame was skipped, it was overwritten
+        again while presented, then the next call retries, or an error occurred.
+    """
+    try:
+        return WINDOWS[Name].ShowFromChannel(Channel, Timeout)
+    except:
+        ReportError("ShowFromChannel", Name)
+        return False
+
+
+# MARK: ShowMany()
+def ShowMany(Frames=None):
+    """
+    Display multiple windows and update their content in one pass.
+    The events are polled only once per backend instead of once per window.
+    An error in one window does not prevent the other windows from being updated.
+    Paced windows never block the pass, their frames are dropped until their next deadline.
+
+    Parameters
+    ----------
+    Frames : dict of {str: numpy.ndarray}
+        The frames to display, keyed by window name. A frame may be None to only keep the window alive.
 
-            Frame = numpy.flip(Frame, axis=0)
-            Frame = cv2.resize(Frame, GetSize(Name=Name))
-            Frame = numpy.ascontiguousarray(Frame)
+    Returns
+    -------
+    None
+    """
+    try:
+        Backends = []
+        for Name, Frame in (Frames or {}).items():
+            try:
+                Window = WINDOWS[Name]
+                if Frame is None and Window.Mosaic is not None:
+                    Frame = Window.Mosaic.Canvas
+                if Window.Presenter is not None:
+                    Window.Show(Frame=Frame)
+                    continue
+                if Window.Pacer is not None and Frame is not None and Window.Pacer.Ready() == False:
+                    if Window.Stats is not None:
+                        Window.Stats.Skip()
+                    continue
+                if Window.Stats is not None and Frame is not None:
+                    Window.Stats.Start()
+                    Window.Stats.End(Window.Update(Frame=Frame))
+                else:
+                    Window.Update(Frame=Frame)
+                if Window.Backend not in Backends:
+                    Backends.append(Window.Backend)
+            except:
+                ReportError("ShowMany", Name)
+        for Backend in Backends:
+            Backend.Poll()
+    except:
+        ReportError("ShowMany")
 
-            windll.gdi32.StretchDIBits(HDC, 0, 0, SIZE[0], SIZE[1], 0, 0, SIZE[0], SIZE[1], ctypes.c_void_p(Frame.ctypes.data), ctypes.byref(BITMAPINFO(Frame.shape[1], Frame.shape[0])), win32con.DIB_RGB_COLORS, win32con.SRCCOPY)
 
-            win32gui.ReleaseDC(HWND, HDC)
+# MARK: Shutdown()
+def Shutdown():
+    """
+    Close all windows, stop the presenter thread and terminate GLFW.
+    All windows are forgotten, GLFW is initialized again by the next window which needs it.
 
-        glfw.poll_events()
+    Returns
+    -------
+    None
+    """
+    global PRESENTER
+    try:
+        for Name, Window in list(WINDOWS.items()):
+            try:
+                if Window.Open == True:
+                    Window.Close()
+            except:
+                ReportError("Shutdown", Name)
+        WINDOWS.clear()
+        if PRESENTER is not None:
+            PRESENTER.Stop()
+            PRESENTER.join()
+            PRESENTER = None
+        TerminateGLFW()
     except:
-        ShowError("SimpleWindow - Error in function Show.", str(traceback.format_exc()))
\ No newline at end of file
+        ReportError("Shutdown")
@@ -0,0 +1,102 @@
+import time
+import numpy
+
+
+STAGES = ("Wait", "Scale", "Convert", "Composite", "Draw", "Delta", "Present", "Record", "Serve", "Poll", "Total")
+
+
+# MARK: Stats
+class Stats:
+    """
+    Collects the performance counters of a window.
+
+    Each frame passed to Show() is timed stage by stage with time.perf_counter_ns(), the stages are:
+    "Wait" for frame pacing, "Scale" for cropping and scaling, "Convert" for the dtype and channel conversion,
+    "Composite" for drawing the layers, "Draw" for drawing the draw list, "Delta" for the tile comparison, "Present" for the backend blit or upload, "Record" for handing the frame to the recorder,
+    "Serve" for handing the frame to the frame server, "Poll" for the event polling and "Total" for the whole call.
+    The timings of the last History presented frames are kept in a ring buffer for the percentiles.
+    Windows without Stats do not call any of these methods, so disabled stats cost nothing.
+
+    Parameters
+    ----------
+    History : int
+        The number of presented frames kept for the percentiles.
+    Callback : callable, optional
+        Called after every frame with (Name, Presented, Timings, Bytes), where Timings is a dict of {stage: nanoseconds}
+        and Bytes is the number of bytes copied for the frame. It is called on the thread which presented the frame.
+    """
+    __slots__ = ("Name", "Callback", "Timings", "Index", "Count", "Current", "Begin", "Last", "Bytes", "FrameBytes", "Presented", "Skipped")
+
+    def __init__(self, Name="", History=1000, Callback=None):
+        self.Name = Name
+        self.Callback = Callback
+        self.Timings = numpy.zeros((History, len(STAGES)), numpy.int64)
+        self.Index = 0
+        self.Count = 0
+        self.Current = [0] * len(STAGES)
+        self.Begin = 0
+        self.Last = 0
+        self.Bytes = 0
+        self.FrameBytes = 0
+        self.Presented = 0
+        self.Skipped = 0
+
+    def Start(self):
+        """Start timing a new frame."""
+        self.Begin = self.Last = time.perf_counter_ns()
+        self.Current = [0] * len(STAGES)
+        self.FrameBytes = 0
+
+    def Lap(self, Stage):
+        """Add the time since the last lap or the start of the frame to a stage."""
+        Now = time.perf_counter_ns()
+        self.Current[STAGES.index(Stage)] += Now - self.Last
+        self.Last = Now
+
+    def Copied(self, Bytes):
+        """Count bytes copied for the current frame."""
+        self.FrameBytes += Bytes
+
+    def End(self, Presented):
+        """Finish the current frame, only presented frames are added to the percentiles."""
+        self.Current[-1] = time.perf_counter_ns() - self.Begin
+        if Presented:
+            self.Timings[self.Index] = self.Current
+            self.Index = (self.Index + 1) % len(self.Timings)
+            self.Count += 1
+            self.Presented += 1
+            self.Bytes += self.FrameBytes
+        else:
+            self.Skipped += 1
+        if self.Callback is not None:
+            self.Callback(self.Name, Presented, dict(zip(STAGES, self.Current)), self.FrameBytes)
+
+    def Skip(self):
+        """Count a frame which was dropped before any stage ran."""
+        self.Skipped += 1
+        if self.Callback is not None:
+            self.Callback(self.Name, False, dict.fromkeys(STAGES, 0), 0)
+
+    def Summary(self):
+        """
+        Summarize the collected counters, see GetStats().
+
+        Returns
+        -------
+        dict
+            The counters and the timing percentiles in milliseconds.
+        """
+        Timings = self.Timings[:min(self.Count, len(self.Timings))] / 1e6
+        Result = {
+            "Presented": self.Presented,
+            "Skipped": self.Skipped,
+            "BytesPerFrame": self.Bytes / self.Presented if self.Presented else 0.0,
+            "Timings": {}
+        }
+        for Index, Stage in enumerate(STAGES):
+            if len(Timings) == 0:
+                Result["Timings"][Stage] = dict.fromkeys(("Mean", "P50", "P95", "P99", "Max"), 0.0)
+                continue
+            P50, P95, P99 = numpy.percentile(Timings[:, Index], (50, 95, 99))
+            Result["Timings"][Stage] = {"Mean": float(Timings[:, Index].mean()), "P50": float(P50), "P95": float(P95), "P99": float(P99), "Max": float(Timings[:, Index].max())}
+        return Result
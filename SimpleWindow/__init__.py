@@ -1,3 +1,4 @@
+from .SimpleWindow import Window
 from .SimpleWindow import Initialize
 from .SimpleWindow import Close
 from .SimpleWindow import SetSize
@@ -20,5 +21,47 @@ from .SimpleWindow import SetIcon
 from .SimpleWindow import GetIcon
 from .SimpleWindow import SetOpen
 from .SimpleWindow import GetOpen
+from .SimpleWindow import SetPacing
+from .SimpleWindow import SetScaling
+from .SimpleWindow import SetStats
+from .SimpleWindow import GetStats
+from .SimpleWindow import SetEvents
+from .SimpleWindow import GetEvents
+from .SimpleWindow import SetLayer
+from .SimpleWindow import RemoveLayer
+from .SimpleWindow import SetMosaic
+from .SimpleWindow import ShowTile
+from .SimpleWindow import GetTile
+from .SimpleWindow import StartRecording
+from .SimpleWindow import StopRecording
+from .SimpleWindow import GetRecordingStats
+from .SimpleWindow import StartServer
+from .SimpleWindow import StopServer
+from .SimpleWindow import GetServerStats
 from .SimpleWindow import GetHandle
-from .SimpleWindow import Show
\ No newline at end of file
+from .SimpleWindow import GetBackBuffer
+from .SimpleWindow import Present
+from .SimpleWindow import Show
+from .SimpleWindow import ShowMany
+from .SimpleWindow import ShowFromChannel
+from .SimpleWindow import Shutdown
+from .Async import ShowAsync
+from .Async import GetEventsAsync
+from .Async import PumpEvents
+from .Async import ShowFromQueue
+from .Channel import FrameChannel
+from .Server import FrameClient
+from .Drawing import DrawList
+from .Frame import PrepareFrame
+from .Frame import ConvertFrame
+from .Scaling import ScaleLayout
+from .Events import EVENT_TYPES
+from .Events import EVENT_DTYPE
+from .Errors import SetErrorReporting
+from .Errors import GetLastError
+from .SimpleWindow import SetBackend
+from .SimpleWindow import GetBackend
+from .Backends import Backend
+from .Backends import Win32Backend
+from .Backends import OpenGLBackend
+from .Backends import HeadlessBackend
\ No newline at end of file
@@ -0,0 +1,206 @@
+"""
+Benchmarks of the Show() pipeline of SimpleWindow.
+
+The benchmarks run against the HeadlessBackend, so they work on every platform without a display.
+They cover the frame preparation stages on their own and Show() / ShowMany() end to end,
+with synthetic frames from 320x240 to 8K, uint8, float32, grayscale and BGRA inputs,
+window sizes matching or differing from the frame size and 1 to 32 windows.
+
+Usage:
+    python benchmarks/Benchmark.py --output results.json
+    python benchmarks/Benchmark.py --compare results.json --output new.json
+    python benchmarks/Benchmark.py --quick --filter Show
+"""
+
+import argparse
+import platform
+import json
+import time
+import sys
+import os
+
+import numpy
+import cv2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import SimpleWindow
+
+
+RESOLUTIONS = {"320x240": (320, 240), "640x480": (640, 480), "1280x720": (1280, 720), "1920x1080": (1920, 1080), "3840x2160": (3840, 2160), "7680x4320": (7680, 4320)}
+FORMATS = ("uint8", "float32", "gray", "bgra")
+WINDOW_COUNTS = (1, 4, 16, 32)
+
+
+# MARK: MakeFrame()
+def MakeFrame(Size, Format, Seed=0):
+    """
+    Create a synthetic frame.
+
+    Parameters
+    ----------
+    Size : tuple of (int, int)
+        The size (width, height) of the frame.
+    Format : str
+        "uint8" for BGR, "float32" for BGR in 0 - 1, "gray" for uint8 grayscale and "bgra" for uint8 BGRA.
+
+    Returns
+    -------
+    numpy.ndarray
+        The frame.
+    """
+    Width, Height = Size
+    Random = numpy.random.default_rng(Seed)
+    if Format == "float32":
+        return Random.random((Height, Width, 3), numpy.float32)
+    Channels = {"uint8": (3,), "gray": (), "bgra": (4,)}[Format]
+    return Random.integers(0, 256, (Height, Width) + Channels, numpy.uint8)
+
+
+# MARK: Measure()
+def Measure(Function, MinTime=0.2, MinIterations=3, MaxIterations=1000):
+    """
+    Run a function repeatedly and time every call with time.perf_counter_ns().
+    The function runs until MinTime seconds passed and at least MinIterations calls were made, after one warm up call.
+
+    Returns
+    -------
+    dict
+        The number of iterations and the mean, minimum, median and 95th percentile in milliseconds.
+    """
+    Function()
+    Timings = []
+    Start = time.perf_counter()
+    while len(Timings) < MaxIterations and (len(Timings) < MinIterations or time.perf_counter() - Start < MinTime):
+        Begin = time.perf_counter_ns()
+        Function()
+        Timings.append(time.perf_counter_ns() - Begin)
+    Timings = numpy.array(Timings) / 1e6
+    return {"Iterations": len(Timings), "Mean": float(Timings.mean()), "Min": float(Timings.min()), "P50": float(numpy.percentile(Timings, 50)), "P95": float(numpy.percentile(Timings, 95))}
+
+
+# MARK: Cases()
+def Cases(Quick=False):
+    """
+    Yield the benchmark cases as (name, setup), where setup returns the function to time.
+    Frames and windows are only created when a case is set up, so filtered cases cost nothing.
+    """
+    Resolutions = {Name: Size for Name, Size in RESOLUTIONS.items() if Quick == False or Size[0] <= 1920}
+
+    for Resolution, Size in Resolutions.items():
+        for Format in FORMATS:
+            def Prepare(Size=Size, Format=Format):
+                Frame = MakeFrame(Size, Format)
+                Target = (Size[0] // 2, Size[1] // 2)
+                Buffer = [None]
+                def Run():
+                    Buffer[0] = SimpleWindow.PrepareFrame(Frame, Target, Buffer[0])
+                return Run
+            yield f"PrepareFrame/{Resolution}/{Format}/half", Prepare
+
+            def Convert(Size=Size, Format=Format):
+                Frame = MakeFrame(Size, Format)
+                Buffer = [None]
+                def Run():
+                    Buffer[0] = SimpleWindow.ConvertFrame(Frame, Buffer=Buffer[0])
+                return Run
+            yield f"ConvertFrame/{Resolution}/{Format}", Convert
+
+            for Match in ("match", "half"):
+                def Show(Size=Size, Format=Format, Match=Match, Name=f"{Resolution}/{Format}/{Match}"):
+                    Frame = MakeFrame(Size, Format)
+                    SimpleWindow.Initialize(Name=Name, Size=Size if Match == "match" else (Size[0] // 2, Size[1] // 2))
+                    return lambda: SimpleWindow.Show(Name=Name, Frame=Frame)
+                yield f"Show/{Resolution}/{Format}/{Match}", Show
+
+    for Count in WINDOW_COUNTS:
+        def ShowMany(Count=Count):
+            Frames = {}
+            for Index in range(Count):
+                Name = f"Many{Count}/{Index}"
+                SimpleWindow.Initialize(Name=Name, Size=(640, 480))
+                Frames[Name] = MakeFrame((640, 480), "uint8", Index)
+            return lambda: SimpleWindow.ShowMany(Frames)
+        yield f"ShowMany/640x480/uint8/{Count}", ShowMany
+
+        def ShowEach(Count=Count):
+            Frames = {}
+            for Index in range(Count):
+                Name = f"Each{Count}/{Index}"
+                SimpleWindow.Initialize(Name=Name, Size=(640, 480))
+                Frames[Name] = MakeFrame((640, 480), "uint8", Index)
+            def Run():
+                for Name, Frame in Frames.items():
+                    SimpleWindow.Show(Name=Name, Frame=Frame)
+            return Run
+        yield f"ShowEach/640x480/uint8/{Count}", ShowEach
+
+
+# MARK: Compare()
+def Compare(Results, Baseline, Threshold):
+    """
+    Print the change of every case against a baseline and return the names of the cases which got slower than Threshold.
+    The medians are compared, as they are less sensitive to outliers than the means.
+    """
+    Regressions = []
+    for Name, Result in Results.items():
+        if Name not in Baseline:
+            continue
+        Ratio = Result["P50"] / Baseline[Name]["P50"] if Baseline[Name]["P50"] > 0 else 1.0
+        Flag = ""
+        if Ratio > Threshold:
+            Regressions.append(Name)
+            Flag = "  REGRESSION"
+        print(f"{Name:<45} {Baseline[Name]['P50']:10.3f} ms -> {Result['P50']:10.3f} ms  x{Ratio:5.2f}{Flag}")
+    return Regressions
+
+
+# MARK: Main()
+def Main():
+    Parser = argparse.ArgumentParser(description="Benchmark the Show() pipeline of SimpleWindow on the headless backend.")
+    Parser.add_argument("--output", help="Write the results to this JSON file.")
+    Parser.add_argument("--compare", help="Compare the results with this JSON file from an earlier run.")
+    Parser.add_argument("--threshold", type=float, default=1.2, help="Slowdown factor of the median counted as a regression, default 1.2.")
+    Parser.add_argument("--filter", default="", help="Only run the cases whose name contains this text.")
+    Parser.add_argument("--quick", action="store_true", help="Skip the resolutions above 1920x1080.")
+    Parser.add_argument("--min-time", type=float, default=0.2, help="Minimum time in seconds each case runs, default 0.2.")
+    Arguments = Parser.parse_args()
+
+    # NullPresent leaves out the copy into the headless surface, which no real backend makes.
+    SimpleWindow.SetBackend(SimpleWindow.HeadlessBackend(NullPresent=True))
+
+    Results = {}
+    for Name, Setup in Cases(Arguments.quick):
+        if Arguments.filter not in Name:
+            continue
+        Results[Name] = Measure(Setup(), Arguments.min_time)
+        print(f"{Name:<45} {Results[Name]['P50']:10.3f} ms  (p95 {Results[Name]['P95']:.3f} ms, {Results[Name]['Iterations']} runs)", flush=True)
+
+    Report = {
+        "Environment": {
+            "Python": platform.python_version(),
+            "Platform": platform.platform(),
+            "Processor": platform.processor(),
+            "NumPy": numpy.__version__,
+            "OpenCV": cv2.__version__,
+            "OpenCVThreads": cv2.getNumThreads()
+        },
+        "Time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "Results": Results
+    }
+    if Arguments.output:
+        with open(Arguments.output, "w") as File:
+            json.dump(Report, File, indent=4)
+
+    if Arguments.compare:
+        with open(Arguments.compare) as File:
+            Baseline = json.load(File)
+        print(f"\nCompared with {Arguments.compare} (OpenCV {Baseline['Environment']['OpenCV']}, NumPy {Baseline['Environment']['NumPy']}):")
+        Regressions = Compare(Results, Baseline["Results"], Arguments.threshold)
+        if Regressions:
+            print(f"\n{len(Regressions)} regression(s).")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -0,0 +1,95 @@
+"""
+Import time benchmark of SimpleWindow.
+
+Every run imports the package in a fresh interpreter and measures the import with time.perf_counter().
+The script fails if the import loads one of the heavy modules which must only be loaded on first use,
+or if the median import time exceeds the budget or got slower than an earlier run.
+
+Usage:
+    python benchmarks/ImportTime.py
+    python benchmarks/ImportTime.py --output import.json
+    python benchmarks/ImportTime.py --compare import.json
+"""
+
+import subprocess
+import argparse
+import json
+import sys
+import os
+
+import numpy
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFERRED_MODULES = ("cv2", "glfw", "win32gui", "win32con", "OpenGL", "concurrent.futures", "asyncio", "socket", "multiprocessing")
+
+# numpy is imported before the timer starts, every user of the package imports it anyway.
+CHILD = f"""
+import json, sys, time
+sys.path.insert(0, {ROOT!r})
+import numpy
+Start = time.perf_counter()
+import SimpleWindow
+Elapsed = time.perf_counter() - Start
+print(json.dumps({{"Time": Elapsed * 1000, "Loaded": [Name for Name in {DEFERRED_MODULES!r} if Name in sys.modules]}}))
+"""
+
+
+# MARK: MeasureImport()
+def MeasureImport(Runs=20):
+    """
+    Import the package in Runs fresh interpreters.
+
+    Returns
+    -------
+    tuple of (dict, list of str)
+        The mean, minimum, median and 95th percentile of the import time in milliseconds and the deferred modules loaded by the import.
+    """
+    Timings = []
+    Loaded = set()
+    for _ in range(Runs):
+        Output = subprocess.run([sys.executable, "-c", CHILD], capture_output=True, text=True, check=True).stdout
+        Result = json.loads(Output.strip().splitlines()[-1])
+        Timings.append(Result["Time"])
+        Loaded.update(Result["Loaded"])
+    Timings = numpy.array(Timings)
+    return {"Runs": Runs, "Mean": float(Timings.mean()), "Min": float(Timings.min()), "P50": float(numpy.percentile(Timings, 50)), "P95": float(numpy.percentile(Timings, 95))}, sorted(Loaded)
+
+
+# MARK: Main()
+def Main():
+    Parser = argparse.ArgumentParser(description="Benchmark the import time of SimpleWindow.")
+    Parser.add_argument("--runs", type=int, default=20, help="Number of fresh interpreters, default 20.")
+    Parser.add_argument("--budget", type=float, default=50.0, help="Maximum median import time in milliseconds, default 50.")
+    Parser.add_argument("--output", help="Write the result to this JSON file.")
+    Parser.add_argument("--compare", help="Compare the result with this JSON file from an earlier run.")
+    Parser.add_argument("--threshold", type=float, default=1.2, help="Slowdown factor of the median counted as a regression, default 1.2.")
+    Arguments = Parser.parse_args()
+
+    Result, Loaded = MeasureImport(Arguments.runs)
+    print(f"import SimpleWindow: {Result['P50']:.2f} ms median, {Result['Min']:.2f} ms min, {Result['P95']:.2f} ms p95 ({Result['Runs']} runs)")
+
+    if Arguments.output:
+        with open(Arguments.output, "w") as File:
+            json.dump({"Python": sys.version.split()[0], "Result": Result}, File, indent=4)
+
+    Failed = False
+    if Loaded:
+        print(f"FAIL: the import loaded {', '.join(Loaded)}, which must only be loaded on first use.")
+        Failed = True
+    if Result["P50"] > Arguments.budget:
+        print(f"FAIL: the median import time exceeds the budget of {Arguments.budget:.2f} ms.")
+        Failed = True
+    if Arguments.compare:
+        with open(Arguments.compare) as File:
+            Baseline = json.load(File)["Result"]
+        Ratio = Result["P50"] / Baseline["P50"] if Baseline["P50"] > 0 else 1.0
+        print(f"Compared with {Arguments.compare}: {Baseline['P50']:.2f} ms -> {Result['P50']:.2f} ms  x{Ratio:.2f}")
+        if Ratio > Arguments.threshold:
+            print("FAIL: the import got slower.")
+            Failed = True
+    return 1 if Failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -13,6 +13,9 @@ setup(
         "glfw",
         "opencv-python",
         "numpy",
-        "pywin32",
+        "pywin32; sys_platform == 'win32'",
     ],
+    extras_require={
+        "opengl": ["PyOpenGL"],
+    },
 )
\ No newline at end of file
@@ -0,0 +1,95 @@
+import multiprocessing
+import numpy
+
+from SimpleWindow import FrameChannel
+from SimpleWindow.Channel import FIELD_READING, FIELD_SEQUENCES
+
+
+SHAPE = (48, 64, 3)
+SLOTS = 3
+FRAMES = 200
+
+
+def Producer(Names, Claimed, Overwritten, Done):
+    """Create a channel, publish FRAMES frames filled with their sequence number and overwrite the slot claimed by the consumer once."""
+    Channel = FrameChannel(SHAPE, Slots=SLOTS)
+    Names.put(Channel.Name)
+    for Sequence in range(1, FRAMES + 1):
+        Channel.Acquire()[...] = Sequence % 256
+        assert Channel.Publish() == Sequence
+    # Writing the claimed slot is what happens if Acquire() picked it before the claim of the consumer was visible.
+    Claimed.wait(10)
+    Slot = int(Channel.Header[FIELD_READING])
+    Channel.Header[FIELD_SEQUENCES + Slot] = 2 * (FRAMES + 1) + 1
+    Channel.Writing = Slot
+    Channel.Frames[Slot][...] = 255
+    Channel.Publish()
+    Overwritten.set()
+    Done.wait(10)
+    Channel.Close()
+
+
+def test_spawned_producer():
+    Context = multiprocessing.get_context("spawn")
+    Names, Claimed, Overwritten, Done = Context.Queue(), Context.Event(), Context.Event(), Context.Event()
+    Process = Context.Process(target=Producer, args=(Names, Claimed, Overwritten, Done), daemon=True)
+    Process.start()
+    try:
+        Channel = FrameChannel(Name=Names.get(timeout=30))
+        assert Channel.Shape == SHAPE and Channel.Slots == SLOTS
+
+        # Every intact frame holds its own sequence number and the sequence numbers only grow while the ring wraps around.
+        Last = 0
+        while Last < FRAMES:
+            assert Channel.Wait(Last, Timeout=10)
+            Sequence, Frame = Channel.Claim()
+            assert Sequence > Last
+            Copy = Frame.copy()
+            if Channel.Release():
+                assert (Copy == Sequence % 256).all()
+            Last = Sequence
+        assert Last == FRAMES
+        assert Channel.GetSequence() == FRAMES
+
+        Sequence, Frame = Channel.Claim()
+        assert Sequence == FRAMES
+        Claimed.set()
+        assert Overwritten.wait(10)
+        assert Channel.Release() == False
+        assert Channel.Torn >= 1
+        assert Channel.Wait(FRAMES, Timeout=0)
+
+        Sequence, Frame = Channel.Claim()
+        assert Sequence == FRAMES + 1 and (Frame == 255).all()
+        assert Channel.Release()
+        assert Channel.GetClosed() == False
+
+        Done.set()
+        Process.join(10)
+        assert Process.exitcode == 0
+        assert Channel.GetClosed()
+        assert Channel.Wait(FRAMES + 1, Timeout=1) == False
+        Channel.Close()
+    finally:
+        Done.set()
+        Process.join(10)
+        if Process.is_alive():
+            Process.kill()
+
+
+def test_ring_skips_claimed_and_newest_slot():
+    Channel = FrameChannel(SHAPE, Slots=SLOTS)
+    try:
+        assert Channel.Claim() == (0, None)
+        Channel.Write(numpy.full(SHAPE, 1, numpy.uint8))
+        Sequence, Frame = Channel.Claim()
+        assert Sequence == 1
+        for Value in range(2, 20):
+            Channel.Write(numpy.full(SHAPE, Value, numpy.uint8))
+            assert (Frame == 1).all()
+        assert Channel.Release()
+        Sequence, Frame = Channel.Claim()
+        assert Sequence == 19 and (Frame == 19).all()
+        assert Channel.Release() and Channel.Torn == 0
+    finally:
+        Channel.Close()
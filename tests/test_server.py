@@ -0,0 +1,88 @@
+import os
+import time
+import numpy
+import pytest
+
+import SimpleWindow
+from SimpleWindow.SimpleWindow import WINDOWS
+
+
+SIZE = (64, 48)
+
+
+def WaitFor(Condition, Timeout=5.0):
+    Deadline = time.perf_counter() + Timeout
+    while Condition() == False:
+        assert time.perf_counter() < Deadline
+        time.sleep(0.001)
+
+
+def Frame(Value):
+    return numpy.full((SIZE[1], SIZE[0], 3), Value, numpy.uint8)
+
+
+def Connect(Name, Path):
+    Clients = len(WINDOWS[Name].Server.Clients)
+    Client = SimpleWindow.FrameClient(Path, Timeout=5)
+    WaitFor(lambda: len(WINDOWS[Name].Server.Clients) > Clients)
+    return Client
+
+
+@pytest.fixture
+def Window(tmp_path):
+    SimpleWindow.SetBackend(SimpleWindow.HeadlessBackend())
+    Name = "Server"
+    SimpleWindow.Initialize(Name, Size=SIZE)
+    yield Name, str(tmp_path / "frames.sock")
+    SimpleWindow.StopServer(Name)
+    SimpleWindow.Close(Name)
+
+
+@pytest.mark.parametrize("Encoding", ["Raw", "JPEG"])
+def test_client_receives_frames(Window, Encoding):
+    Name, Path = Window
+    SimpleWindow.StartServer(Name, Path=Path, Encoding=Encoding, Quality=100)
+    assert WINDOWS[Name].Server is not None
+    Client = Connect(Name, Path)
+    SimpleWindow.Show(Name, Frame(100))
+    Received = Client.Receive()
+    assert isinstance(Received, numpy.ndarray)
+    assert Received.shape == (SIZE[1], SIZE[0], 3) and Received.dtype == numpy.uint8
+    assert numpy.abs(Received.astype(int) - 100).max() <= 2
+    assert Client.Sequence == 1
+    Client.Close()
+
+
+def test_slow_client_gets_newest_frame(Window):
+    Name, Path = Window
+    SimpleWindow.StartServer(Name, Path=Path)
+    Server = WINDOWS[Name].Server
+    Client = Connect(Name, Path)
+    SimpleWindow.Show(Name, Frame(1))
+    assert Client.Receive()[0, 0, 0] == 1
+
+    # The client requests nothing while the window shows more frames, then it only gets the newest one.
+    for Value in range(2, 30):
+        SimpleWindow.Show(Name, Frame(Value))
+    WaitFor(lambda: Server.Encoded + Server.Skipped == Server.Frames)
+    assert Client.Receive()[0, 0, 0] == 29
+    assert Client.Sequence == Server.Sequence
+    assert Client.Skipped == Server.Sequence - 2
+
+    # A client connecting while the window shows no new frame gets the current one right away.
+    Late = Connect(Name, Path)
+    assert Late.Receive()[0, 0, 0] == 29
+    assert Late.Sequence == Server.Sequence
+    Late.Close()
+    Client.Close()
+
+
+def test_stop_removes_socket(Window):
+    Name, Path = Window
+    SimpleWindow.StartServer(Name, Path=Path)
+    assert os.path.exists(Path)
+    Client = Connect(Name, Path)
+    assert SimpleWindow.StopServer(Name) is not None
+    assert os.path.exists(Path) == False
+    assert Client.Receive() is None
+    Client.Close()